@@ -0,0 +1,35 @@
+"""add document embedding model
+
+Revision ID: 4a7d2e9c1b60
+Revises: f1c6d8a3b5e2
+Create Date: 2026-10-17 09:12:37.518204
+
+"""
+
+from collections.abc import Sequence
+from typing import Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "4a7d2e9c1b60"
+down_revision: Union[str, Sequence[str], None] = "f1c6d8a3b5e2"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column("document", sa.Column("embedding_model", sa.Text(), nullable=True))
+    # Every document vectorized so far used the default model
+    op.execute(
+        "UPDATE document SET embedding_model = 'FlukeTJ/bge-m3-m2v-distilled-256' "
+        "WHERE is_vectorized"
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column("document", "embedding_model")
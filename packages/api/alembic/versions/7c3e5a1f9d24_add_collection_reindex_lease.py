@@ -0,0 +1,37 @@
+"""add collection reindex lease
+
+Revision ID: 7c3e5a1f9d24
+Revises: 4a7d2e9c1b60
+Create Date: 2026-10-17 11:03:52.271690
+
+"""
+
+from collections.abc import Sequence
+from typing import Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "7c3e5a1f9d24"
+down_revision: Union[str, Sequence[str], None] = "4a7d2e9c1b60"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column(
+        "collection_reindex", sa.Column("lease_owner", sa.Text(), nullable=True)
+    )
+    op.add_column(
+        "collection_reindex",
+        sa.Column("lease_expires_at", sa.TIMESTAMP(), nullable=True),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column("collection_reindex", "lease_expires_at")
+    op.drop_column("collection_reindex", "lease_owner")
@@ -0,0 +1,36 @@
+"""add chunk content hash
+
+Revision ID: c71e0a5f4b93
+Revises: b3f18c9d2e46
+Create Date: 2026-10-17 13:27:44.902615
+
+"""
+
+from collections.abc import Sequence
+from typing import Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "c71e0a5f4b93"
+down_revision: Union[str, Sequence[str], None] = "b3f18c9d2e46"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column("chunk", sa.Column("content_hash", sa.Text(), nullable=True))
+    # Backfill so existing documents can be re-ingested incrementally
+    op.execute(
+        "UPDATE chunk SET content_hash = "
+        "encode(sha256(convert_to(chunk_text, 'UTF8')), 'hex') "
+        "WHERE chunk_text IS NOT NULL"
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column("chunk", "content_hash")
@@ -0,0 +1,55 @@
+"""add ingestion checkpoints
+
+Revision ID: e8b2f4a61d37
+Revises: d5a93e27c1f8
+Create Date: 2026-10-17 15:02:31.664720
+
+"""
+
+from collections.abc import Sequence
+from typing import Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "e8b2f4a61d37"
+down_revision: Union[str, Sequence[str], None] = "d5a93e27c1f8"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column(
+        "document",
+        sa.Column(
+            "is_text_extracted",
+            sa.Boolean(),
+            server_default=sa.false(),
+            nullable=False,
+        ),
+    )
+    op.add_column(
+        "document",
+        sa.Column(
+            "is_summarized", sa.Boolean(), server_default=sa.false(), nullable=False
+        ),
+    )
+    op.add_column(
+        "document",
+        sa.Column("chunks_persisted", sa.Integer(), server_default="0", nullable=False),
+    )
+    # Documents that already finished ingesting have passed every checkpoint
+    op.execute(
+        "UPDATE document SET is_text_extracted = true, is_summarized = true "
+        "WHERE status = 'ready'"
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column("document", "chunks_persisted")
+    op.drop_column("document", "is_summarized")
+    op.drop_column("document", "is_text_extracted")
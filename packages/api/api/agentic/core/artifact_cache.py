@@ -0,0 +1,190 @@
+"""Content-addressed cache for LLM-generated ingestion artifacts.
+
+OCR text, summaries and knowledge graphs are keyed by (artifact type,
+prompt version, model, content hash). The prompt version is the hash of the
+rendered prompt, so editing a template invalidates its entries on its own;
+ARTIFACT_CACHE_VERSION can be bumped to invalidate everything when output
+parsing changes.
+"""
+
+import asyncio
+import hashlib
+import threading
+from datetime import timedelta
+from typing import Any, Optional, Union
+
+from loguru import logger
+from sqlalchemy import delete, func, or_, select
+from sqlalchemy.dialects.postgresql import insert
+
+from api.config import get_settings
+from api.database import SessionLocal
+from api.models.artifact import ArtifactCacheEntry
+
+ARTIFACT_CACHE_VERSION = 1
+
+
+def make_artifact_key(
+    artifact_type: str, model_name: str, prompt: str, content: Union[str, bytes]
+) -> str:
+    """Builds the cache key for one artifact."""
+    hasher = hashlib.sha256(f"v{ARTIFACT_CACHE_VERSION}\0".encode())
+    hasher.update(hashlib.sha256(prompt.encode("utf-8")).digest())
+    if isinstance(content, str):
+        content = content.encode("utf-8")
+    hasher.update(hashlib.sha256(content).digest())
+    return f"{artifact_type}:{model_name}:{hasher.hexdigest()}"
+
+
+class ArtifactCache:
+    """Postgres-backed cache of JSON-serializable LLM outputs."""
+
+    def __init__(
+        self,
+        ttl_seconds: Optional[int] = None,
+        max_rows: int = 100_000,
+        evict_every: int = 100,
+    ):
+        """
+        params: ttl_seconds: Optional[int] - Entry lifetime; None keeps entries until evicted.
+        params: max_rows: int - Max rows kept in the table.
+        params: evict_every: int - Writes between eviction passes.
+        """
+        self.ttl_seconds = ttl_seconds
+        self.max_rows = max_rows
+        self.evict_every = evict_every
+
+        self._lock = threading.Lock()
+        self._writes_since_evict = 0
+
+        self.hits = 0
+        self.misses = 0
+
+    async def get(self, key: str) -> Optional[Any]:
+        """Returns the cached payload for ``key``, or None."""
+        payload = await asyncio.to_thread(self._load, key)
+        with self._lock:
+            if payload is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+        return payload
+
+    async def put(
+        self, key: str, artifact_type: str, model_name: str, payload: Any
+    ) -> None:
+        """Stores a payload; failures are logged and ignored."""
+        await asyncio.to_thread(self._save, key, artifact_type, model_name, payload)
+
+    def stats(self) -> dict:
+        """Returns hit/miss counters for monitoring."""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+            }
+
+    def _load(self, key: str) -> Optional[Any]:
+        try:
+            with SessionLocal() as db:
+                return db.scalar(
+                    select(ArtifactCacheEntry.payload).where(
+                        ArtifactCacheEntry.key == key,
+                        or_(
+                            ArtifactCacheEntry.expires_at.is_(None),
+                            ArtifactCacheEntry.expires_at > func.current_timestamp(),
+                        ),
+                    )
+                )
+        except Exception as e:
+            # The cache is an optimization; a lookup failure is a miss
+            logger.warning(f"Artifact cache lookup failed: {e}")
+            return None
+
+    def _save(self, key: str, artifact_type: str, model_name: str, payload: Any):
+        # Computed by the database, the same clock _load compares against
+        expires_at = (
+            func.current_timestamp() + timedelta(seconds=self.ttl_seconds)
+            if self.ttl_seconds
+            else None
+        )
+        row = {
+            "key": key,
+            "artifact_type": artifact_type,
+            "model_name": model_name,
+            "payload": payload,
+            "expires_at": expires_at,
+        }
+        try:
+            with SessionLocal() as db:
+                statement = insert(ArtifactCacheEntry).values(row)
+                db.execute(
+                    statement.on_conflict_do_update(
+                        index_elements=["key"],
+                        set_={
+                            "payload": statement.excluded.payload,
+                            "expires_at": statement.excluded.expires_at,
+                        },
+                    )
+                )
+                db.commit()
+        except Exception as e:
+            logger.warning(f"Artifact cache write failed: {e}")
+            return
+
+        with self._lock:
+            self._writes_since_evict += 1
+            due = self._writes_since_evict >= self.evict_every
+            if due:
+                self._writes_since_evict = 0
+        if due:
+            self.evict()
+
+    def evict(self) -> int:
+        """Drops expired rows, then trims the table to ``max_rows``, oldest first."""
+        try:
+            with SessionLocal() as db:
+                removed = db.execute(
+                    delete(ArtifactCacheEntry).where(
+                        ArtifactCacheEntry.expires_at <= func.current_timestamp()
+                    )
+                ).rowcount
+                total = db.scalar(select(func.count()).select_from(ArtifactCacheEntry))
+                excess = (total or 0) - self.max_rows
+                if excess > 0:
+                    oldest = (
+                        select(ArtifactCacheEntry.key)
+                        .order_by(ArtifactCacheEntry.created_at)
+                        .limit(excess)
+                    )
+                    removed += db.execute(
+                        delete(ArtifactCacheEntry).where(
+                            ArtifactCacheEntry.key.in_(oldest.scalar_subquery())
+                        )
+                    ).rowcount
+                db.commit()
+                if removed:
+                    logger.info(f"Evicted {removed} artifact cache rows")
+                return removed
+        except Exception as e:
+            logger.warning(f"Artifact cache eviction failed: {e}")
+            return 0
+
+
+_artifact_cache: Optional[ArtifactCache] = None
+
+
+def get_artifact_cache() -> Optional[ArtifactCache]:
+    """Returns the process-wide artifact cache, or None when disabled."""
+    global _artifact_cache
+    settings = get_settings()
+    if not settings.ARTIFACT_CACHE_ENABLED:
+        return None
+    if _artifact_cache is None:
+        _artifact_cache = ArtifactCache(
+            ttl_seconds=settings.ARTIFACT_CACHE_TTL_SECONDS or None,
+            max_rows=settings.ARTIFACT_CACHE_MAX_ROWS,
+        )
+    return _artifact_cache
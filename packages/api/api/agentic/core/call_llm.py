@@ -19,6 +19,7 @@ model = os.getenv("LITELLM_MODEL", "openrouter/meta-llama/llama-3.3-70b-instruct
 structured_model = os.getenv(
     "LITELLM_STRUCTURED_MODEL", "openrouter/meta-llama/llama-3.3-70b-instruct"
 )
+ocr_model = "openai/typhoon-ocr-preview"
 
 client = instructor.from_litellm(litellm.completion, mode=instructor.Mode.JSON_SCHEMA)
 async_client = instructor.from_litellm(
@@ -123,7 +124,7 @@ async def call_vlm_async(
     image_base64: str,
     api_key: str = os.getenv("TYPHOON_API_KEY"),
     *,
-    model: str = "openai/typhoon-ocr-preview",
+    model: str = ocr_model,
     litellm_params: dict[str, Any] = None,
 ) -> str:
     """Calls the unstructured VLM with the provided prompt and returns the response."""
@@ -0,0 +1,153 @@
+"""Micro-batching of concurrent query embeddings."""
+
+import queue
+import threading
+import time
+from concurrent.futures import Future
+from typing import NamedTuple, Optional
+
+import numpy as np
+from loguru import logger
+
+from .embedding import TextEmbedder
+
+
+class _Request(NamedTuple):
+    text: str
+    normalize: bool
+    future: Future
+
+
+class EmbeddingBatcher:
+    """
+    Gathers concurrent single-text embedding requests into batched encodes.
+
+    The first request opens a window of ``max_wait_ms``; everything submitted
+    before it closes (or until ``max_batch_size`` requests arrive) is encoded
+    with one ``get_embedding`` call and each caller's future is resolved with
+    its own row. ``get_embedding`` matches TextEmbedder's single-text call, so
+    the batcher can stand in for it wherever queries are embedded.
+    """
+
+    def __init__(
+        self,
+        embedder: TextEmbedder,
+        max_batch_size: int = 32,
+        max_wait_ms: float = 5.0,
+    ):
+        """
+        params: embedder: TextEmbedder - Encodes each gathered batch.
+        params: max_batch_size: int - Most requests encoded together.
+        params: max_wait_ms: float - How long a batch waits for more requests.
+        """
+        self.embedder = embedder
+        self.max_batch_size = max(1, max_batch_size)
+        self.max_wait = max(0.0, max_wait_ms) / 1000
+
+        self._requests: queue.Queue = queue.Queue()
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+        self._closed = False
+
+        self.batches = 0
+        self.items = 0
+        self.largest_batch = 0
+
+    @property
+    def model_name(self) -> str:
+        return self.embedder.model_name
+
+    def _ensure_started(self) -> None:
+        if self._thread is not None:
+            return
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name="embedding-batcher", daemon=True
+                )
+                self._thread.start()
+
+    def submit(self, text: str, normalize: bool = True) -> Future:
+        """Queue one text; the returned future resolves to its embedding."""
+        if self._closed:
+            raise RuntimeError("Embedding batcher is closed.")
+        self._ensure_started()
+        future: Future = Future()
+        self._requests.put(_Request(text, normalize, future))
+        return future
+
+    def get_embedding(self, text: str, normalize: bool = True) -> np.ndarray:
+        """Embeds one text as part of whatever batch is being gathered."""
+        return self.submit(text, normalize).result()
+
+    def _gather(self, first: _Request) -> list[_Request]:
+        """Collect requests until the window closes or the batch is full."""
+        batch = [first]
+        deadline = time.monotonic() + self.max_wait
+        while len(batch) < self.max_batch_size:
+            remaining = deadline - time.monotonic()
+            try:
+                if remaining > 0:
+                    request = self._requests.get(timeout=remaining)
+                else:
+                    request = self._requests.get_nowait()
+            except queue.Empty:
+                break
+            if request is None:
+                self._requests.put(None)
+                break
+            batch.append(request)
+        return batch
+
+    def _run(self) -> None:
+        while True:
+            first = self._requests.get()
+            if first is None:
+                return
+            batch = self._gather(first)
+            self.batches += 1
+            self.items += len(batch)
+            self.largest_batch = max(self.largest_batch, len(batch))
+
+            # normalize changes the output, so each flag is encoded separately
+            for normalize in (True, False):
+                group = [r for r in batch if r.normalize is normalize]
+                if group:
+                    self._encode(group, normalize)
+
+    def _encode(self, group: list[_Request], normalize: bool) -> None:
+        try:
+            embeddings = self.embedder.get_embedding(
+                [r.text for r in group], normalize=normalize
+            )
+            if embeddings is None:
+                raise RuntimeError("Embedding model failed to encode the batch.")
+        except Exception as e:
+            logger.error(f"Batched embedding of {len(group)} queries failed: {e}")
+            for request in group:
+                if not request.future.done():
+                    request.future.set_exception(e)
+            return
+
+        for request, embedding in zip(group, embeddings):
+            if not request.future.done():
+                request.future.set_result(embedding)
+
+    def stats(self) -> dict:
+        """Batching counters for diagnostics."""
+        return {
+            "batches": self.batches,
+            "items": self.items,
+            "largest_batch": self.largest_batch,
+            "mean_batch": self.items / self.batches if self.batches else 0.0,
+            "max_batch_size": self.max_batch_size,
+            "max_wait_ms": self.max_wait * 1000,
+        }
+
+    def close(self) -> None:
+        """Stop the dispatcher after the requests already queued."""
+        self._closed = True
+        if self._thread is not None:
+            self._requests.put(None)
+            self._thread.join()
+            self._thread = None
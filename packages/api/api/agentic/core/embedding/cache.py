@@ -0,0 +1,212 @@
+"""Two-tier cache for text embeddings.
+
+Embeddings are keyed by (model, normalization, sha256 of the text), so the
+same chunk or query is only encoded once per model. A process-local LRU sits
+in front of the ``embedding_cache`` Postgres table, which survives restarts
+and is shared between the API and the ingestion workers.
+"""
+
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import Optional
+
+import numpy as np
+from loguru import logger
+from sqlalchemy import delete, func, select, update
+from sqlalchemy.dialects.postgresql import insert
+
+from api.config import get_settings
+from api.database import SessionLocal
+from api.models.embedding import EmbeddingCacheEntry
+
+
+def make_cache_key(model_name: str, normalize: bool, text: str) -> str:
+    """Builds the cache key for a single text."""
+    digest = hashlib.sha256(text.encode("utf-8")).hexdigest()
+    return f"{model_name}:{int(normalize)}:{digest}"
+
+
+class EmbeddingCache:
+    """In-memory LRU backed by a durable Postgres table."""
+
+    def __init__(
+        self,
+        memory_items: int = 10000,
+        max_rows: int = 1_000_000,
+        persistent: bool = True,
+        evict_every: int = 1000,
+    ):
+        """
+        params: memory_items: int - Max vectors kept in the in-process LRU.
+        params: max_rows: int - Max rows kept in the durable table.
+        params: persistent: bool - Whether to read/write the durable table.
+        params: evict_every: int - Durable writes between eviction passes.
+        """
+        self.memory_items = memory_items
+        self.max_rows = max_rows
+        self.persistent = persistent
+        self.evict_every = evict_every
+
+        self._memory: OrderedDict[str, np.ndarray] = OrderedDict()
+        self._lock = threading.Lock()
+        self._writes_since_evict = 0
+
+        self.memory_hits = 0
+        self.store_hits = 0
+        self.misses = 0
+
+    def get_many(self, keys: list[str]) -> dict[str, np.ndarray]:
+        """Returns the cached vectors for the given keys that are present."""
+        found: dict[str, np.ndarray] = {}
+        with self._lock:
+            for key in keys:
+                vector = self._memory.get(key)
+                if vector is not None:
+                    self._memory.move_to_end(key)
+                    found[key] = vector
+            self.memory_hits += len(found)
+
+        remaining = [key for key in dict.fromkeys(keys) if key not in found]
+        if remaining and self.persistent:
+            stored = self._load(remaining)
+            with self._lock:
+                for key, vector in stored.items():
+                    self._remember(key, vector)
+                self.store_hits += len(stored)
+            found.update(stored)
+
+        with self._lock:
+            self.misses += len(set(keys) - found.keys())
+        return found
+
+    def put_many(self, model_name: str, items: dict[str, np.ndarray]) -> None:
+        """Stores freshly computed vectors in both tiers."""
+        if not items:
+            return
+        with self._lock:
+            for key, vector in items.items():
+                self._remember(key, vector)
+        if self.persistent:
+            self._save(model_name, items)
+
+    def stats(self) -> dict:
+        """Returns hit/miss counters for monitoring."""
+        with self._lock:
+            hits = self.memory_hits + self.store_hits
+            lookups = hits + self.misses
+            return {
+                "memory_items": len(self._memory),
+                "memory_hits": self.memory_hits,
+                "store_hits": self.store_hits,
+                "misses": self.misses,
+                "hit_rate": hits / lookups if lookups else 0.0,
+            }
+
+    def clear_memory(self) -> None:
+        """Drops the in-process tier; the durable table is untouched."""
+        with self._lock:
+            self._memory.clear()
+
+    def _remember(self, key: str, vector: np.ndarray) -> None:
+        self._memory[key] = vector
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.memory_items:
+            self._memory.popitem(last=False)
+
+    def _load(self, keys: list[str]) -> dict[str, np.ndarray]:
+        try:
+            with SessionLocal() as db:
+                rows = db.execute(
+                    select(
+                        EmbeddingCacheEntry.key, EmbeddingCacheEntry.embedding
+                    ).where(EmbeddingCacheEntry.key.in_(keys))
+                ).all()
+                if rows:
+                    db.execute(
+                        update(EmbeddingCacheEntry)
+                        .where(EmbeddingCacheEntry.key.in_([row.key for row in rows]))
+                        .values(last_used_at=func.current_timestamp())
+                    )
+                    db.commit()
+        except Exception as e:
+            # The durable tier is an optimization; never fail an embed on it
+            logger.warning(f"Embedding cache lookup failed: {e}")
+            return {}
+
+        return {row.key: np.frombuffer(row.embedding, dtype=np.float32) for row in rows}
+
+    def _save(self, model_name: str, items: dict[str, np.ndarray]) -> None:
+        rows = [
+            {
+                "key": key,
+                "model_name": model_name,
+                "embedding": np.asarray(vector, dtype=np.float32).tobytes(),
+                "dimension": int(np.asarray(vector).shape[-1]),
+            }
+            for key, vector in items.items()
+        ]
+        try:
+            with SessionLocal() as db:
+                db.execute(
+                    insert(EmbeddingCacheEntry).on_conflict_do_nothing(
+                        index_elements=["key"]
+                    ),
+                    rows,
+                )
+                db.commit()
+        except Exception as e:
+            logger.warning(f"Embedding cache write failed: {e}")
+            return
+
+        with self._lock:
+            self._writes_since_evict += len(rows)
+            due = self._writes_since_evict >= self.evict_every
+            if due:
+                self._writes_since_evict = 0
+        if due:
+            self.evict()
+
+    def evict(self) -> int:
+        """Trims the durable table to ``max_rows``, least recently used first."""
+        if not self.persistent:
+            return 0
+        try:
+            with SessionLocal() as db:
+                total = db.scalar(select(func.count()).select_from(EmbeddingCacheEntry))
+                excess = (total or 0) - self.max_rows
+                if excess <= 0:
+                    return 0
+                oldest = (
+                    select(EmbeddingCacheEntry.key)
+                    .order_by(EmbeddingCacheEntry.last_used_at)
+                    .limit(excess)
+                )
+                result = db.execute(
+                    delete(EmbeddingCacheEntry).where(
+                        EmbeddingCacheEntry.key.in_(oldest.scalar_subquery())
+                    )
+                )
+                db.commit()
+                logger.info(f"Evicted {result.rowcount} embedding cache rows")
+                return result.rowcount
+        except Exception as e:
+            logger.warning(f"Embedding cache eviction failed: {e}")
+            return 0
+
+
+_embedding_cache: Optional[EmbeddingCache] = None
+
+
+def get_embedding_cache() -> Optional[EmbeddingCache]:
+    """Returns the process-wide embedding cache, or None when disabled."""
+    global _embedding_cache
+    settings = get_settings()
+    if not settings.EMBEDDING_CACHE_ENABLED:
+        return None
+    if _embedding_cache is None:
+        _embedding_cache = EmbeddingCache(
+            memory_items=settings.EMBEDDING_CACHE_MEMORY_ITEMS,
+            max_rows=settings.EMBEDDING_CACHE_MAX_ROWS,
+        )
+    return _embedding_cache
@@ -1,14 +1,19 @@
-from typing import Literal, Union
+from typing import Literal, Optional, Union
 
 import numpy as np
 from loguru import logger
 from model2vec import StaticModel
 from sentence_transformers import SentenceTransformer
 
+from .cache import EmbeddingCache, make_cache_key
+from .onnx_backend import QuantizationTarget, load_onnx_model
+
 MODEL_BACKEND_MAP = {
     "bge-m3-distilled": "sentence_transformer",
     "FlukeTJ/bge-m3-m2v-distilled-256": "model2vec",
     "jaeyong2/bge-m3-Thai": "sentence_transformer",
+    # int8 ONNX export of the model above (python -m api.main export-onnx)
+    "jaeyong2/bge-m3-Thai-int8": "onnx",
 }
 
 _MODEL_CACHE = {}
@@ -20,22 +25,39 @@ class TextEmbedder:
     def __init__(
         self,
         model_name: str = "FlukeTJ/bge-m3-m2v-distilled-256",
-        backend: Literal["model2vec", "sentence_transformer"] = "model2vec",
+        backend: Literal["model2vec", "sentence_transformer", "onnx"] = "model2vec",
         cache_folder: str = "cache_models",
+        batch_size: int = 64,
+        device: Optional[str] = None,
+        cache: Optional[EmbeddingCache] = None,
+        onnx_quantization: QuantizationTarget = "avx2",
     ):
         """
         params: model_name: str - Name of the embedding model to use.
         params: backend: Literal - Type of backend to use for embeddings.
         params: cache_folder: str - Folder to cache models. model2vec is exceptional.
+        ONNX exports are read from its ``onnx`` subfolder.
+        params: batch_size: int - Number of texts encoded per call in batched mode.
+        params: device: Optional[str] - Device for sentence_transformer (auto if None).
+        params: cache: Optional[EmbeddingCache] - Cache consulted before encoding.
+        params: onnx_quantization: str - Instruction set of the int8 ONNX export to load.
         """
 
         self.model_name = model_name
         self.backend = backend
         self.cache_folder = cache_folder
+        self.batch_size = batch_size
+        self.device = device
+        self.cache = cache
+        self.onnx_quantization = onnx_quantization
+        # Vectors differ between backends and between int8 ONNX exports
+        self.model_variant = f"{backend}/{model_name}"
+        if backend == "onnx":
+            self.model_variant += f"/{onnx_quantization}"
         self.model: Union[SentenceTransformer, StaticModel] = self._load_model()
 
     def _load_model(self):
-        key = f"{self.backend}:{self.model_name}"
+        key = self.model_variant
         if key in _MODEL_CACHE:
             logger.info(f"Using cached model for: {key}")
             return _MODEL_CACHE[key]
@@ -50,6 +72,12 @@ class TextEmbedder:
             model = SentenceTransformer(
                 self.model_name, cache_folder=self.cache_folder, device=self.device
             )
+        elif self.backend == "onnx":
+            model = load_onnx_model(
+                self.model_name,
+                cache_folder=self.cache_folder,
+                quantization=self.onnx_quantization,
+            )
         else:
             raise ValueError(f"Unsupported backend type: {self.backend}")
 
@@ -67,9 +95,126 @@ class TextEmbedder:
             return None
 
         try:
-            embeddings = self.model.encode(text, normalize_embeddings=normalize)
-            return embeddings
+            if self.cache is None:
+                return self.model.encode(text, normalize_embeddings=normalize)
+
+            texts = [text] if isinstance(text, str) else list(text)
+            keys = [self._cache_key(t, normalize) for t in texts]
+            cached = self.cache.get_many(keys)
+            missing = list(dict.fromkeys(k for k in keys if k not in cached))
+            if missing:
+                by_key = dict(zip(keys, texts))
+                vectors = self.model.encode(
+                    [by_key[k] for k in missing], normalize_embeddings=normalize
+                )
+                computed = dict(zip(missing, np.asarray(vectors, dtype=np.float32)))
+                self.cache.put_many(self.model_name, computed)
+                cached.update(computed)
+
+            embeddings = np.stack([cached[k] for k in keys])
+            return embeddings[0] if isinstance(text, str) else embeddings
 
         except Exception as e:
             logger.error(f"Error generating embeddings: {e}")
             return None
+
+    def get_embeddings_batched(
+        self,
+        texts: list[str],
+        normalize: bool = True,
+        batch_size: Optional[int] = None,
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Encodes many texts in length-sorted batches.
+
+        Texts are grouped by length so each batch pads to a similar size. If a
+        batch fails, its texts are retried one by one so a single bad input
+        only loses its own row.
+
+        Returns:
+            (embeddings, ok): an (n, dim) matrix in input order and a boolean
+            mask of the rows that were embedded successfully.
+        """
+        if self.cache is None or self.model is None or not texts:
+            return self._encode_batched(texts, normalize, batch_size)
+
+        keys = [self._cache_key(t, normalize) for t in texts]
+        cached = self.cache.get_many(keys)
+        missing = [i for i, k in enumerate(keys) if k not in cached]
+        if not missing:
+            return np.stack([cached[k] for k in keys]).astype(np.float32), np.ones(
+                len(texts), dtype=bool
+            )
+
+        vectors, vectors_ok = self._encode_batched(
+            [texts[i] for i in missing], normalize, batch_size
+        )
+        self.cache.put_many(
+            self.model_name,
+            {keys[i]: vectors[j] for j, i in enumerate(missing) if vectors_ok[j]},
+        )
+
+        # Every miss may have failed, leaving ``vectors`` with zero columns
+        dim = vectors.shape[-1] or next(iter(cached.values()), np.empty(0)).shape[-1]
+        embeddings = np.zeros((len(texts), dim), dtype=np.float32)
+        ok = np.zeros(len(texts), dtype=bool)
+        for i, k in enumerate(keys):
+            if k in cached:
+                embeddings[i] = cached[k]
+                ok[i] = True
+        if vectors.shape[-1]:
+            embeddings[missing] = vectors
+        ok[missing] = vectors_ok
+        return embeddings, ok
+
+    def _cache_key(self, text: str, normalize: bool) -> str:
+        return make_cache_key(self.model_variant, normalize, text)
+
+    def _encode_batched(
+        self,
+        texts: list[str],
+        normalize: bool,
+        batch_size: Optional[int] = None,
+    ) -> tuple[np.ndarray, np.ndarray]:
+        batch_size = batch_size or self.batch_size
+        ok = np.zeros(len(texts), dtype=bool)
+        if self.model is None or not texts:
+            if self.model is None:
+                logger.error("Embedding model is not available.")
+            return np.empty((len(texts), 0), dtype=np.float32), ok
+
+        order = sorted(range(len(texts)), key=lambda i: len(texts[i]))
+        embeddings: Optional[np.ndarray] = None
+
+        def _store(indices: list[int], vectors: np.ndarray) -> None:
+            nonlocal embeddings
+            if embeddings is None:
+                embeddings = np.zeros((len(texts), vectors.shape[-1]), np.float32)
+            embeddings[indices] = vectors
+            ok[indices] = True
+
+        for start in range(0, len(order), batch_size):
+            batch = order[start : start + batch_size]
+            try:
+                vectors = self.model.encode(
+                    [texts[i] for i in batch],
+                    normalize_embeddings=normalize,
+                    batch_size=len(batch),
+                )
+                _store(batch, np.asarray(vectors, dtype=np.float32))
+            except Exception as e:
+                logger.warning(
+                    f"Batch embedding failed ({e}), retrying {len(batch)} texts individually"
+                )
+                for i in batch:
+                    try:
+                        vector = self.model.encode(
+                            [texts[i]], normalize_embeddings=normalize
+                        )
+                        _store([i], np.asarray(vector, dtype=np.float32))
+                    except Exception as item_error:
+                        logger.error(f"Error embedding text #{i}: {item_error}")
+
+        if embeddings is None:
+            embeddings = np.empty((len(texts), 0), dtype=np.float32)
+        return embeddings, ok
@@ -0,0 +1,147 @@
+"""Int8-quantized ONNX Runtime models for CPU embedding.
+
+A sentence-transformer model is exported to ONNX once, dynamically quantized
+to int8 for the host's instruction set, and saved under the model cache
+folder. The ``onnx`` backend of TextEmbedder then loads that graph with ONNX
+Runtime instead of running PyTorch in fp32. Exported models are named after
+their source model plus ``QUANTIZED_SUFFIX``, e.g. ``jaeyong2/bge-m3-Thai-int8``.
+
+Requires ``sentence-transformers[onnx]`` (Optimum and ONNX Runtime).
+"""
+
+import os
+from typing import Literal, Optional
+
+import numpy as np
+from loguru import logger
+from sentence_transformers import SentenceTransformer
+
+QUANTIZED_SUFFIX = "-int8"
+
+QuantizationTarget = Literal["arm64", "avx2", "avx512", "avx512_vnni"]
+
+# Mixed Thai/English, short and long, so parity covers varied token counts
+PARITY_TEXTS = [
+    "What does the report say about the quarterly budget?",
+    "สรุปงบประมาณไตรมาสล่าสุดให้หน่อย",
+    "Invoice 2024-118: consulting services, 40 hours at 1,500 THB per hour.",
+    " ".join(["The committee reviewed the proposal and approved the budget."] * 20),
+]
+
+
+def source_model_name(model_name: str) -> str:
+    """The sentence-transformer model an int8 export was built from."""
+    if model_name.endswith(QUANTIZED_SUFFIX):
+        return model_name[: -len(QUANTIZED_SUFFIX)]
+    return model_name
+
+
+def onnx_model_dir(model_name: str, cache_folder: str = "cache_models") -> str:
+    """Folder holding the exported model, its tokenizer and ONNX graphs."""
+    if not model_name.endswith(QUANTIZED_SUFFIX):
+        model_name += QUANTIZED_SUFFIX
+    return os.path.join(cache_folder, "onnx", model_name.replace("/", "__"))
+
+
+def quantized_file_name(
+    model_dir: str, quantization: QuantizationTarget = "avx2"
+) -> Optional[str]:
+    """
+    Path of the int8 graph exported for ``quantization`` inside ``model_dir``,
+    relative to it, if exported.
+    """
+    file_name = os.path.join("onnx", f"model_qint8_{quantization}.onnx")
+    if not os.path.isfile(os.path.join(model_dir, file_name)):
+        return None
+    return file_name
+
+
+def load_onnx_model(
+    model_name: str,
+    cache_folder: str = "cache_models",
+    quantization: QuantizationTarget = "avx2",
+) -> SentenceTransformer:
+    """Loads the ``quantization`` int8 export on ONNX Runtime's CPU provider."""
+    model_dir = onnx_model_dir(model_name, cache_folder)
+    file_name = quantized_file_name(model_dir, quantization)
+    if file_name is None:
+        source = source_model_name(model_name)
+        raise ValueError(
+            f"No {quantization} int8 ONNX export of {source} in {model_dir}. "
+            f"Run: python -m api.main export-onnx --model {source} "
+            f"--quantization {quantization}"
+        )
+    return SentenceTransformer(
+        model_dir,
+        backend="onnx",
+        device="cpu",
+        model_kwargs={"file_name": file_name, "provider": "CPUExecutionProvider"},
+    )
+
+
+def export_quantized_model(
+    model_name: str,
+    cache_folder: str = "cache_models",
+    quantization: QuantizationTarget = "avx2",
+) -> str:
+    """
+    Exports a sentence-transformer model to ONNX and quantizes it to int8.
+
+    params: model_name: str - Source model (Hugging Face id or local path).
+    params: cache_folder: str - Model cache folder the export is written under.
+    params: quantization: str - Target instruction set of the int8 kernels.
+
+    Returns the export folder.
+    """
+    from sentence_transformers import export_dynamic_quantized_onnx_model
+
+    source = source_model_name(model_name)
+    model_dir = onnx_model_dir(source, cache_folder)
+
+    logger.info(f"Exporting {source} to ONNX in {model_dir}")
+    model = SentenceTransformer(
+        source, backend="onnx", cache_folder=cache_folder, device="cpu"
+    )
+    # Tokenizer, pooling config and the fp32 graph (onnx/model.onnx)
+    model.save(model_dir)
+
+    logger.info(f"Quantizing {source} to int8 ({quantization})")
+    export_dynamic_quantized_onnx_model(
+        model, quantization_config=quantization, model_name_or_path=model_dir
+    )
+    return model_dir
+
+
+def check_parity(
+    model_name: str,
+    cache_folder: str = "cache_models",
+    texts: Optional[list[str]] = None,
+    min_similarity: float = 0.99,
+    quantization: QuantizationTarget = "avx2",
+) -> dict:
+    """
+    Compares the int8 ONNX model's embeddings with the PyTorch model's.
+
+    Returns the per-text cosine similarity summary and whether every text
+    reached ``min_similarity``.
+    """
+    texts = texts or PARITY_TEXTS
+    source = source_model_name(model_name)
+
+    reference = SentenceTransformer(source, cache_folder=cache_folder, device="cpu")
+    expected = reference.encode(texts, normalize_embeddings=True)
+    actual = load_onnx_model(source, cache_folder, quantization).encode(
+        texts, normalize_embeddings=True
+    )
+
+    similarities = np.sum(np.asarray(expected) * np.asarray(actual), axis=1)
+    result = {
+        "model_name": source,
+        "texts": len(texts),
+        "min_similarity": float(similarities.min()),
+        "mean_similarity": float(similarities.mean()),
+        "threshold": min_similarity,
+        "passed": bool(similarities.min() >= min_similarity),
+    }
+    logger.info(f"ONNX parity for {source}: {result}")
+    return result
@@ -0,0 +1,88 @@
+"""Process-wide owner of the text embedder and its load state."""
+
+import threading
+import time
+from typing import Callable, Optional
+
+from loguru import logger
+
+from .embedding import TextEmbedder
+
+# Short and long inputs, so first real requests do not pay for lazy setup
+WARMUP_TEXTS = [
+    "warm up",
+    "What does the report say about the quarterly budget?",
+    " ".join(["The quick brown fox jumps over the lazy dog."] * 40),
+]
+
+
+class EmbedderProvider:
+    """
+    Builds one TextEmbedder per process, warms it up and reports its state.
+
+    The API loads it during startup so readiness can wait for the model; other
+    processes (the ingestion worker, scripts) load it on first use.
+    """
+
+    def __init__(self, factory: Callable[[], TextEmbedder]):
+        """
+        params: factory: Callable - Builds the TextEmbedder (loads the model).
+        """
+        self._factory = factory
+        self._embedder: Optional[TextEmbedder] = None
+        self._lock = threading.Lock()
+
+        self.status = "not_loaded"
+        self.error: Optional[str] = None
+        self.load_seconds: Optional[float] = None
+        self.warmup_seconds: Optional[float] = None
+
+    @property
+    def is_ready(self) -> bool:
+        return self._embedder is not None
+
+    def load(self) -> TextEmbedder:
+        """Builds and warms up the embedder once; later calls return it."""
+        with self._lock:
+            if self._embedder is not None:
+                return self._embedder
+
+            self.status = "loading"
+            self.error = None
+            started = time.perf_counter()
+            try:
+                embedder = self._factory()
+                loaded = time.perf_counter()
+                embedder.model.encode(WARMUP_TEXTS, normalize_embeddings=True)
+            except Exception as e:
+                self.status = "failed"
+                self.error = str(e)
+                logger.error(f"Failed to load embedding model: {e}")
+                raise
+
+            self.load_seconds = loaded - started
+            self.warmup_seconds = time.perf_counter() - loaded
+            self._embedder = embedder
+            self.status = "ready"
+            logger.info(
+                f"Embedding model {embedder.model_name} ready "
+                f"(load {self.load_seconds:.2f}s, warm-up {self.warmup_seconds:.2f}s)"
+            )
+            return embedder
+
+    def get(self) -> TextEmbedder:
+        """Returns the shared embedder, loading it if nobody has yet."""
+        if self._embedder is not None:
+            return self._embedder
+        return self.load()
+
+    def state(self) -> dict:
+        """Load state for readiness checks."""
+        return {
+            "status": self.status,
+            "model_name": self._embedder.model_name if self._embedder else None,
+            "backend": self._embedder.backend if self._embedder else None,
+            "load_seconds": self.load_seconds,
+            "warmup_seconds": self.warmup_seconds,
+            "error": self.error,
+        }
@@ -0,0 +1,143 @@
+"""In-process LRU for search query embeddings.
+
+Search-as-you-type and suggested questions send the same short queries over
+and over. This cache answers them from memory before they reach the batcher
+or the two-tier embedding cache, keyed by model and whitespace-normalized
+query text, with an optional time-to-live.
+"""
+
+import threading
+import time
+import unicodedata
+from collections import OrderedDict
+from typing import Optional, Union
+
+import numpy as np
+
+from api.config import get_settings
+
+from .batcher import EmbeddingBatcher
+from .embedding import TextEmbedder
+
+
+def normalize_query(text: str) -> str:
+    """Canonical form of a query: NFKC, trimmed, runs of whitespace collapsed."""
+    return " ".join(unicodedata.normalize("NFKC", text).split())
+
+
+class QueryEmbeddingCache:
+    """Bounded LRU of query embeddings with an optional TTL."""
+
+    def __init__(self, max_items: int = 2048, ttl_seconds: float = 3600):
+        """
+        params: max_items: int - Max query vectors kept.
+        params: ttl_seconds: float - Entry lifetime; 0 keeps entries until evicted.
+        """
+        self.max_items = max(1, max_items)
+        self.ttl_seconds = ttl_seconds
+
+        self._entries: OrderedDict[tuple, tuple[float, np.ndarray]] = OrderedDict()
+        self._lock = threading.Lock()
+
+        self.hits = 0
+        self.misses = 0
+        self.expired = 0
+        self.evictions = 0
+
+    def get(self, model_name: str, normalize: bool, query: str) -> Optional[np.ndarray]:
+        """Returns the cached vector for a normalized query, if fresh."""
+        key = (model_name, normalize, query)
+        with self._lock:
+            entry = self._entries.get(key)
+            if (
+                entry is not None
+                and self.ttl_seconds > 0
+                and time.monotonic() - entry[0] > self.ttl_seconds
+            ):
+                del self._entries[key]
+                self.expired += 1
+                entry = None
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+    def put(
+        self, model_name: str, normalize: bool, query: str, vector: np.ndarray
+    ) -> None:
+        vector = np.array(vector, dtype=np.float32)
+        # Shared between callers, so nobody may modify it in place
+        vector.setflags(write=False)
+        with self._lock:
+            self._entries[(model_name, normalize, query)] = (time.monotonic(), vector)
+            self._entries.move_to_end((model_name, normalize, query))
+            while len(self._entries) > self.max_items:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def stats(self) -> dict:
+        """Returns hit/miss counters for monitoring."""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "items": len(self._entries),
+                "hits": self.hits,
+                "misses": self.misses,
+                "expired": self.expired,
+                "evictions": self.evictions,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+            }
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+class CachedQueryEmbedder:
+    """
+    Serves query embeddings from a QueryEmbeddingCache, falling back to the
+    wrapped embedder (the batcher or a TextEmbedder) on a miss.
+    """
+
+    def __init__(
+        self,
+        embedder: Union[EmbeddingBatcher, TextEmbedder],
+        cache: QueryEmbeddingCache,
+    ):
+        self.embedder = embedder
+        self.cache = cache
+
+    @property
+    def model_name(self) -> str:
+        return self.embedder.model_name
+
+    def get_embedding(self, text: str, normalize: bool = True) -> np.ndarray:
+        """Embeds one query, reusing the vector of an equal normalized query."""
+        query = normalize_query(text)
+        vector = self.cache.get(self.model_name, normalize, query)
+        if vector is not None:
+            return vector
+
+        vector = self.embedder.get_embedding(query, normalize=normalize)
+        if vector is not None:
+            self.cache.put(self.model_name, normalize, query, vector)
+        return vector
+
+
+_query_embedding_cache: Optional[QueryEmbeddingCache] = None
+
+
+def get_query_embedding_cache() -> Optional[QueryEmbeddingCache]:
+    """Returns the process-wide query embedding cache, or None when disabled."""
+    global _query_embedding_cache
+    settings = get_settings()
+    if not settings.QUERY_EMBEDDING_CACHE_ENABLED:
+        return None
+    if _query_embedding_cache is None:
+        _query_embedding_cache = QueryEmbeddingCache(
+            max_items=settings.QUERY_EMBEDDING_CACHE_ITEMS,
+            ttl_seconds=settings.QUERY_EMBEDDING_CACHE_TTL_SECONDS,
+        )
+    return _query_embedding_cache
@@ -2,6 +2,7 @@ import json
 from collections.abc import Awaitable
 from typing import Any, Callable
 
+from ..artifact_cache import get_artifact_cache, make_artifact_key
 from .schemas import DocumentEdgeBase, DocumentNodeBase, ExtractedGraph
 
 
@@ -11,10 +12,13 @@ class KnowledgeGraphExtractor:
         llm_caller: Callable[[str], Awaitable[str]],
         prompt_renderer: Callable[[str, int], str],
         text_limit: int = 15000,
+        model_name: str = "default",
     ):
         self.llm_caller = llm_caller
         self.prompt_renderer = prompt_renderer
         self.text_limit = text_limit
+        # Identifies the model behind llm_caller in artifact cache keys
+        self.model_name = model_name
 
     def _convert_to_kg_node(self, node: dict[str, Any]) -> DocumentNodeBase:
         """Convert a node dictionary to DocumentNodeBase."""
@@ -43,6 +47,7 @@ class KnowledgeGraphExtractor:
         """Extract knowledge graph from the provided text.
         Returns a dictionary with 'nodes' and 'edges' keys.
         If extraction fails, returns an empty graph with empty nodes and edges.
+        Successful extractions are cached.
         """
         empty_kg = ExtractedGraph(nodes=[], edges=[])
 
@@ -51,6 +56,15 @@ class KnowledgeGraphExtractor:
             return empty_kg
 
         prompt = self.prompt_renderer(full_text=full_text, text_limit=self.text_limit)
+
+        cache = get_artifact_cache()
+        if cache is not None:
+            key = make_artifact_key("graph", self.model_name, prompt, full_text)
+            cached = await cache.get(key)
+            if cached is not None:
+                print("KnowledgeGraphExtractor: Using cached KG.")
+                return ExtractedGraph.model_validate(cached)
+
         print(
             f"KnowledgeGraphExtractor: Sending text (length: {len(full_text[: self.text_limit])}) to LLM..."
         )
@@ -67,6 +81,11 @@ class KnowledgeGraphExtractor:
             print(
                 f"KnowledgeGraphExtractor: Extracted KG with {len(kg_data.nodes)} nodes and {len(kg_data.edges)} edges."
             )
+            # An empty graph usually means a malformed response; retry next time
+            if cache is not None and kg_data.nodes:
+                await cache.put(
+                    key, "graph", self.model_name, kg_data.model_dump(mode="json")
+                )
             return kg_data
 
         except json.JSONDecodeError as e:
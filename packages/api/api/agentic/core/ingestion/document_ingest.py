@@ -1,25 +1,29 @@
+import asyncio
+import bisect
 import traceback
-from typing import Literal, Union
+from collections.abc import Awaitable
+from typing import Literal, Optional, Union
 
 from ....document.schemas import (
     ChunkCreate,
-    DocumentEdgeCreate,
-    DocumentNodeCreate,
     DocumentRelationCreate,
     DocumentUpdate,
 )
-from ....document.service import DocumentService
+from ....document.service import DocumentService, hash_chunk_text, make_chunk_id
 from ....models import Document, User, enum
 from ..embedding.embedding import TextEmbedder
 from ..graph.graph_extract import ExtractedGraph, KnowledgeGraphExtractor
 from .ingest_methods import (
+    extract_chunks_from_pages,
     extract_chunks_from_pdf,
     extract_chunks_from_text,
     extract_text_from_image_file,
-    extract_text_from_pdf_file,
     extract_text_from_text_file,
+    parse_pdf_document_async,
 )
-from .schemas import FileInput, document_details
+from .metrics import IngestionMetrics
+from .office import OFFICE_FILE_TYPES, parse_office_document
+from .schemas import DocumentChunk, FileInput, document_details
 from .summary import SummaryGenerator
 
 
@@ -37,12 +41,16 @@ class DocumentIngestor:
         summary_generator: SummaryGenerator,
         chunk_size: int = 512,
         min_characters_per_chunk: int = 24,
+        chunk_batch_size: int = 256,
     ):
         """
         initialize the DocumentIngestor with necessary services and parameters.
+        chunk_batch_size is the number of chunks embedded and committed per
+        checkpoint of the vector stage.
         """
         self.chunk_size: int = chunk_size
         self.min_characters_per_chunk: int = min_characters_per_chunk
+        self.chunk_batch_size: int = chunk_batch_size
 
         # services
         self.document_service: DocumentService = document_service
@@ -57,10 +65,21 @@ class DocumentIngestor:
                 f"Extracting full text from file: {file_input.name} (type: {file_input.type})"
             )
 
+            # CPU-bound parsing runs in a worker thread to keep the loop responsive
             if file_input.type == ".pdf":
-                full_text = extract_text_from_pdf_file(
-                    file_input.content,
+                # Parse once; the pages are reused by the chunking stage.
+                # Pages without a text layer (scans) are OCR'd concurrently.
+                parsed = await parse_pdf_document_async(file_input.content)
+                file_input.pages = parsed.pages
+                full_text = parsed.full_text
+
+            elif file_input.type in OFFICE_FILE_TYPES:
+                # Sections, sheets or slides are kept as pages for chunking
+                parsed = await asyncio.to_thread(
+                    parse_office_document, file_input.content, file_input.type
                 )
+                file_input.pages = parsed.pages
+                full_text = parsed.full_text
 
             elif file_input.type in {".jpg", ".jpeg", ".png", ".gif"}:
                 full_text = await extract_text_from_image_file(
@@ -71,7 +90,8 @@ class DocumentIngestor:
                 print(
                     f"Treating file type {file_input.type} as text, attempting text extraction"
                 )
-                full_text = extract_text_from_text_file(
+                full_text = await asyncio.to_thread(
+                    extract_text_from_text_file,
                     file_input.content,
                 )
             if not full_text.strip():
@@ -79,6 +99,9 @@ class DocumentIngestor:
                 return ""
 
             print(f"Successfully extracted text from {file_input.name}")
+            if file_input.type == ".pdf" or file_input.type in OFFICE_FILE_TYPES:
+                # Stripping would shift the page offsets chunks are mapped with
+                return full_text
             return full_text.strip()
 
         except Exception as e:
@@ -89,24 +112,57 @@ class DocumentIngestor:
         self, file_input: FileInput, document_id: str
     ) -> list[ChunkCreate]:
         """Parse file into chunks and generate embeddings."""
-        # Parse and chunk the file
-        if file_input.type == ".pdf":
+        chunks = self.chunk_file(file_input)
+        if not chunks:
+            return []
+        return self.embed_chunks(chunks, file_input.name, document_id)
+
+    def chunk_file(self, file_input: FileInput) -> list[DocumentChunk]:
+        """Parse and chunk the file."""
+        if file_input.type == ".pdf" and file_input.pages is not None:
+            chunks = extract_chunks_from_pages(
+                file_input.pages,
+                file_name=file_input.name,
+                chunk_size=self.chunk_size,
+                min_characters_per_chunk=self.min_characters_per_chunk,
+            )
+
+        elif file_input.type == ".pdf":
             chunks = extract_chunks_from_pdf(
                 file_input.content,
                 file_name=file_input.name,
+                chunk_size=self.chunk_size,
+                min_characters_per_chunk=self.min_characters_per_chunk,
                 # embedding_model=self.text_embedder.model,
             )
 
+        elif file_input.type in OFFICE_FILE_TYPES:
+            pages = file_input.pages
+            if pages is None:
+                pages = parse_office_document(file_input.content, file_input.type).pages
+            chunks = extract_chunks_from_pages(
+                pages,
+                file_name=file_input.name,
+                chunk_size=self.chunk_size,
+                min_characters_per_chunk=self.min_characters_per_chunk,
+                file_type=file_input.type,
+                split_pages=True,
+            )
+
         elif file_input.type in {".jpg", ".jpeg", ".png", ".gif"}:
             chunks = extract_chunks_from_text(
                 file_input.full_text,
                 file_name=file_input.name,
+                chunk_size=self.chunk_size,
+                min_characters_per_chunk=self.min_characters_per_chunk,
                 file_type=file_input.type,
             )
         else:
             chunks = extract_chunks_from_text(
                 file_input.full_text,
                 file_name=file_input.name,
+                chunk_size=self.chunk_size,
+                min_characters_per_chunk=self.min_characters_per_chunk,
                 file_type=file_input.type,
                 # embedding_model=self.text_embedder.model,
             )
@@ -114,38 +170,58 @@ class DocumentIngestor:
         if not chunks:
             print(f"No chunks extracted from {file_input.name}")
             return []
+        return chunks
+
+    def embed_chunks(
+        self, chunks: list[DocumentChunk], file_name: str, document_id: str
+    ) -> list[ChunkCreate]:
+        """Embed chunks in batches, dropping the ones that fail."""
+        # Generate embeddings for the whole document in batches
+        embeddings, embedded_mask = self.text_embedder.get_embeddings_batched(
+            [chunk.chunk_text for chunk in chunks]
+        )
 
-        # Generate embeddings
         embedded_chunks: list[ChunkCreate] = []
-        for chunk in chunks:
+        for chunk, embedding, is_embedded in zip(chunks, embeddings, embedded_mask):
+            if not is_embedded:
+                print(f"Skipping chunk without embedding from {file_name}")
+                continue
             try:
-                embedding = self.text_embedder.get_embedding(text=chunk.chunk_text)
-                if embedding is not None:
-                    # Convert numpy array to list if needed
-                    embedding_list = (
-                        embedding.tolist()
-                        if hasattr(embedding, "tolist")
-                        else list(embedding)
-                    )
-
-                    chunk_with_embedding = ChunkCreate(
-                        chunk_text=chunk.chunk_text,
-                        page_number=chunk.chunk_metadata.page_number,
-                        start_char=chunk.chunk_metadata.start_index,
-                        end_char=chunk.chunk_metadata.end_index,
-                        token_count=chunk.chunk_metadata.token_count,
-                        embedding=embedding_list,
-                        document_id=document_id,
-                    )
-                    embedded_chunks.append(chunk_with_embedding)
+                chunk_with_embedding = ChunkCreate(
+                    chunk_text=chunk.chunk_text,
+                    page_number=chunk.chunk_metadata.page_number,
+                    start_char=chunk.chunk_metadata.start_index,
+                    end_char=chunk.chunk_metadata.end_index,
+                    token_count=chunk.chunk_metadata.token_count,
+                    embedding=embedding.tolist(),
+                    document_id=document_id,
+                )
+                embedded_chunks.append(chunk_with_embedding)
             except Exception as e:
-                print(f"Error embedding chunk from {file_input.name}: {e}")
+                print(f"Error embedding chunk from {file_name}: {e}")
 
         print(
-            f"Successfully embedded {len(embedded_chunks)}/{len(chunks)} chunks from {file_input.name}"
+            f"Successfully embedded {len(embedded_chunks)}/{len(chunks)} chunks from {file_name}"
         )
         return embedded_chunks
 
+    async def rebuild_chunks(
+        self, file_input: FileInput, document_id: str
+    ) -> list[ChunkCreate]:
+        """
+        Extract, chunk and embed a file without touching its stored chunks,
+        so an index can be rebuilt out of place.
+        """
+        file_input.full_text = await self.extract_full_text(file_input)
+        if not file_input.full_text:
+            return []
+        chunks = await asyncio.to_thread(self.chunk_file, file_input)
+        if not chunks:
+            return []
+        return await asyncio.to_thread(
+            self.embed_chunks, chunks, file_input.name, document_id
+        )
+
     async def extract_knowledge_graph(self, full_text: str) -> ExtractedGraph:
         """Extract knowledge graph from file content."""
         if not full_text:
@@ -187,6 +263,7 @@ class DocumentIngestorService(DocumentIngestor):
         summary_generator,
         chunk_size=512,
         min_characters_per_chunk=24,
+        chunk_batch_size=256,
     ):
         super().__init__(
             document_service,
@@ -195,6 +272,7 @@ class DocumentIngestorService(DocumentIngestor):
             summary_generator,
             chunk_size,
             min_characters_per_chunk,
+            chunk_batch_size,
         )
 
     async def extract_and_store_knowledge_graph(
@@ -236,46 +314,325 @@ class DocumentIngestorService(DocumentIngestor):
     ) -> Document:
         """Store the knowledge graph extracted from a file into the document system."""
         # update_document_with_graph(db_session, document.id, kg)
-        relation = self.document_service.create_document_relation(
+        relation = self.document_service.create_document_graph(
             relation_data=DocumentRelationCreate(
                 title=title,
                 description=description,
                 document_id=document_id,
             ),
+            nodes_data=kg.nodes,
+            edges_data=kg.edges,
             user=user,
         )
 
+        # create_document_graph sets is_graph_extracted in its transaction
+        document = None
         if relation:
-            # Create nodes and edges from the knowledge graph
-            for node in kg.nodes:
-                node_data = DocumentNodeCreate(
-                    title=node.title,
-                    description=node.description,
-                    type=node.type,
-                    label=node.label,
-                    document_relation_id=relation.id,
+            document = self.document_service.get_document(document_id)
+
+        return document
+
+    def reuse_processed_document(self, document: Document, user: User) -> bool:
+        """
+        Clone chunks, summary and graph from an already processed document with
+        the same content hash. Returns True when the artifacts were reused.
+        """
+        if not getattr(document, "content_hash", None):
+            return False
+
+        source = self.document_service.find_processed_document_by_hash(
+            document.content_hash,
+            user,
+            exclude_document_id=document.id,
+            embedding_model=self.text_embedder.model_name,
+        )
+        if not source:
+            return False
+
+        self.document_service.clone_document_artifacts(
+            source=source, target_id=document.id, user=user
+        )
+        print(f"Reused processed artifacts of document {source.id} for {document.id}")
+        return True
+
+    async def _summary_stage(
+        self,
+        input_file: FileInput,
+        document_id: str,
+        user: User,
+        metrics: IngestionMetrics,
+    ) -> None:
+        """Generate the document summary and store it as soon as it lands."""
+        with metrics.stage("summary"):
+            document_summary = await self.get_document_summary(
+                full_text=input_file.full_text, language="en"
+            )
+        if not (document_summary.title or document_summary.description):
+            # The generator swallows LLM errors; leave the checkpoint unset so
+            # a retry or re-ingestion summarizes again
+            print(f"No summary generated for {input_file.name}")
+            return
+        self.document_service.update_document(
+            document_id=document_id,
+            update_data=DocumentUpdate(
+                title=document_summary.title,
+                description=document_summary.description,
+                is_summarized=True,
+            ),
+            user=user,
+        )
+        print(
+            f"Document summary extracted for {input_file.name}: {document_summary.title} {(document_summary.description or '')[:100]}..."
+        )
+
+    @staticmethod
+    def _record_chunks(metrics: IngestionMetrics, chunks: list[ChunkCreate]) -> None:
+        metrics.chunk_count = len(chunks)
+        metrics.token_count = sum(chunk.token_count or 0 for chunk in chunks)
+
+    async def _vector_stage(
+        self,
+        input_file: FileInput,
+        document_id: str,
+        user: User,
+        metrics: IngestionMetrics,
+        resume_from: int = 0,
+    ) -> None:
+        """
+        Chunk the document, then embed and store the chunks in checkpointed
+        batches off the event loop.
+
+        When an earlier attempt persisted ``resume_from`` chunks, a retry skips
+        the leading chunks whose stable IDs are already stored and deletes
+        stored chunks the new chunking no longer produces.
+        """
+        with metrics.stage("chunking"):
+            chunks = await asyncio.to_thread(self.chunk_file, input_file)
+        if not chunks:
+            return
+
+        if resume_from:
+            stored_ids = {
+                row.id
+                for row in self.document_service.get_chunk_fingerprints(document_id)
+            }
+            resume_from = self.persisted_prefix(chunks, document_id, stored_ids)
+            stale_ids = stored_ids - {
+                self._chunk_id(chunk, document_id) for chunk in chunks[:resume_from]
+            }
+            if stale_ids:
+                self.document_service.apply_chunk_changes(
+                    inserts=[], updates=[], delete_ids=list(stale_ids), user=user
                 )
-                self.document_service.create_document_node(
-                    node_data=node_data, user=user
+            print(
+                f"Resuming {input_file.name} from chunk {resume_from}/{len(chunks)}, "
+                f"{len(stale_ids)} stale chunks removed"
+            )
+
+        embedded_chunks: list[ChunkCreate] = []
+        for start in range(
+            min(resume_from, len(chunks)), len(chunks), self.chunk_batch_size
+        ):
+            end = min(start + self.chunk_batch_size, len(chunks))
+            with metrics.stage("embedding"):
+                batch = await asyncio.to_thread(
+                    self.embed_chunks, chunks[start:end], input_file.name, document_id
                 )
-            for edge in kg.edges:
-                edge_data = DocumentEdgeCreate(
-                    label=edge.label,
-                    source=edge.source,
-                    target=edge.target,
-                    document_relation_id=relation.id,
+            with metrics.stage("store"):
+                self.document_service.persist_chunk_batch(
+                    document_id=document_id,
+                    chunks_data=batch,
+                    chunks_persisted=end,
+                    user=user,
                 )
-                self.document_service.create_document_edge(
-                    edge_data=edge_data, user=user
+            embedded_chunks.extend(batch)
+
+        self._record_chunks(metrics, embedded_chunks)
+        self.document_service.update_document(
+            document_id=document_id,
+            update_data=DocumentUpdate(
+                is_vectorized=True, embedding_model=self.text_embedder.model_name
+            ),
+            user=user,
+        )
+
+    @staticmethod
+    def _chunk_id(chunk: DocumentChunk, document_id: str) -> str:
+        return make_chunk_id(
+            document_id, chunk.chunk_metadata.start_index, chunk.chunk_text
+        )
+
+    @classmethod
+    def persisted_prefix(
+        cls, chunks: list[DocumentChunk], document_id: str, stored_ids: set[str]
+    ) -> int:
+        """Number of leading chunks already stored under their stable IDs."""
+        for index, chunk in enumerate(chunks):
+            if cls._chunk_id(chunk, document_id) not in stored_ids:
+                return index
+        return len(chunks)
+
+    @staticmethod
+    def diff_chunks(
+        chunks: list[DocumentChunk], existing: list
+    ) -> tuple[list[DocumentChunk], list[dict], list[str]]:
+        """
+        Match new chunks to existing chunk rows by content hash.
+
+        Returns the chunks that need embedding, position updates for matched
+        rows whose page or offsets moved, and the IDs of rows no longer present.
+        """
+        unmatched: dict[str, list] = {}
+        for row in existing:
+            unmatched.setdefault(row.content_hash, []).append(row)
+
+        new_chunks: list[DocumentChunk] = []
+        updates: list[dict] = []
+        for chunk in chunks:
+            rows = unmatched.get(hash_chunk_text(chunk.chunk_text))
+            if not rows:
+                new_chunks.append(chunk)
+                continue
+
+            row = rows.pop(0)
+            metadata = chunk.chunk_metadata
+            position = {
+                "page_number": metadata.page_number,
+                "start_char": metadata.start_index,
+                "end_char": metadata.end_index,
+                "token_count": metadata.token_count,
+            }
+            changes = {
+                column: value
+                for column, value in position.items()
+                if value is not None and value != getattr(row, column)
+            }
+            if changes:
+                updates.append({"id": row.id, **changes})
+
+        delete_ids = [row.id for rows in unmatched.values() for row in rows]
+        return new_chunks, updates, delete_ids
+
+    @staticmethod
+    def carry_page_numbers(chunks: list[DocumentChunk], existing: list) -> None:
+        """
+        Give chunks without a page number the page of the existing chunk that
+        starts at or just before them, e.g. when an edited PDF text is
+        re-chunked as plain text.
+        """
+        paged = sorted(
+            (row.start_char, row.page_number)
+            for row in existing
+            if row.page_number is not None and row.start_char is not None
+        )
+        if not paged:
+            return
+        starts = [start for start, _ in paged]
+        for chunk in chunks:
+            metadata = chunk.chunk_metadata
+            if metadata.page_number is not None:
+                continue
+            index = bisect.bisect_right(starts, metadata.start_index) - 1
+            metadata.page_number = paged[max(index, 0)][1]
+
+    async def _incremental_vector_stage(
+        self,
+        input_file: FileInput,
+        document_id: str,
+        user: User,
+        metrics: IngestionMetrics,
+    ) -> None:
+        """Re-chunk the document and only embed and write the chunks that changed."""
+        with metrics.stage("chunking"):
+            chunks = await asyncio.to_thread(self.chunk_file, input_file)
+        if not chunks:
+            # Likely an extraction failure; keep the chunks we already have
+            print(f"No chunks for {input_file.name}, keeping existing chunks")
+            return
+
+        existing = self.document_service.get_chunk_fingerprints(document_id)
+        self.carry_page_numbers(chunks, existing)
+        document = self.document_service.get_document(document_id)
+        if document and document.embedding_model == self.text_embedder.model_name:
+            new_chunks, updates, delete_ids = self.diff_chunks(chunks, existing)
+        else:
+            # Vectors of another model cannot be mixed with new ones
+            print(f"Embedding model changed for {input_file.name}, re-embedding all")
+            new_chunks, updates = chunks, []
+            delete_ids = [row.id for row in existing]
+
+        embedded_chunks = []
+        if new_chunks:
+            with metrics.stage("embedding"):
+                embedded_chunks = await asyncio.to_thread(
+                    self.embed_chunks, new_chunks, input_file.name, document_id
                 )
+        self._record_chunks(metrics, embedded_chunks)
+        with metrics.stage("store"):
+            self.document_service.apply_chunk_changes(
+                inserts=embedded_chunks,
+                updates=updates,
+                delete_ids=delete_ids,
+                user=user,
+            )
+        print(
+            f"Incremental re-ingestion of {input_file.name}: "
+            f"{len(chunks) - len(new_chunks)} unchanged, {len(embedded_chunks)} added, "
+            f"{len(updates)} moved, {len(delete_ids)} removed"
+        )
+        self.document_service.update_document(
+            document_id=document_id,
+            update_data=DocumentUpdate(
+                is_vectorized=True, embedding_model=self.text_embedder.model_name
+            ),
+            user=user,
+        )
 
-            document = self.document_service.update_document(
+    async def reindex_document_text(self, document: Document, user: User) -> None:
+        """Incrementally re-chunk a document from its stored text."""
+        # Chunk as plain text whatever the source format (the parsed pages are
+        # not stored); page numbers are carried over from the existing chunks
+        input_file = FileInput(
+            content=document.document or "",
+            file_name=document.file_name,
+            full_text=document.document or "",
+            name=document.file_name,
+            type=".txt",
+        )
+        metrics = IngestionMetrics()
+        await self._incremental_vector_stage(input_file, document.id, user, metrics)
+        print(f"Re-chunked {document.file_name}: {metrics.summary()}")
+
+    async def _graph_stage(
+        self,
+        input_file: FileInput,
+        document_id: str,
+        user: User,
+        metrics: IngestionMetrics,
+    ) -> None:
+        """Extract and store the knowledge graph."""
+        with metrics.stage("graph"):
+            document = await self.extract_and_store_knowledge_graph(
+                full_text=input_file.full_text,
+                title=input_file.name,
+                description=input_file.full_text[:200],
                 document_id=document_id,
-                update_data=DocumentUpdate(is_graph_extracted=True),
                 user=user,
             )
+        if not document:
+            print(f"Failed to extract knowledge graph for {input_file.name}")
 
-        return document
+    @staticmethod
+    async def _run_stages(stages: list[Awaitable[None]]) -> None:
+        """Run independent stages concurrently; cancel the rest if one fails."""
+        tasks = [asyncio.ensure_future(stage) for stage in stages]
+        try:
+            await asyncio.gather(*tasks)
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            raise
 
     async def ingest_file(
         self,
@@ -283,19 +640,25 @@ class DocumentIngestorService(DocumentIngestor):
         document: Document,
         graph_extract: bool,
         user: User,
+        incremental: bool = False,
     ) -> None:
         """
         Ingest a single file: extract text, generate knowledge graph, chunk, embed, and store.
 
+        After text extraction the summary, chunk/embed and (optional) knowledge
+        graph stages are independent, so they run concurrently and each one
+        persists its own result when it completes.
+
         Args:
-            db_session: Database session
             input_file: File path (str) or FileInput model instance
-            collection_id: Collection UUID string
+            document: Document record to ingest into
+            graph_extract: Whether to extract a knowledge graph
             user: User model instance
-
-        Returns:
-            Document: The created document record
+            incremental: Re-ingest an existing document, re-embedding only
+                the chunks whose text changed
         """
+        metrics = IngestionMetrics()
+        run_id = self._start_run(document.id, user, incremental)
         try:
             # update document status to processing
             self.document_service.update_document(
@@ -304,60 +667,88 @@ class DocumentIngestorService(DocumentIngestor):
                 user=user,
             )
 
-            # extract document summary
-            full_text = await self.extract_full_text(input_file)
-            print(
-                f"Extracted full text from {input_file.name}: {len(full_text)} characters"
-            )
-            print(full_text[:1000])  # Print first 1000 characters for debugging
-            input_file.full_text = full_text
-            document_summary = await self.get_document_summary(
-                full_text=input_file.full_text, language="en"
-            )
-            self.document_service.update_document(
-                document_id=document.id,
-                update_data=DocumentUpdate(
-                    title=document_summary.title,
-                    document=full_text,
-                    description=document_summary.description,
-                ),
-                user=user,
+            # a previous attempt got partway; resume from its checkpoints
+            resuming = not incremental and (
+                document.is_text_extracted or document.chunks_persisted > 0
             )
-            print(
-                f"Document summary extracted for {input_file.name}: {document_summary.title} {document_summary.description[:100]}..."
+
+            # identical file already processed: copy its results instead
+            if (
+                not incremental
+                and not resuming
+                and self.reuse_processed_document(document, user)
+            ):
+                cloned = self.document_service.get_document(document.id)
+                if graph_extract and not cloned.is_graph_extracted:
+                    input_file.full_text = cloned.document or ""
+                    await self._graph_stage(input_file, document.id, user, metrics)
+
+                self.document_service.update_document(
+                    document_id=document.id,
+                    update_data=DocumentUpdate(status=enum.IngestionStatus.ready),
+                    user=user,
+                )
+                self._finish_run(run_id, enum.IngestionStatus.ready, metrics)
+                return
+
+            needs_vectors = incremental or not document.is_vectorized
+            # Paged chunking needs the parsed pages, which are not stored
+            reuse_text = resuming and not (
+                needs_vectors and input_file.type in {".pdf", *OFFICE_FILE_TYPES}
             )
 
+            # extract full text, which every later stage depends on
+            if reuse_text:
+                print(f"Resuming {input_file.name} from its stored text")
+                input_file.full_text = document.document or ""
+            else:
+                with metrics.stage("extraction"):
+                    full_text = await self.extract_full_text(input_file)
+                metrics.page_count = len(input_file.pages) if input_file.pages else None
+                print(
+                    f"Extracted full text from {input_file.name}: {len(full_text)} characters"
+                )
+                print(full_text[:1000])  # Print first 1000 characters for debugging
+                input_file.full_text = full_text
+                self.document_service.update_document(
+                    document_id=document.id,
+                    update_data=DocumentUpdate(
+                        document=full_text, is_text_extracted=True
+                    ),
+                    user=user,
+                )
+
+            stages = []
+            if incremental or not document.is_summarized:
+                stages.append(
+                    self._summary_stage(input_file, document.id, user, metrics)
+                )
+
             # Extract and store vector chunks if not already done
-            if not document.is_vectorized:
-                embedded_chunks = self.chunk_and_embed(
-                    file_input=input_file, document_id=document.id
+            if incremental:
+                stages.append(
+                    self._incremental_vector_stage(
+                        input_file, document.id, user, metrics
+                    )
                 )
-                if embedded_chunks:
-                    for chunk in embedded_chunks:
-                        self.document_service.create_chunk(
-                            chunk_data=chunk,
-                            user=user,
-                        )
-
-                    document = self.document_service.update_document(
-                        document_id=document.id,
-                        update_data=DocumentUpdate(is_vectorized=True),
-                        user=user,
+            elif not document.is_vectorized:
+                stages.append(
+                    self._vector_stage(
+                        input_file,
+                        document.id,
+                        user,
+                        metrics,
+                        resume_from=document.chunks_persisted,
                     )
+                )
 
             # Extract knowledge graph if not already done (Optional)
             if not document.is_graph_extracted and graph_extract:
-                document = await self.extract_and_store_knowledge_graph(
-                    full_text=input_file.full_text,
-                    title=input_file.name,
-                    description=input_file.full_text[:200],
-                    document_id=document.id,
-                    user=user,
-                )
-                if not document:
-                    print(f"Failed to extract knowledge graph for {input_file.name}")
+                stages.append(self._graph_stage(input_file, document.id, user, metrics))
+
+            await self._run_stages(stages)
 
-            print(f"Finished processing {input_file.name}")
+            print(f"Finished processing {input_file.name}: {metrics.summary()}")
 
             # update status to completed
             self.document_service.update_document(
@@ -365,6 +756,7 @@ class DocumentIngestorService(DocumentIngestor):
                 update_data=DocumentUpdate(status=enum.IngestionStatus.ready),
                 user=user,
             )
+            self._finish_run(run_id, enum.IngestionStatus.ready, metrics)
 
         except Exception as e:
             print(f"Error ingesting file {input_file.name}: {e}")
@@ -375,4 +767,42 @@ class DocumentIngestorService(DocumentIngestor):
                 update_data=DocumentUpdate(status=enum.IngestionStatus.failed),
                 user=user,
             )
+            self._finish_run(run_id, enum.IngestionStatus.failed, metrics, error=str(e))
             raise e
+
+    def _start_run(
+        self, document_id: str, user: User, incremental: bool
+    ) -> Optional[str]:
+        """Record the run start; never fails the ingestion itself."""
+        try:
+            run = self.document_service.start_ingestion_run(
+                document_id, user, incremental=incremental
+            )
+            return run.id
+        except Exception as e:
+            print(f"Failed to record ingestion run for {document_id}: {e}")
+            return None
+
+    def _finish_run(
+        self,
+        run_id: Optional[str],
+        status: enum.IngestionStatus,
+        metrics: IngestionMetrics,
+        error: Optional[str] = None,
+    ) -> None:
+        """Persist the run metrics; never fails the ingestion itself."""
+        if run_id is None:
+            return
+        try:
+            self.document_service.finish_ingestion_run(
+                run_id,
+                status=status,
+                duration_seconds=metrics.elapsed_seconds,
+                stage_timings=metrics.stage_seconds,
+                page_count=metrics.page_count,
+                chunk_count=metrics.chunk_count,
+                token_count=metrics.token_count,
+                error=error,
+            )
+        except Exception as e:
+            print(f"Failed to record ingestion run {run_id}: {e}")
@@ -1,4 +1,12 @@
+import asyncio
+import bisect
+import multiprocessing
 import re
+import tempfile
+import threading
+from collections.abc import Iterator
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
 from typing import Optional, Union
 
 import fitz  # PyMuPDF
@@ -12,7 +20,8 @@ from chonkie import (
     SentenceTransformerEmbeddings,
 )
 
-from .schemas import ChunkMetadata, DocumentChunk
+from ....config import get_settings
+from .schemas import ChunkMetadata, DocumentChunk, PageText, ParsedDocument
 from .typhoon_ocr.ocr_utils import ocr_image_document
 
 
@@ -23,6 +32,50 @@ def _normalize_file_type(file_type: str) -> str:
     return file_type.lower()
 
 
+_chunkers: dict[tuple, Union[LateChunker, RecursiveChunker]] = {}
+_chunker_locks: dict[tuple, threading.Lock] = {}
+_chunkers_lock = threading.Lock()
+
+
+def _get_chunker(
+    chunk_size: int,
+    min_characters_per_chunk: int,
+    embedding_model: Optional[
+        Union[str, SentenceTransformerEmbeddings, Model2VecEmbeddings]
+    ] = None,
+) -> tuple[Union[LateChunker, RecursiveChunker], threading.Lock]:
+    """
+    Get the shared chunker for a (chunk_size, min_chars, model) config.
+
+    Building a chunker loads its tokenizer (and for late chunking, the
+    embedding model), so instances are created once per config and reused.
+    The returned lock serializes calls, as tokenizers are not thread safe.
+    """
+    # Model names hash by value, embedding objects by identity
+    key = (chunk_size, min_characters_per_chunk, embedding_model)
+    with _chunkers_lock:
+        if key not in _chunkers:
+            if embedding_model:
+                _chunkers[key] = LateChunker(
+                    embedding_model=embedding_model,
+                    chunk_size=chunk_size,
+                    min_characters_per_chunk=min_characters_per_chunk,
+                )
+            else:
+                _chunkers[key] = RecursiveChunker(
+                    chunk_size=chunk_size,
+                    min_characters_per_chunk=min_characters_per_chunk,
+                )
+            _chunker_locks[key] = threading.Lock()
+        return _chunkers[key], _chunker_locks[key]
+
+
+def _page_number_at(page_starts: list[int], pages: list[PageText], offset: int) -> int:
+    """Map an offset in the document full text to the page containing it."""
+    index = max(bisect.bisect_right(page_starts, offset) - 1, 0)
+    return pages[index].page_number
+
+
 def _chunk_text(
     text: str,
     file_name: str,
@@ -33,26 +86,26 @@ def _chunk_text(
     embedding_model: Optional[
         Union[str, SentenceTransformerEmbeddings, Model2VecEmbeddings]
     ] = None,
+    pages: Optional[list[PageText]] = None,
 ) -> list[DocumentChunk]:
-    """Create chunks from text using consistent chunking logic."""
+    """
+    Create chunks from text using consistent chunking logic.
+
+    When ``pages`` is given, ``text`` is the document full text and each chunk
+    is assigned the page its start offset falls on.
+    """
     if not text.strip():
         return []
 
     document_chunks: list[LateChunk] | list[RecursiveChunk] | list[SemanticChunk]
 
-    if embedding_model:
-        chunker = LateChunker(
-            embedding_model=embedding_model,
-            chunk_size=chunk_size,
-            min_characters_per_chunk=min_characters_per_chunk,
-        )
-
-    else:
-        chunker = RecursiveChunker(
-            chunk_size=chunk_size, min_characters_per_chunk=min_characters_per_chunk
-        )
+    chunker, lock = _get_chunker(
+        chunk_size, min_characters_per_chunk, embedding_model=embedding_model
+    )
+    with lock:
+        document_chunks = chunker(text=text, show_progress=False)
 
-    document_chunks = chunker(text=text, show_progress=False)
+    page_starts = [page.start_offset for page in pages] if pages else []
 
     chunk_documents = []
 
@@ -63,7 +116,11 @@ def _chunk_text(
             token_count=chunk.token_count,
             level=chunk.level,
         )
-        if page_number is not None:
+        if pages:
+            metadata.page_number = _page_number_at(
+                page_starts, pages, chunk.start_index
+            )
+        elif page_number is not None:
             metadata.page_number = page_number
 
         chunk_data = DocumentChunk(
@@ -85,58 +142,311 @@ def preprocess_content(
     return content
 
 
-def extract_chunks_from_pdf(
+def _open_pdf(file_input: Union[str, bytes]) -> fitz.Document:
+    """Open a PDF from a file path or bytes."""
+    if isinstance(file_input, str):
+        # File path
+        return fitz.open(file_input)
+    elif isinstance(file_input, bytes):
+        # Validate that bytes content is not empty
+        if not file_input:
+            raise ValueError("PDF bytes content is empty")
+        return fitz.open(stream=file_input, filetype="pdf")
+    raise TypeError("file_input must be a string (path) or bytes.")
+
+
+def _extract_page_range(
+    file_input: Union[str, bytes], start: int, end: int
+) -> list[str]:
+    """Extract preprocessed text for pages [start, end). Runs in a worker process."""
+    doc = _open_pdf(file_input)
+    try:
+        return [
+            preprocess_content(doc.load_page(page_num).get_text("text"))
+            for page_num in range(start, end)
+        ]
+    finally:
+        doc.close()
+
+
+_pdf_pool: Optional[ProcessPoolExecutor] = None
+_pdf_pool_workers = 0
+# Extractions currently running on each pool, by pool
+_pdf_pool_users: dict[ProcessPoolExecutor, int] = {}
+_pdf_pool_lock = threading.Lock()
+
+
+@contextmanager
+def _use_pdf_pool(max_workers: int) -> Iterator[ProcessPoolExecutor]:
+    """
+    Borrow the shared process pool for page-parallel extraction.
+
+    A change of worker count replaces the shared pool, but a replaced pool
+    is only shut down once the last extraction using it has finished.
+    """
+    global _pdf_pool, _pdf_pool_workers
+    with _pdf_pool_lock:
+        if _pdf_pool is None or max_workers != _pdf_pool_workers:
+            retired = _pdf_pool
+            # spawn avoids forking a parent that already holds model threads
+            _pdf_pool = ProcessPoolExecutor(
+                max_workers=max_workers,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+            _pdf_pool_workers = max_workers
+            if retired is not None and not _pdf_pool_users.get(retired):
+                retired.shutdown(wait=False)
+        pool = _pdf_pool
+        _pdf_pool_users[pool] = _pdf_pool_users.get(pool, 0) + 1
+
+    try:
+        yield pool
+    finally:
+        with _pdf_pool_lock:
+            _pdf_pool_users[pool] -= 1
+            if not _pdf_pool_users[pool]:
+                del _pdf_pool_users[pool]
+                if pool is not _pdf_pool:
+                    pool.shutdown(wait=False)
+
+
+def _extract_page_texts(
+    file_input: Union[str, bytes],
+    page_count: int,
+    parallel_page_threshold: int,
+    max_workers: int,
+) -> list[str]:
+    """Extract page texts, splitting large documents across worker processes."""
+    if max_workers <= 1 or page_count < parallel_page_threshold:
+        return _extract_page_range(file_input, 0, page_count)
+
+    # A few ranges per worker keeps the pool busy when pages vary in cost
+    range_size = max(1, -(-page_count // (max_workers * 4)))
+    ranges = [
+        (start, min(start + range_size, page_count))
+        for start in range(0, page_count, range_size)
+    ]
+    # Hand workers a path instead of pickling the PDF bytes for every range
+    with tempfile.NamedTemporaryFile(suffix=".pdf") as tmp:
+        if isinstance(file_input, bytes):
+            tmp.write(file_input)
+            tmp.flush()
+            file_input = tmp.name
+
+        with _use_pdf_pool(max_workers) as pool:
+            futures = [
+                pool.submit(_extract_page_range, file_input, start, end)
+                for start, end in ranges
+            ]
+
+            # Merge in page order
+            page_texts: list[str] = []
+            for future in futures:
+                page_texts.extend(future.result())
+    return page_texts
+
+
+def parse_pdf_document(
     file_input: Union[str, bytes],
+    parallel_page_threshold: Optional[int] = None,
+    max_workers: Optional[int] = None,
+) -> ParsedDocument:
+    """
+    Parse a PDF once into per-page text with offsets into the full text.
+
+    The full text is the page texts joined with newlines, so
+    ``full_text[page.start_offset:page.end_offset] == page.text``.
+
+    Documents with at least ``parallel_page_threshold`` pages are extracted in
+    page ranges across ``max_workers`` processes (defaults from settings).
+    """
+    settings = get_settings()
+    if parallel_page_threshold is None:
+        parallel_page_threshold = settings.PDF_PARALLEL_PAGE_THRESHOLD
+    if max_workers is None:
+        max_workers = settings.PDF_PARALLEL_WORKERS
+
+    doc = _open_pdf(file_input)
+    try:
+        page_count = len(doc)
+    finally:
+        doc.close()
+
+    page_texts = _extract_page_texts(
+        file_input, page_count, parallel_page_threshold, max_workers
+    )
+
+    return _build_parsed_document(page_texts)
+
+
+def _build_parsed_document(page_texts: list[str]) -> ParsedDocument:
+    """Lay out page texts into a ParsedDocument with full-text offsets."""
+    pages: list[PageText] = []
+    offset = 0
+    for page_num, page_text in enumerate(page_texts):
+        pages.append(
+            PageText(
+                page_number=page_num + 1,  # Page numbers are 1-based
+                text=page_text,
+                start_offset=offset,
+                end_offset=offset + len(page_text),
+            )
+        )
+        offset += len(page_text) + 1  # account for the joining newline
+
+    # Not stripped: page offsets index into exactly this string
+    return ParsedDocument(pages=pages, full_text="\n".join(page_texts))
+
+
+def _render_page_png(file_input: Union[str, bytes], page_index: int, dpi: int) -> bytes:
+    """Render a single PDF page to PNG bytes."""
+    doc = _open_pdf(file_input)
+    try:
+        return doc.load_page(page_index).get_pixmap(dpi=dpi).tobytes("png")
+    finally:
+        doc.close()
+
+
+async def _ocr_pdf_page(
+    file_input: Union[str, bytes], page_number: int, dpi: int, retries: int
+) -> str:
+    """Render and OCR one PDF page, retrying transient VLM failures."""
+    image = await asyncio.to_thread(_render_page_png, file_input, page_number - 1, dpi)
+    for attempt in range(retries + 1):
+        try:
+            text = await ocr_image_document(image, task_type="default")
+            return preprocess_content(text.strip())
+        except Exception as e:
+            if attempt == retries:
+                print(
+                    f"OCR failed for page {page_number} after {attempt + 1} tries: {e}"
+                )
+                return ""
+            await asyncio.sleep(2**attempt)
+    return ""
+
+
+async def ocr_text_less_pages(
+    file_input: Union[str, bytes],
+    parsed: ParsedDocument,
+    max_concurrency: Optional[int] = None,
+    retries: Optional[int] = None,
+    dpi: Optional[int] = None,
+    min_characters: Optional[int] = None,
+) -> ParsedDocument:
+    """
+    OCR the pages of a parsed PDF that have no usable text layer.
+
+    Pages with fewer than ``min_characters`` characters are rendered and sent
+    to the VLM concurrently, at most ``max_concurrency`` pages at a time; the
+    requests of all pages and image tiles share the PDF_OCR_CONCURRENCY cap of
+    ``ocr_image_document``. Results are merged back in page order; pages
+    whose OCR fails keep their text.
+    """
+    settings = get_settings()
+    max_concurrency = max_concurrency or settings.PDF_OCR_CONCURRENCY
+    retries = settings.PDF_OCR_RETRIES if retries is None else retries
+    dpi = dpi or settings.PDF_OCR_DPI
+    if min_characters is None:
+        min_characters = settings.PDF_OCR_MIN_CHARACTERS
+
+    targets = [
+        page.page_number
+        for page in parsed.pages
+        if len(page.text.strip()) < min_characters
+    ]
+    if not targets:
+        return parsed
+
+    print(f"OCR on {len(targets)} of {len(parsed.pages)} pages without a text layer")
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def ocr_page(page_number: int) -> str:
+        # Render inside the semaphore so only in-flight pages are in memory
+        async with semaphore:
+            return await _ocr_pdf_page(file_input, page_number, dpi, retries)
+
+    results = await asyncio.gather(*(ocr_page(number) for number in targets))
+
+    page_texts = [page.text for page in parsed.pages]
+    for page_number, text in zip(targets, results):
+        if text:
+            page_texts[page_number - 1] = text
+    return _build_parsed_document(page_texts)
+
+
+async def parse_pdf_document_async(
+    file_input: Union[str, bytes], ocr: Optional[bool] = None
+) -> ParsedDocument:
+    """Parse a PDF off the event loop, OCR-ing scanned pages when enabled."""
+    parsed = await asyncio.to_thread(parse_pdf_document, file_input)
+    if ocr is None:
+        ocr = get_settings().PDF_OCR_ENABLED
+    if ocr:
+        parsed = await ocr_text_less_pages(file_input, parsed)
+    return parsed
+
+
+def _parse_pdf_document_sync(file_input: Union[str, bytes]) -> ParsedDocument:
+    """Parse a PDF with OCR from synchronous code."""
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(parse_pdf_document_async(file_input))
+
+    # Cannot block on OCR inside a running loop; callers there should await
+    # parse_pdf_document_async instead
+    print("Event loop is running, parsing PDF without OCR")
+    return parse_pdf_document(file_input)
+
+
+def extract_chunks_from_pages(
+    pages: list[PageText],
     file_name: str,
     chunk_size: int = 512,
     min_characters_per_chunk: int = 24,
     embedding_model: Optional[Union[str, SentenceTransformerEmbeddings]] = None,
+    file_type: str = ".pdf",
+    split_pages: bool = False,
 ) -> list[DocumentChunk]:
-    """Extract and chunk text from a PDF file."""
-    try:
-        if isinstance(file_input, str):
-            # File path
-            doc = fitz.open(file_input)
-        elif isinstance(file_input, bytes):
-            # Validate that bytes content is not empty
-            if not file_input:
-                raise ValueError("PDF bytes content is empty")
-            doc = fitz.open(stream=file_input, filetype="pdf")
-        else:
-            raise TypeError("file_input must be a string (path) or bytes.")
-    except Exception as e:
-        print(f"Error opening PDF {file_name}: {e}")
-        return []
+    """
+    Chunk already parsed pages as one document.
+
+    Chunks may span page breaks; each one is tagged with the page it starts on.
+    With ``split_pages`` every page is chunked on its own instead, so no chunk
+    crosses a page (a sheet or slide for office files). Offsets still refer to
+    the document full text.
+    """
+    normalized_type = _normalize_file_type(file_type)
 
-    try:
+    if split_pages:
         chunk_list = []
-        for page_num in range(len(doc)):
-            page = doc.load_page(page_num)
-            page_text = page.get_text()
-            if page_text:
-                page_text = preprocess_content(page_text)
-
-                if not page_text.strip():
-                    print(f"No text extracted from page {page_num + 1} of {file_name}")
-                    continue
-
-                normalized_type = _normalize_file_type(".pdf")
-
-                chunks = _chunk_text(
-                    page_text,
-                    file_name,
-                    normalized_type,
-                    chunk_size,
-                    min_characters_per_chunk,
-                    page_number=page_num + 1,  # Page numbers are 1-based
-                    embedding_model=embedding_model,
-                )
-
-                if chunks:
-                    chunk_list.extend(chunks)
-
-    finally:
-        doc.close()
+        for page in pages:
+            page_chunks = _chunk_text(
+                page.text,
+                file_name,
+                normalized_type,
+                chunk_size,
+                min_characters_per_chunk,
+                page_number=page.page_number,
+                embedding_model=embedding_model,
+            )
+            for chunk in page_chunks:
+                chunk.chunk_metadata.start_index += page.start_offset
+                chunk.chunk_metadata.end_index += page.start_offset
+            chunk_list.extend(page_chunks)
+    else:
+        # Same layout as ParsedDocument.full_text, so page offsets line up
+        full_text = "\n".join(page.text for page in pages)
+        chunk_list = _chunk_text(
+            full_text,
+            file_name,
+            normalized_type,
+            chunk_size,
+            min_characters_per_chunk,
+            embedding_model=embedding_model,
+            pages=pages,
+        )
 
     if not chunk_list:
         print(f"No text extracted from {file_name}")
@@ -144,6 +454,29 @@ def extract_chunks_from_pdf(
     return chunk_list
 
 
+def extract_chunks_from_pdf(
+    file_input: Union[str, bytes],
+    file_name: str,
+    chunk_size: int = 512,
+    min_characters_per_chunk: int = 24,
+    embedding_model: Optional[Union[str, SentenceTransformerEmbeddings]] = None,
+) -> list[DocumentChunk]:
+    """Extract and chunk text from a PDF file."""
+    try:
+        parsed = _parse_pdf_document_sync(file_input)
+    except Exception as e:
+        print(f"Error opening PDF {file_name}: {e}")
+        return []
+
+    return extract_chunks_from_pages(
+        parsed.pages,
+        file_name,
+        chunk_size,
+        min_characters_per_chunk,
+        embedding_model=embedding_model,
+    )
+
+
 def extract_chunks_from_text_file(
     file_input: Union[str, bytes],
     file_name: str,
@@ -177,22 +510,7 @@ def extract_text_from_pdf_file(
     file_input: Union[str, bytes],
 ) -> str:
     """Extract text from a PDF file."""
-    if isinstance(file_input, str):
-        doc = fitz.open(file_input)
-    else:
-        # Validate that content is not empty before opening
-        if not file_input:
-            raise ValueError("PDF content is empty")
-        doc = fitz.open(stream=file_input, filetype="pdf")
-
-    full_text = ""
-    try:
-        for page in doc:
-            full_text += page.get_text("text") + "\n"
-    finally:
-        doc.close()
-
-    return preprocess_content(full_text.strip())
+    return _parse_pdf_document_sync(file_input).full_text.strip()
 
 
 def extract_text_from_text_file(
@@ -0,0 +1,99 @@
+"""Per-stage timing and throughput metrics for document ingestion."""
+
+import bisect
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from typing import Any, Optional
+
+STAGES = ("extraction", "summary", "chunking", "embedding", "store", "graph")
+
+# Upper bounds (seconds) of the stage duration histogram buckets
+DURATION_BUCKETS = (0.1, 0.5, 1, 2.5, 5, 10, 30, 60, 120, 300, 600)
+# Upper bounds of the pages/sec and chunks/sec histogram buckets
+THROUGHPUT_BUCKETS = (0.5, 1, 2, 5, 10, 25, 50, 100, 250, 500, 1000)
+
+
+class IngestionMetrics:
+    """Collects stage wall times and size counters for one ingestion run."""
+
+    def __init__(self):
+        self.stage_seconds: dict[str, float] = {}
+        self.page_count: Optional[int] = None
+        self.chunk_count: Optional[int] = None
+        self.token_count: Optional[int] = None
+        self._started = time.perf_counter()
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        """Time a block; repeated stages accumulate."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - start
+            self.stage_seconds[name] = self.stage_seconds.get(name, 0.0) + elapsed
+
+    @property
+    def elapsed_seconds(self) -> float:
+        return time.perf_counter() - self._started
+
+    def summary(self) -> str:
+        """One-line human readable summary for logs."""
+        stages = ", ".join(f"{k}={v:.2f}s" for k, v in self.stage_seconds.items())
+        return f"total={self.elapsed_seconds:.2f}s ({stages})"
+
+
+def _histogram(values: list[float], buckets: tuple[float, ...]) -> dict[str, Any]:
+    """Cumulative Prometheus-style histogram with a few percentiles."""
+    values = sorted(values)
+    counts = [bisect.bisect_right(values, bound) for bound in buckets]
+
+    def percentile(q: float) -> Optional[float]:
+        if not values:
+            return None
+        return values[min(len(values) - 1, int(q * len(values)))]
+
+    return {
+        "buckets": [
+            {"le": bound, "count": count} for bound, count in zip(buckets, counts)
+        ]
+        + [{"le": "+Inf", "count": len(values)}],
+        "count": len(values),
+        "sum": sum(values),
+        "p50": percentile(0.5),
+        "p95": percentile(0.95),
+    }
+
+
+def build_ingestion_histograms(runs: list) -> dict[str, Any]:
+    """
+    Aggregate finished ingestion runs into per-stage duration histograms and
+    pages/sec and chunks/sec throughput histograms.
+    """
+    stage_values: dict[str, list[float]] = {stage: [] for stage in STAGES}
+    totals: list[float] = []
+    pages_per_second: list[float] = []
+    chunks_per_second: list[float] = []
+
+    for run in runs:
+        for stage, seconds in (run.stage_timings or {}).items():
+            stage_values.setdefault(stage, []).append(seconds)
+        if not run.duration_seconds:
+            continue
+        totals.append(run.duration_seconds)
+        if run.page_count:
+            pages_per_second.append(run.page_count / run.duration_seconds)
+        if run.chunk_count:
+            chunks_per_second.append(run.chunk_count / run.duration_seconds)
+
+    return {
+        "runs": len(runs),
+        "total_seconds": _histogram(totals, DURATION_BUCKETS),
+        "stage_seconds": {
+            stage: _histogram(values, DURATION_BUCKETS)
+            for stage, values in stage_values.items()
+        },
+        "pages_per_second": _histogram(pages_per_second, THROUGHPUT_BUCKETS),
+        "chunks_per_second": _histogram(chunks_per_second, THROUGHPUT_BUCKETS),
+    }
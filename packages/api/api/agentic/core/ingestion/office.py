@@ -0,0 +1,276 @@
+"""Streaming text extraction for DOCX, XLSX and PPTX files.
+
+Office Open XML files are zip containers of XML parts. Each part is read
+with ``iterparse`` straight from the zip stream, and consumed elements are
+dropped from their container, so memory stays flat however large a sheet or
+document is. Sheets and slides come out as separate pages so that chunks
+can respect their boundaries.
+"""
+
+import io
+import posixpath
+import xml.etree.ElementTree as ET
+import zipfile
+from collections.abc import Iterator
+from typing import Union
+
+from .ingest_methods import _build_parsed_document, preprocess_content
+from .schemas import ParsedDocument
+
+OFFICE_FILE_TYPES = {".docx", ".xlsx", ".pptx"}
+
+_WORD_NS = "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}"
+_DRAWING_NS = "{http://schemas.openxmlformats.org/drawingml/2006/main}"
+_REL_ID = "{http://schemas.openxmlformats.org/officeDocument/2006/relationships}id"
+
+
+def _local(tag: str) -> str:
+    """Strip the namespace from an element tag."""
+    return tag.rsplit("}", 1)[-1]
+
+
+def _open_zip(file_input: Union[str, bytes]) -> zipfile.ZipFile:
+    if isinstance(file_input, bytes):
+        return zipfile.ZipFile(io.BytesIO(file_input))
+    return zipfile.ZipFile(file_input)
+
+
+def _relationship_targets(archive: zipfile.ZipFile, part: str) -> dict[str, str]:
+    """Map relationship ids of ``part`` to the archive paths they point to."""
+    folder, name = posixpath.split(part)
+    rels_path = posixpath.join(folder, "_rels", f"{name}.rels")
+    if rels_path not in archive.NameToInfo:
+        return {}
+
+    targets = {}
+    with archive.open(rels_path) as stream:
+        for _, element in ET.iterparse(stream):
+            if _local(element.tag) != "Relationship":
+                continue
+            if element.get("TargetMode") == "External":
+                continue
+            target = element.get("Target", "")
+            if target.startswith("/"):
+                path = target.lstrip("/")
+            else:
+                path = posixpath.normpath(posixpath.join(folder, target))
+            targets[element.get("Id", "")] = path
+    return targets
+
+
+def _ordered_parts(
+    archive: zipfile.ZipFile, part: str, item_tag: str
+) -> list[tuple[ET.Element, str]]:
+    """
+    List the sheets or slides referenced by ``part`` (workbook.xml or
+    presentation.xml) in document order, as (element, archive path) pairs.
+    """
+    targets = _relationship_targets(archive, part)
+    parts = []
+    with archive.open(part) as stream:
+        for _, element in ET.iterparse(stream):
+            if _local(element.tag) != item_tag:
+                continue
+            path = targets.get(element.get(_REL_ID, ""))
+            if path and path in archive.NameToInfo:
+                parts.append((element, path))
+    return parts
+
+
+def _docx_sections(archive: zipfile.ZipFile) -> list[str]:
+    """Paragraph and table text of a DOCX body, split at hard page breaks."""
+    sections: list[str] = []
+    lines: list[str] = []
+    runs: list[str] = []
+    cell: list[str] = []
+    row: list[str] = []
+    table_depth = 0
+    body = None
+
+    with archive.open("word/document.xml") as stream:
+        for event, element in ET.iterparse(stream, events=("start", "end")):
+            tag = _local(element.tag)
+            if event == "start":
+                if tag == "body":
+                    body = element
+                elif tag == "tbl":
+                    table_depth += 1
+                continue
+
+            if tag == "t":
+                runs.append(element.text or "")
+            elif tag == "tab":
+                runs.append("\t")
+            elif tag == "br" and element.get(f"{_WORD_NS}type") == "page":
+                if runs:
+                    lines.append("".join(runs).strip())
+                    runs = []
+                sections.append("\n".join(line for line in lines if line))
+                lines = []
+            elif tag in ("br", "cr"):
+                runs.append("\n")
+            elif tag == "p":
+                text = "".join(runs).strip()
+                runs = []
+                if text:
+                    (cell if table_depth else lines).append(text)
+            elif tag == "tc":
+                row.append(" ".join(cell))
+                cell = []
+            elif tag == "tr":
+                row_text = " | ".join(value for value in row if value)
+                row = []
+                if row_text:
+                    lines.append(row_text)
+            elif tag == "tbl":
+                table_depth -= 1
+
+            # Top-level blocks are fully consumed once they end
+            if tag in ("p", "tbl") and not table_depth and body is not None:
+                body.clear()
+
+    sections.append("\n".join(line for line in lines if line))
+    return sections
+
+
+def _shared_strings(archive: zipfile.ZipFile) -> list[str]:
+    """Shared string table of an XLSX workbook."""
+    path = "xl/sharedStrings.xml"
+    if path not in archive.NameToInfo:
+        return []
+
+    strings = []
+    parts: list[str] = []
+    table = None
+    # Phonetic hints (rPh) hold readings, not cell text
+    in_phonetic = False
+    with archive.open(path) as stream:
+        for event, element in ET.iterparse(stream, events=("start", "end")):
+            tag = _local(element.tag)
+            if event == "start":
+                if tag == "sst":
+                    table = element
+                elif tag == "rPh":
+                    in_phonetic = True
+                continue
+
+            if tag == "rPh":
+                in_phonetic = False
+            elif tag == "t" and not in_phonetic:
+                parts.append(element.text or "")
+            elif tag == "si":
+                strings.append("".join(parts))
+                parts = []
+                if table is not None:
+                    table.clear()
+    return strings
+
+
+def _xlsx_sheet_rows(
+    archive: zipfile.ZipFile, path: str, shared_strings: list[str]
+) -> Iterator[str]:
+    """Yield one ``a | b | c`` line per non-empty row of a worksheet."""
+    values: list[str] = []
+    cell_type = ""
+    value = ""
+    sheet_data = None
+    with archive.open(path) as stream:
+        for event, element in ET.iterparse(stream, events=("start", "end")):
+            tag = _local(element.tag)
+            if event == "start":
+                if tag == "sheetData":
+                    sheet_data = element
+                elif tag == "c":
+                    cell_type = element.get("t", "")
+                    value = ""
+                continue
+
+            if tag in ("v", "t"):
+                value += element.text or ""
+            elif tag == "c":
+                if cell_type == "s" and value.isdigit():
+                    index = int(value)
+                    value = shared_strings[index] if index < len(shared_strings) else ""
+                elif cell_type == "b":
+                    value = "TRUE" if value == "1" else "FALSE"
+                if value.strip():
+                    values.append(value.strip())
+            elif tag == "row":
+                if values:
+                    yield " | ".join(values)
+                values = []
+                if sheet_data is not None:
+                    sheet_data.clear()
+
+
+def _pptx_text(archive: zipfile.ZipFile, path: str) -> str:
+    """Paragraph text of a slide or notes part."""
+    lines: list[str] = []
+    runs: list[str] = []
+    with archive.open(path) as stream:
+        for _, element in ET.iterparse(stream):
+            if element.tag == f"{_DRAWING_NS}t":
+                runs.append(element.text or "")
+            elif element.tag == f"{_DRAWING_NS}br":
+                runs.append("\n")
+            elif element.tag == f"{_DRAWING_NS}p":
+                text = "".join(runs).strip()
+                runs = []
+                if text:
+                    lines.append(text)
+                element.clear()
+    return "\n".join(lines)
+
+
+def _pptx_notes_path(archive: zipfile.ZipFile, slide_path: str) -> str:
+    """Archive path of a slide's speaker notes, or an empty string."""
+    for path in _relationship_targets(archive, slide_path).values():
+        if posixpath.basename(posixpath.dirname(path)) == "notesSlides":
+            return path
+    return ""
+
+
+def parse_docx_document(file_input: Union[str, bytes]) -> list[str]:
+    """Extract DOCX text; hard page breaks split it into pages."""
+    with _open_zip(file_input) as archive:
+        return _docx_sections(archive)
+
+
+def parse_xlsx_document(file_input: Union[str, bytes]) -> list[str]:
+    """Extract XLSX text; one page per worksheet, headed by its name."""
+    with _open_zip(file_input) as archive:
+        shared_strings = _shared_strings(archive)
+        pages = []
+        for sheet, path in _ordered_parts(archive, "xl/workbook.xml", "sheet"):
+            rows = "\n".join(_xlsx_sheet_rows(archive, path, shared_strings))
+            pages.append(f"Sheet: {sheet.get('name', '')}\n{rows}" if rows else "")
+        return pages
+
+
+def parse_pptx_document(file_input: Union[str, bytes]) -> list[str]:
+    """Extract PPTX text; one page per slide, followed by its speaker notes."""
+    with _open_zip(file_input) as archive:
+        pages = []
+        for _, path in _ordered_parts(archive, "ppt/presentation.xml", "sldId"):
+            text = _pptx_text(archive, path)
+            notes_path = _pptx_notes_path(archive, path)
+            notes = _pptx_text(archive, notes_path) if notes_path else ""
+            if notes:
+                text = f"{text}\nNotes: {notes}".strip()
+            pages.append(text)
+        return pages
+
+
+_PARSERS = {
+    ".docx": parse_docx_document,
+    ".xlsx": parse_xlsx_document,
+    ".pptx": parse_pptx_document,
+}
+
+
+def parse_office_document(
+    file_input: Union[str, bytes], file_type: str
+) -> ParsedDocument:
+    """Parse a DOCX, XLSX or PPTX file into pages (sections, sheets or slides)."""
+    page_texts = [preprocess_content(text) for text in _PARSERS[file_type](file_input)]
+    return _build_parsed_document(page_texts)
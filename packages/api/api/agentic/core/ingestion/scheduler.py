@@ -0,0 +1,206 @@
+"""Admission control and weighted fair ordering for ingestion jobs.
+
+Admission happens in the API before anything is stored. In-flight documents
+(pending or processing) are counted per user, per collection and across the
+whole system, and each one is weighed by a rough CPU/LLM cost. A request
+that would exceed a limit is rejected as a whole with a Retry-After estimate.
+The limits are soft: admission reads the in-flight documents without a lock,
+so concurrent requests admitted together can overshoot a limit by their own
+size until their documents exist.
+
+Ordering happens in the worker. It buffers a window of deliveries and runs
+them in weighted fair queuing order by user, so one bulk import cannot
+monopolize a worker while other users are waiting.
+"""
+
+import math
+import threading
+from collections.abc import Iterable
+from typing import Any, NamedTuple, Optional
+
+from api.config import get_settings
+
+# Fixed cost of a job (summary call, bookkeeping) plus a cost per MiB of input
+BASE_JOB_COST = 1.0
+COST_PER_MIB = 1.0
+# Images always go through the OCR model
+IMAGE_OCR_COST = 4.0
+
+# Used when there are no finished ingestion runs to estimate from
+DEFAULT_JOB_SECONDS = 30.0
+MIN_RETRY_AFTER = 1
+MAX_RETRY_AFTER = 600
+
+
+def estimate_job_cost(file_size: Optional[int], file_type: Optional[str]) -> float:
+    """Rough CPU/LLM cost of ingesting one file, in budget units."""
+    cost = BASE_JOB_COST + (file_size or 0) / (1024 * 1024) * COST_PER_MIB
+    if file_type and file_type.startswith("image/"):
+        cost += IMAGE_OCR_COST
+    return round(cost, 3)
+
+
+def parse_tenant_weights(value: str) -> dict[str, float]:
+    """Parses ``"user_id:weight,user_id:weight"`` into a weight map."""
+    weights = {}
+    for item in value.split(","):
+        if not item.strip():
+            continue
+        tenant, _, weight = item.rpartition(":")
+        if not tenant or float(weight) <= 0:
+            raise ValueError(f"Invalid tenant weight: {item!r}")
+        weights[tenant.strip()] = float(weight)
+    return weights
+
+
+class InFlightJob(NamedTuple):
+    user_id: Optional[str]
+    collection_id: str
+    cost: float
+
+
+class IngestionRejected(Exception):
+    """Raised when admitting new jobs would exceed an ingestion limit."""
+
+    def __init__(self, reason: str, retry_after: int):
+        super().__init__(reason)
+        self.reason = reason
+        self.retry_after = retry_after
+
+
+class AdmissionController:
+    """Caps in-flight ingestion jobs per user, per collection and globally."""
+
+    def __init__(
+        self,
+        max_jobs_per_user: int = 20,
+        max_jobs_per_collection: int = 50,
+        max_jobs_total: int = 200,
+        cost_budget: float = 500.0,
+    ):
+        """
+        params: max_jobs_per_user: int - In-flight jobs one user may have.
+        params: max_jobs_per_collection: int - In-flight jobs one collection may have.
+        params: max_jobs_total: int - In-flight jobs across the system.
+        params: cost_budget: float - Summed estimated cost of in-flight jobs.
+        """
+        self.max_jobs_per_user = max_jobs_per_user
+        self.max_jobs_per_collection = max_jobs_per_collection
+        self.max_jobs_total = max_jobs_total
+        self.cost_budget = cost_budget
+
+    def admit(
+        self,
+        in_flight: list[InFlightJob],
+        user_id: str,
+        collection_id: str,
+        costs: list[float],
+        recent_durations: Iterable[float] = (),
+    ) -> None:
+        """
+        Checks whether ``costs`` new jobs may be queued; raises IngestionRejected
+        with a Retry-After estimate if not.
+        """
+        user_jobs = sum(1 for job in in_flight if job.user_id == user_id)
+        collection_jobs = sum(
+            1 for job in in_flight if job.collection_id == collection_id
+        )
+        in_flight_cost = sum(job.cost for job in in_flight)
+
+        # Each limit leaves room for some number of the new jobs
+        cost_room = 0
+        for cost in costs:
+            if in_flight_cost + cost > self.cost_budget:
+                break
+            in_flight_cost += cost
+            cost_room += 1
+        limits = [
+            (self.max_jobs_per_user - user_jobs, "per-user ingestion limit reached"),
+            (
+                self.max_jobs_per_collection - collection_jobs,
+                "per-collection ingestion limit reached",
+            ),
+            (self.max_jobs_total - len(in_flight), "ingestion system is saturated"),
+            (cost_room, "ingestion budget is exhausted"),
+        ]
+        room, reason = min(limits, key=lambda limit: limit[0])
+        if room >= len(costs):
+            return
+
+        overflow = len(costs) - max(room, 0)
+        raise IngestionRejected(
+            reason, self.estimate_retry_after(overflow, recent_durations)
+        )
+
+    @staticmethod
+    def estimate_retry_after(overflow: int, recent_durations: Iterable[float]) -> int:
+        """Seconds until roughly ``overflow`` in-flight jobs have finished."""
+        durations = sorted(d for d in recent_durations if d)
+        typical = durations[len(durations) // 2] if durations else DEFAULT_JOB_SECONDS
+        return min(MAX_RETRY_AFTER, max(MIN_RETRY_AFTER, math.ceil(typical * overflow)))
+
+
+class FairJobQueue:
+    """
+    Weighted fair queue of job messages keyed by ``user_id``.
+
+    Each job gets a virtual finish time of ``start + cost / weight``, where
+    ``start`` is the later of the queue's virtual clock and the tenant's last
+    finish time. Jobs are popped in finish-time order, so tenants share
+    throughput in proportion to their weights whatever their backlog.
+    """
+
+    def __init__(self, weights: Optional[dict[str, float]] = None):
+        self.weights = weights or {}
+        self._items: list[tuple[float, int, float, dict[str, Any], Any]] = []
+        self._last_finish: dict[str, float] = {}
+        self._virtual_time = 0.0
+        self._sequence = 0
+        self._lock = threading.Lock()
+
+    def push(self, message: dict[str, Any], handle: Any = None) -> None:
+        """Adds a job message; ``handle`` is returned with it by ``pop``."""
+        tenant = message.get("user_id") or ""
+        cost = float(message.get("cost") or BASE_JOB_COST)
+        with self._lock:
+            start = max(self._virtual_time, self._last_finish.get(tenant, 0.0))
+            finish = start + cost / self.weights.get(tenant, 1.0)
+            self._last_finish[tenant] = finish
+            self._items.append((finish, self._sequence, start, message, handle))
+            self._sequence += 1
+
+    def pop(self) -> tuple[dict[str, Any], Any]:
+        """Removes and returns the job with the earliest virtual finish time."""
+        with self._lock:
+            item = min(self._items)
+            self._items.remove(item)
+            _, _, start, message, handle = item
+            self._virtual_time = max(self._virtual_time, start)
+            if not self._items:
+                # Idle queue: forget history so old backlogs are not held against anyone
+                self._last_finish.clear()
+                self._virtual_time = 0.0
+            return message, handle
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._items)
+
+
+_admission_controller: Optional[AdmissionController] = None
+
+
+def get_admission_controller() -> Optional[AdmissionController]:
+    """Returns the process-wide admission controller, or None when disabled."""
+    global _admission_controller
+    settings = get_settings()
+    if not settings.INGESTION_ADMISSION_ENABLED:
+        return None
+    if _admission_controller is None:
+        _admission_controller = AdmissionController(
+            max_jobs_per_user=settings.INGESTION_MAX_JOBS_PER_USER,
+            max_jobs_per_collection=settings.INGESTION_MAX_JOBS_PER_COLLECTION,
+            max_jobs_total=settings.INGESTION_MAX_JOBS_TOTAL,
+            cost_budget=settings.INGESTION_COST_BUDGET,
+        )
+    return _admission_controller
@@ -3,6 +3,28 @@ from typing import Optional, Union
 from pydantic import BaseModel, ConfigDict, Field
 
 
+class PageText(BaseModel):
+    """Text of a single page and its position in the document full text."""
+
+    page_number: int = Field(..., description="1-based page number")
+    text: str = Field(..., description="Preprocessed text of the page")
+    start_offset: int = Field(
+        ..., description="Start offset of the page in the document full text"
+    )
+    end_offset: int = Field(
+        ..., description="End offset of the page in the document full text"
+    )
+
+
+class ParsedDocument(BaseModel):
+    """Result of parsing a paged document once."""
+
+    pages: list[PageText] = Field(
+        default_factory=list, description="Per-page text with offsets"
+    )
+    full_text: str = Field("", description="Page texts joined with newlines")
+
+
 class FileInput(BaseModel):
     """Normalized file input structure using Pydantic."""
 
@@ -16,6 +38,9 @@ class FileInput(BaseModel):
     name: str = Field(..., description="File name without path")
     type: str = Field(..., description="File type (e.g., pdf, txt, docx)")
     is_path: bool = Field(False, description="Indicates if the content is a file path")
+    pages: Optional[list[PageText]] = Field(
+        None, description="Parsed pages, shared by summary and chunking stages"
+    )
 
 
 class ChunkMetadata(BaseModel):
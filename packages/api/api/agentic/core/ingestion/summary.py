@@ -1,6 +1,7 @@
 from typing import Literal
 
-from ..call_llm import call_structured_llm_async
+from ..artifact_cache import get_artifact_cache, make_artifact_key
+from ..call_llm import call_structured_llm_async, structured_model
 from ..prompts import render_summary_generate_prompt
 from .schemas import document_details
 
@@ -20,7 +21,7 @@ class SummaryGenerator:
         language: Literal["en", "th"] = "en",
         max_length: int = 100,
     ) -> document_details:
-        """Generate a summary of the provided text."""
+        """Generate a summary of the provided text, reusing cached results."""
         prompt = self.prompt_renderer(
             full_text=full_text,
             text_limit=self.text_limit,
@@ -29,10 +30,19 @@ class SummaryGenerator:
             max_length=max_length,
         )
 
+        cache = get_artifact_cache()
+        if cache is not None:
+            key = make_artifact_key("summary", structured_model, prompt, full_text)
+            cached = await cache.get(key)
+            if cached is not None:
+                return document_details.model_validate(cached)
+
         try:
             summary = await call_structured_llm_async(
                 prompt, response_model=document_details
             )
+            if cache is not None:
+                await cache.put(key, "summary", structured_model, summary.model_dump())
             return summary
         except Exception as e:
             print(f"Error generating summary: {e}")
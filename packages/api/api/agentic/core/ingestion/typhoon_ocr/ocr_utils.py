@@ -1,17 +1,40 @@
 # Modified from Typhoon OCR Utils https://github.com/scb-10x/typhoon-ocr/blob/master/packages/typhoon_ocr/typhoon_ocr/ocr_utils.py
 
+import asyncio
 import base64
 import io
 import json
+import math
 import os
+import weakref
 from dataclasses import dataclass
-from typing import Any, Union
+from typing import Any, Optional, Union
 
+import numpy as np
 from PIL import Image
 
-from ...call_llm import call_vlm_async
+from .....config import get_settings
+from ...artifact_cache import get_artifact_cache, make_artifact_key
+from ...call_llm import call_vlm_async, ocr_model
 from ...prompts import render_ocr_prompt
 
+# -----------------------------
+# Image Preprocessing Settings
+# -----------------------------
+
+# Longest edge sent to the VLM; larger images only add payload and latency
+MAX_IMAGE_LONG_EDGE = 1800
+# Images that declare a higher DPI than this are scaled down to it first
+TARGET_IMAGE_DPI = 200
+# Images taller than this many widths are split into tiles
+TALL_IMAGE_RATIO = 2.5
+# Height of a tile in widths (close to a portrait page) and max tiles per image
+TILE_ASPECT_RATIO = 1.5
+MAX_IMAGE_TILES = 8
+# JPEG qualities tried in order until the encoded image fits the byte budget
+JPEG_QUALITIES = (85, 75, 65)
+MAX_IMAGE_BYTES = 1_000_000
+
 # -----------------------------
 # OCR Types & Data Structures
 # -----------------------------
@@ -50,13 +73,103 @@ class PageReport:
 # -----------------------------
 
 
-def image_to_base64png(img: Image.Image):
+def image_to_base64png(img: Image.Image, quality: int = 75):
     buffered = io.BytesIO()
     img = img.convert("RGB")
-    img.save(buffered, format="JPEG")
+    img.save(buffered, format="JPEG", quality=quality)
     return base64.b64encode(buffered.getvalue()).decode("utf-8")
 
 
+def encode_image_for_ocr(img: Image.Image, max_bytes: int = MAX_IMAGE_BYTES) -> str:
+    """Encode as JPEG base64 at the highest quality that fits ``max_bytes``."""
+    encoded = ""
+    for quality in JPEG_QUALITIES:
+        encoded = image_to_base64png(img, quality=quality)
+        # base64 inflates the payload by 4/3
+        if len(encoded) * 3 // 4 <= max_bytes:
+            break
+    return encoded
+
+
+def _resize(img: Image.Image, scale: float) -> Image.Image:
+    if scale >= 1:
+        return img
+    size = (max(1, round(img.width * scale)), max(1, round(img.height * scale)))
+    return img.resize(size, Image.Resampling.LANCZOS)
+
+
+def downscale_image(
+    img: Image.Image,
+    max_long_edge: int = MAX_IMAGE_LONG_EDGE,
+    target_dpi: Optional[int] = TARGET_IMAGE_DPI,
+) -> Image.Image:
+    """
+    Scale an image down to ``target_dpi`` and ``max_long_edge``; never up.
+    With ``target_dpi=None`` only the long edge is capped.
+    """
+    scale = max_long_edge / max(img.width, img.height)
+    dpi = img.info.get("dpi")
+    if target_dpi and dpi and dpi[0]:
+        scale = min(scale, target_dpi / float(dpi[0]))
+    return _resize(img, scale)
+
+
+def _find_cut_row(gray: np.ndarray, target: int, window: int) -> int:
+    """Pick the row with the least ink just above ``target`` to avoid cutting text."""
+    start = max(1, target - window)
+    if start >= target:
+        return target
+    ink = (gray[start:target] < 200).sum(axis=1)
+    return start + int(np.argmin(ink))
+
+
+def split_tall_image(
+    img: Image.Image,
+    tall_ratio: float = TALL_IMAGE_RATIO,
+    tile_aspect_ratio: float = TILE_ASPECT_RATIO,
+    max_tiles: int = MAX_IMAGE_TILES,
+) -> list[Image.Image]:
+    """Split a very tall image (e.g. a long screenshot) into page-like tiles."""
+    if img.height <= img.width * tall_ratio:
+        return [img]
+
+    tile_count = min(max_tiles, math.ceil(img.height / (img.width * tile_aspect_ratio)))
+    tile_height = math.ceil(img.height / tile_count)
+    gray = np.asarray(img.convert("L"))
+
+    tiles = []
+    top = 0
+    while top < img.height:
+        bottom = top + tile_height
+        if bottom >= img.height:
+            bottom = img.height
+        else:
+            # Move the cut up to a blank row within the last tenth of the tile
+            bottom = _find_cut_row(gray, bottom, tile_height // 10)
+        tiles.append(img.crop((0, top, img.width, bottom)))
+        top = bottom
+    return tiles
+
+
+def prepare_image_for_ocr(img: Image.Image) -> list[Image.Image]:
+    """
+    Downscale an image for OCR and split it into tiles when very tall.
+
+    Tall images are tiled before the long-edge limit applies, so a long
+    screenshot keeps a readable width instead of shrinking to a thin strip.
+    """
+    img = img.convert("RGB")
+    # Scale by DPI and width only; height is handled by tiling below
+    scale = MAX_IMAGE_LONG_EDGE / img.width
+    dpi = img.info.get("dpi")
+    if dpi and dpi[0]:
+        scale = min(scale, TARGET_IMAGE_DPI / float(dpi[0]))
+    img = _resize(img, scale)
+    # PIL carries the original "dpi" through resize and crop, so tiles must
+    # not be scaled by it again; they only get their long edge capped
+    return [downscale_image(tile, target_dpi=None) for tile in split_tall_image(img)]
+
+
 def get_anchor_text_from_image(img: Image.Image):
     width = float(img.width)
     height = float(img.height)
@@ -77,11 +190,12 @@ def is_base64_string(input_string: str) -> bool:
 def ensure_image_bytes(input_data: Union[str, bytes]) -> bytes:
     if isinstance(input_data, bytes):
         return input_data
-    elif isinstance(input_data, str) and is_base64_string(input_data):
-        return base64.b64decode(input_data)
+    # Check paths first; a short path can also pass the base64 check
     elif isinstance(input_data, str) and os.path.isfile(input_data):
         with open(input_data, "rb") as f:
             return f.read()
+    elif isinstance(input_data, str) and is_base64_string(input_data):
+        return base64.b64decode(input_data)
     raise ValueError("Input must be a path, bytes, or base64-encoded image string.")
 
 
@@ -90,18 +204,56 @@ def ensure_image_bytes(input_data: Union[str, bytes]) -> bytes:
 # -----------------------------
 
 
-async def ocr_image_document(
-    image_input: Union[str, bytes],
-    task_type: str = "default",
+# VLM requests in flight on each event loop, shared by every OCR caller
+_ocr_semaphores: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+
+
+def _ocr_semaphore() -> asyncio.Semaphore:
+    """Semaphore capping OCR requests of the running loop at PDF_OCR_CONCURRENCY."""
+    loop = asyncio.get_running_loop()
+    semaphore = _ocr_semaphores.get(loop)
+    if semaphore is None:
+        semaphore = asyncio.Semaphore(get_settings().PDF_OCR_CONCURRENCY)
+        _ocr_semaphores[loop] = semaphore
+    return semaphore
+
+
+def _prepare_ocr_tiles(image_input: Union[str, bytes]) -> list[tuple[str, str]]:
+    """Decode, downscale and tile an image into (base64 JPEG, anchor text) pairs."""
+    img = Image.open(io.BytesIO(ensure_image_bytes(image_input)))
+    # Anchor dimensions describe the image actually sent, after resizing
+    return [
+        (encode_image_for_ocr(tile), get_anchor_text_from_image(tile))
+        for tile in prepare_image_for_ocr(img)
+    ]
+
+
+async def _ocr_image(
+    image_base64: str,
+    anchor_text: str,
+    task_type: str,
     litellm_params: dict[str, Any] = None,
 ) -> str:
-    # Ensure image data is in bytes
-    image_data = ensure_image_bytes(image_input)
-    img = Image.open(io.BytesIO(image_data))
-    image_base64 = image_to_base64png(img)
-    anchor_text = get_anchor_text_from_image(img)
     prompt_text = render_ocr_prompt(anchor_text, task_type=task_type, text_length=1500)
 
+    cache = get_artifact_cache()
+    if cache is not None:
+        model_name = (litellm_params or {}).get("model", ocr_model)
+        key = make_artifact_key("ocr", model_name, prompt_text, image_base64)
+        cached = await cache.get(key)
+        if cached is not None:
+            return cached
+
+    async with _ocr_semaphore():
+        text = await _call_ocr_model(prompt_text, image_base64, litellm_params)
+    if cache is not None and text:
+        await cache.put(key, "ocr", model_name, text)
+    return text
+
+
+async def _call_ocr_model(
+    prompt_text: str, image_base64: str, litellm_params: dict[str, Any] = None
+) -> str:
     # Call the VLM with the image and prompt
     response = await call_vlm_async(
         prompt_text,
@@ -118,3 +270,21 @@ async def ocr_image_document(
 
     # Fallback: return raw stripped response
     return response.strip()
+
+
+async def ocr_image_document(
+    image_input: Union[str, bytes],
+    task_type: str = "default",
+    litellm_params: dict[str, Any] = None,
+) -> str:
+    # Decoding, resizing and JPEG encoding are CPU-bound; keep them off the loop
+    tiles = await asyncio.to_thread(_prepare_ocr_tiles, image_input)
+
+    # OCR tiles concurrently and stitch them back top to bottom
+    results = await asyncio.gather(
+        *(
+            _ocr_image(image_base64, anchor_text, task_type, litellm_params)
+            for image_base64, anchor_text in tiles
+        )
+    )
+    return "\n".join(text for text in results if text)
@@ -1,3 +1,6 @@
+import threading
+from typing import Optional, Union
+
 from fastapi import Depends
 
 from api.auth.dependencies import get_current_user
@@ -6,6 +9,7 @@ from api.chat.service import ChatService
 from api.clustering.service import ClusteringService, get_clustering_service
 from api.collection.dependencies import get_collection_service
 from api.collection.service import CollectionService
+from api.config import get_settings
 from api.document.dependencies import get_document_service
 from api.document.service import DocumentService
 from api.models.user import User
@@ -19,7 +23,12 @@ from .core import (
     # call_llm,
     call_llm_async,
 )
+from .core.call_llm import model as llm_model
+from .core.embedding.batcher import EmbeddingBatcher
+from .core.embedding.cache import get_embedding_cache
 from .core.embedding.embedding import MODEL_BACKEND_MAP
+from .core.embedding.provider import EmbedderProvider
+from .core.embedding.query_cache import CachedQueryEmbedder, get_query_embedding_cache
 from .core.ingestion.summary import SummaryGenerator
 from .core.prompts import (
     render_knowledge_graph_extraction_prompt,
@@ -34,7 +43,7 @@ def get_knowledge_graph_extractor() -> KnowledgeGraphExtractor:
     prompt_renderer = render_knowledge_graph_extraction_prompt
 
     return KnowledgeGraphExtractor(
-        llm_caller=llm_caller, prompt_renderer=prompt_renderer
+        llm_caller=llm_caller, prompt_renderer=prompt_renderer, model_name=llm_model
     )
 
 
@@ -48,12 +57,13 @@ def get_summary_generator() -> SummaryGenerator:
     )
 
 
-def get_text_embedder() -> TextEmbedder:
+def build_text_embedder() -> TextEmbedder:
     """
-    Returns an instance of TextEmbedder with the necessary dependencies.
+    Builds a TextEmbedder with the necessary dependencies, loading its model.
     """
-    model = "FlukeTJ/bge-m3-m2v-distilled-256"
-    backend = MODEL_BACKEND_MAP.get(model, None)
+    settings = get_settings()
+    model = settings.EMBEDDING_MODEL
+    backend = settings.EMBEDDING_BACKEND or MODEL_BACKEND_MAP.get(model, None)
     if backend is None:
         raise ValueError(f"Unsupported model: {model}")
 
@@ -61,9 +71,74 @@ def get_text_embedder() -> TextEmbedder:
         model_name=model,
         backend=backend,
         cache_folder="cache_models",  # For sentence_transformers
+        batch_size=settings.EMBEDDING_BATCH_SIZE,
+        cache=get_embedding_cache(),
+        onnx_quantization=settings.ONNX_QUANTIZATION,
     )
 
 
+# Owned by the app lifespan, which loads and warms it before serving
+text_embedder_provider = EmbedderProvider(build_text_embedder)
+
+
+def get_text_embedder() -> TextEmbedder:
+    """
+    Returns the process-wide TextEmbedder, loading it on first use if the
+    app lifespan has not.
+    """
+    return text_embedder_provider.get()
+
+
+# Anything with TextEmbedder's single-text ``get_embedding``
+QueryEmbedder = Union[CachedQueryEmbedder, EmbeddingBatcher, TextEmbedder]
+
+_query_batcher: Optional[EmbeddingBatcher] = None
+# Concurrent first requests would otherwise each start a dispatcher thread
+_query_batcher_lock = threading.Lock()
+
+
+def get_query_batcher() -> Optional[EmbeddingBatcher]:
+    """
+    Returns the process-wide batcher that encodes concurrent queries
+    together, or None when batching is disabled.
+    """
+    global _query_batcher
+    settings = get_settings()
+    if not settings.EMBED_BATCHING_ENABLED:
+        return None
+    if _query_batcher is None:
+        with _query_batcher_lock:
+            if _query_batcher is None:
+                _query_batcher = EmbeddingBatcher(
+                    get_text_embedder(),
+                    max_batch_size=settings.EMBED_BATCH_MAX_SIZE,
+                    max_wait_ms=settings.EMBED_BATCH_WAIT_MS,
+                )
+    return _query_batcher
+
+
+def get_query_embedder() -> QueryEmbedder:
+    """
+    Returns the embedder for single search queries: repeated queries are
+    answered from the query embedding cache, the rest go through the batcher
+    (or the TextEmbedder itself when batching is disabled).
+    """
+    embedder = get_query_batcher() or get_text_embedder()
+    cache = get_query_embedding_cache()
+    if cache is None:
+        return embedder
+    return CachedQueryEmbedder(embedder, cache)
+
+
+def close_query_embedder() -> None:
+    """Stops the query batcher's dispatcher thread, if one was started."""
+    global _query_batcher
+    with _query_batcher_lock:
+        if _query_batcher is not None:
+            _query_batcher.close()
+            _query_batcher = None
+
+
 def get_document_ingestor(
     user: User = Depends(get_current_user),
     document_service: DocumentService = Depends(get_document_service),
@@ -101,7 +176,7 @@ def get_rag_agent(
     user: User = Depends(get_current_user),
     collection_service: CollectionService = Depends(get_collection_service),
     document_service: DocumentService = Depends(get_document_service),
-    text_embedder: TextEmbedder = Depends(get_text_embedder),
+    query_embedder: QueryEmbedder = Depends(get_query_embedder),
     chat_service: ChatService = Depends(get_chat_service),
 ) -> rag_agent:
     """
@@ -112,5 +187,5 @@ def get_rag_agent(
         collection_service=collection_service,
         document_service=document_service,
         chat_service=chat_service,
-        embedding_model=text_embedder,
+        embedding_model=query_embedder,
     )
@@ -1,4 +1,5 @@
 import asyncio
+from typing import Optional
 
 from fastapi import (
     APIRouter,
@@ -9,19 +10,43 @@ from fastapi import (
 )
 
 from api.agentic.agent import rag_agent
-from api.agentic.schemas import AgentResponse, RAGQueryRequest
-from api.auth.schemas import UserResponse
+from api.agentic.schemas import (
+    AgentResponse,
+    ArtifactCacheStats,
+    CollectionReindexJob,
+    EmbeddingCacheStats,
+    IngestionJob,
+    QueryEmbeddingCacheStats,
+    RAGQueryRequest,
+)
 from api.chat.dependencies import get_chat_or_404
 from api.clustering.schemas import ClusteringResponse
+from api.collection.dependencies import get_collection_with_modify_permission
+from api.config import get_settings
+from api.document.dependencies import get_document_with_modify_permission
 from api.document.schemas import (
+    CollectionReindexResponse,
     DocumentCreate,
-    DocumentResponse,
     DocumentResponseTruncated,
+    DocumentUpdate,
 )
+from api.message_queue.service import QueueService, get_queue_service
 from api.models.chat import CollectionChat
+from api.models.collection import Collection
+from api.models.document import Document
+from api.models.enum import IngestionStatus
 from api.storage import storage_service
 
-from .core.ingestion.schemas import FileInput
+from .core.artifact_cache import get_artifact_cache
+from .core.embedding.cache import get_embedding_cache
+from .core.embedding.query_cache import get_query_embedding_cache
+from .core.ingestion.metrics import build_ingestion_histograms
+from .core.ingestion.scheduler import (
+    InFlightJob,
+    IngestionRejected,
+    estimate_job_cost,
+    get_admission_controller,
+)
 from .dependencies import (
     DocumentIngestorService,
     DocumentService,
@@ -30,10 +55,10 @@ from .dependencies import (
     get_current_user,
     get_document_ingestor,
     get_document_service,
+    get_query_batcher,
     get_rag_agent,
     get_topic_modelling_service,
 )
-from .utils import normalize_file_input
 
 router = APIRouter(prefix="/agentic", tags=["agentic"])
 
@@ -42,53 +67,57 @@ router = APIRouter(prefix="/agentic", tags=["agentic"])
     "/upload_ingest",
     response_model=list[DocumentResponseTruncated],
     tags=["agentic"],
-    status_code=status.HTTP_201_CREATED,
+    status_code=status.HTTP_202_ACCEPTED,
 )
 async def upload_and_ingest_documents(
     collection_id: str,
-    document_ingestor: DocumentIngestorService = Depends(get_document_ingestor),
     document_service: DocumentService = Depends(get_document_service),
-    topic_modelling_service: TopicModellingService = Depends(
-        get_topic_modelling_service
-    ),
+    queue_service: QueueService = Depends(get_queue_service),
     current_user: User = Depends(get_current_user),
     *,
     input_files: list[UploadFile],
 ):
     """
-    Ingest multiple documents into the system.
-    This endpoint allows users to upload multiple documents for processing and storage.
-    Returns after all documents have been ingested and clustering has been completed.
+    Upload multiple documents and queue them for ingestion.
+    Files are stored and their documents created in the `pending` state; the
+    ingestion worker processes them and re-clusters the collection afterwards.
+    Responds 429 with Retry-After when the upload would exceed an ingestion limit.
     """
-    created_documents = []
-    errors = []
-    for input_file in input_files:
-        try:
+    _admit_ingestion(
+        document_service,
+        current_user.id,
+        collection_id,
+        [estimate_job_cost(f.size, f.content_type) for f in input_files],
+    )
+    semaphore = asyncio.Semaphore(get_settings().UPLOAD_CONCURRENCY)
+
+    async def store_upload(input_file: UploadFile) -> Document:
+        """Store one uploaded file and create its pending document."""
+        async with semaphore:
             object_name, file_type, _ = DocumentService.prepare_file_upload(
                 input_file, current_user.id, collection_id
             )
 
-            # Read file content once at the beginning
-            file_content = await input_file.read()
-            if not file_content:
+            # Stream the spooled upload to storage, hashing it on the way
+            stored = await storage_service.upload_stream_to_storage(
+                input_file, object_name
+            )
+            if stored.size == 0:
+                await asyncio.to_thread(
+                    storage_service.delete_file_from_storage, stored.object_name
+                )
                 raise HTTPException(
                     status_code=400,
                     detail=f"Uploaded file is empty: {input_file.filename}",
                 )
 
-            # Rewind the file to be read again by the storage service
-            await input_file.seek(0)
-
-            stored_path = await storage_service.upload_file_to_storage(
-                input_file, object_name
-            )
-
             document = document_service.create_document(
                 document_data=DocumentCreate(
                     file_name=input_file.filename or "uploaded_file",
                     file_type=file_type,
-                    file_size=len(file_content),
-                    source_file_path=stored_path,
+                    file_size=stored.size,
+                    content_hash=stored.sha256,
+                    source_file_path=stored.object_name,
                     collection_id=collection_id,
                 ),
                 user=current_user,
@@ -97,46 +126,47 @@ async def upload_and_ingest_documents(
                 raise RuntimeError(
                     f"Failed to create document record for {input_file.filename}"
                 )
-            formatted_input = FileInput(
-                name=input_file.filename or "uploaded_file",
-                file_name=input_file.filename or "uploaded_file",
-                content=file_content,
-                type=file_type,
-                is_path=False,
-            )
-            input_file_model: FileInput = normalize_file_input(formatted_input)
+            return document
 
-            # detach user/ document
-            current_user = UserResponse.model_validate(current_user)
-            current_document = DocumentResponse.model_validate(document)
+    # Store files concurrently; results keep the order of input_files
+    results = await asyncio.gather(
+        *(store_upload(input_file) for input_file in input_files),
+        return_exceptions=True,
+    )
 
-            # Ingest the document
-            await document_ingestor.ingest_file(
-                input_file=input_file_model,
-                document=current_document,
-                graph_extract=False,
-                user=current_user,
-            )
-            created_documents.append(document)
-        except Exception as e:
-            errors.append({"file": input_file.filename, "error": str(e)})
+    created_documents = []
+    errors = []
+    for input_file, result in zip(input_files, results):
+        if isinstance(result, Exception):
+            errors.append({"file": input_file.filename, "error": str(result)})
+        else:
+            created_documents.append(result)
     if not created_documents:
         raise HTTPException(
             status_code=500, detail=f"No documents created. Errors: {errors}"
         )
 
-    # Trigger clustering after a short delay
-    await asyncio.sleep(2)
-    try:
-        await topic_modelling_service.cluster_and_store_documents(
+    # Queue ingestion jobs; whichever finishes last re-clusters the collection
+    for document in created_documents:
+        job = IngestionJob(
+            document_id=document.id,
+            user_id=current_user.id,
             collection_id=collection_id,
-            user=current_user,
-            cluster_title_top_n_topics=5,
-            cluster_title_top_n_words=50,
-            title_generated_methods="by_summaries",
+            graph_extract=False,
+            cluster_collection=True,
+            cost=estimate_job_cost(document.file_size, document.file_type),
         )
-    except Exception as e:
-        print(f"Automatic clustering failed for collection {collection_id}: {str(e)}")
+        try:
+            await asyncio.to_thread(
+                queue_service.publish_ingestion_job, job.model_dump()
+            )
+        except Exception as e:
+            print(f"Failed to queue ingestion for document {document.id}: {e}")
+            document_service.update_document(
+                document_id=document.id,
+                update_data=DocumentUpdate(status=IngestionStatus.failed),
+                user=current_user,
+            )
 
     return created_documents
 
@@ -191,6 +221,218 @@ async def graph_extract(
     return document
 
 
+@router.post(
+    "/retry/{document_id}",
+    response_model=DocumentResponseTruncated,
+    tags=["agentic"],
+    status_code=status.HTTP_202_ACCEPTED,
+)
+async def retry_ingestion(
+    graph_extract: bool = False,
+    document: Document = Depends(get_document_with_modify_permission),
+    document_service: DocumentService = Depends(get_document_service),
+    queue_service: QueueService = Depends(get_queue_service),
+    current_user: User = Depends(get_current_user),
+):
+    """
+    Queue a failed ingestion again. The worker resumes from the document's
+    checkpoints, so stages that already completed are not repeated.
+    """
+    if document.status != IngestionStatus.failed:
+        raise HTTPException(
+            status_code=409, detail="Only failed ingestions can be retried"
+        )
+    return await _queue_document_job(
+        IngestionJob(
+            document_id=document.id,
+            user_id=current_user.id,
+            collection_id=document.collection_id,
+            graph_extract=graph_extract,
+        ),
+        document_service,
+        queue_service,
+        current_user,
+    )
+
+
+@router.post(
+    "/reingest/{document_id}",
+    response_model=DocumentResponseTruncated,
+    tags=["agentic"],
+    status_code=status.HTTP_202_ACCEPTED,
+)
+async def reingest_document(
+    document: Document = Depends(get_document_with_modify_permission),
+    document_service: DocumentService = Depends(get_document_service),
+    queue_service: QueueService = Depends(get_queue_service),
+    current_user: User = Depends(get_current_user),
+):
+    """
+    Queue an incremental re-ingestion of a document's stored file.
+    Only chunks whose text changed are re-embedded and rewritten.
+    """
+    return await _queue_document_job(
+        IngestionJob(
+            document_id=document.id,
+            user_id=current_user.id,
+            collection_id=document.collection_id,
+            incremental=True,
+        ),
+        document_service,
+        queue_service,
+        current_user,
+    )
+
+
+async def _queue_document_job(
+    job: IngestionJob,
+    document_service: DocumentService,
+    queue_service: QueueService,
+    current_user: User,
+) -> Document:
+    """Mark an existing document pending and publish its ingestion job."""
+    existing = document_service.get_document(job.document_id)
+    job.cost = estimate_job_cost(existing.file_size, existing.file_type)
+    _admit_ingestion(document_service, job.user_id, job.collection_id, [job.cost])
+
+    document = document_service.update_document(
+        document_id=job.document_id,
+        update_data=DocumentUpdate(status=IngestionStatus.pending),
+        user=current_user,
+    )
+    try:
+        await asyncio.to_thread(queue_service.publish_ingestion_job, job.model_dump())
+    except Exception as e:
+        document_service.update_document(
+            document_id=job.document_id,
+            update_data=DocumentUpdate(status=IngestionStatus.failed),
+            user=current_user,
+        )
+        raise HTTPException(
+            status_code=503, detail=f"Failed to queue ingestion: {e}"
+        ) from e
+    return document
+
+
+def _admit_ingestion(
+    document_service: DocumentService,
+    user_id: str,
+    collection_id: str,
+    costs: list[float],
+) -> None:
+    """
+    Raise 429 with Retry-After if the new jobs would exceed an ingestion limit.
+
+    This is a soft limit: in-flight documents are counted without a lock, and
+    an upload's documents only exist once its files are stored, so concurrent
+    requests may together overshoot a limit.
+    """
+    admission = get_admission_controller()
+    if admission is None:
+        return
+
+    in_flight = [
+        InFlightJob(
+            user_id=row.created_by,
+            collection_id=row.collection_id,
+            cost=estimate_job_cost(row.file_size, row.file_type),
+        )
+        for row in document_service.get_in_flight_documents()
+    ]
+    recent_durations = [
+        run.duration_seconds
+        for run in document_service.get_recent_ingestion_runs(limit=50)
+    ]
+    try:
+        admission.admit(in_flight, user_id, collection_id, costs, recent_durations)
+    except IngestionRejected as e:
+        raise HTTPException(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            detail=f"Ingestion rejected: {e.reason}",
+            headers={"Retry-After": str(e.retry_after)},
+        ) from e
+
+
+@router.post(
+    "/rechunk/{document_id}",
+    response_model=DocumentResponseTruncated,
+    tags=["agentic"],
+    status_code=status.HTTP_200_OK,
+)
+async def rechunk_document(
+    document: Document = Depends(get_document_with_modify_permission),
+    document_service: DocumentService = Depends(get_document_service),
+    document_ingestor: DocumentIngestorService = Depends(get_document_ingestor),
+    current_user: User = Depends(get_current_user),
+):
+    """
+    Re-chunk a document from its stored text after the text was edited.
+    Unchanged chunks keep their embeddings; only new text is embedded.
+    """
+    if not document.document:
+        raise HTTPException(
+            status_code=400, detail="Document content is empty or not available"
+        )
+
+    await document_ingestor.reindex_document_text(document, current_user)
+    return document_service.get_document(document.id)
+
+
+@router.post(
+    "/reindex/{collection_id}",
+    response_model=CollectionReindexResponse,
+    tags=["agentic"],
+    status_code=status.HTTP_202_ACCEPTED,
+)
+async def reindex_collection(
+    chunk_size: Optional[int] = None,
+    min_characters_per_chunk: Optional[int] = None,
+    collection: Collection = Depends(get_collection_with_modify_permission),
+    document_service: DocumentService = Depends(get_document_service),
+    queue_service: QueueService = Depends(get_queue_service),
+    current_user: User = Depends(get_current_user),
+):
+    """
+    Queue a rebuild of every document's chunks and embeddings in a collection
+    from the stored files, e.g. after changing the chunk size or the embedding
+    model. Search keeps using the current chunks until the rebuild is swapped
+    in as a whole.
+    """
+    reindex = document_service.start_collection_reindex(collection.id, current_user)
+    job = CollectionReindexJob(
+        reindex_id=reindex.id,
+        user_id=current_user.id,
+        collection_id=collection.id,
+        chunk_size=chunk_size,
+        min_characters_per_chunk=min_characters_per_chunk,
+        cost=float(max(reindex.total_documents, 1)),
+    )
+    try:
+        await asyncio.to_thread(queue_service.publish_ingestion_job, job.model_dump())
+    except Exception as e:
+        document_service.fail_collection_reindex(reindex.id, f"Failed to queue: {e}")
+        raise HTTPException(
+            status_code=503, detail=f"Failed to queue reindex: {e}"
+        ) from e
+    return reindex
+
+
+@router.get(
+    "/reindex/{collection_id}",
+    response_model=CollectionReindexResponse,
+    tags=["agentic"],
+)
+async def get_collection_reindex(
+    collection: Collection = Depends(get_collection_with_modify_permission),
+    document_service: DocumentService = Depends(get_document_service),
+):
+    """Get the progress of a collection's most recent reindex."""
+    reindex = document_service.get_latest_collection_reindex(collection.id)
+    if not reindex:
+        raise HTTPException(status_code=404, detail="Collection was never reindexed")
+    return reindex
+
+
 @router.post(
     "/cluster_topic",
     response_model=ClusteringResponse,
@@ -243,7 +485,9 @@ async def rag_query(
     else:
         rag_agent.create_flow(flow_type="collection")
 
-    shared_store = rag_agent.run(
+    # The flow blocks on the query batcher and LLM calls; keep the loop free
+    shared_store = await asyncio.to_thread(
+        rag_agent.run,
         user_question=request.user_question,
         collection_chat_id=collection_chat.id,
         references=request.reference,
@@ -253,3 +497,84 @@ async def rag_query(
         chat_history=shared_store.chat_history,
         retrieved_contexts=shared_store.retrieved_contexts,
     )
+
+
+@router.get(
+    "/embedding_cache/stats",
+    response_model=EmbeddingCacheStats,
+    tags=["agentic"],
+    status_code=status.HTTP_200_OK,
+)
+async def embedding_cache_stats(user: User = Depends(get_current_user)):
+    """
+    Returns hit/miss counters of this process's embedding cache.
+    """
+    cache = get_embedding_cache()
+    if cache is None:
+        raise HTTPException(status_code=404, detail="Embedding cache is disabled")
+    return cache.stats()
+
+
+@router.get(
+    "/embedding_batcher/stats",
+    tags=["agentic"],
+    status_code=status.HTTP_200_OK,
+)
+async def embedding_batcher_stats(user: User = Depends(get_current_user)):
+    """
+    Returns batch counts and sizes of this process's query embedding batcher.
+    """
+    batcher = get_query_batcher()
+    if batcher is None:
+        raise HTTPException(status_code=404, detail="Query batching is disabled")
+    return batcher.stats()
+
+
+@router.get(
+    "/query_embedding_cache/stats",
+    response_model=QueryEmbeddingCacheStats,
+    tags=["agentic"],
+    status_code=status.HTTP_200_OK,
+)
+async def query_embedding_cache_stats(user: User = Depends(get_current_user)):
+    """
+    Returns hit/miss counters of this process's query embedding LRU.
+    """
+    cache = get_query_embedding_cache()
+    if cache is None:
+        raise HTTPException(status_code=404, detail="Query embedding cache is disabled")
+    return cache.stats()
+
+
+@router.get(
+    "/artifact_cache/stats",
+    response_model=ArtifactCacheStats,
+    tags=["agentic"],
+    status_code=status.HTTP_200_OK,
+)
+async def artifact_cache_stats(user: User = Depends(get_current_user)):
+    """
+    Returns hit/miss counters of this process's summary, graph and OCR cache.
+    """
+    cache = get_artifact_cache()
+    if cache is None:
+        raise HTTPException(status_code=404, detail="Artifact cache is disabled")
+    return cache.stats()
+
+
+@router.get(
+    "/metrics/ingestion",
+    tags=["agentic"],
+    status_code=status.HTTP_200_OK,
+)
+async def ingestion_metrics(
+    limit: int = 1000,
+    document_service: DocumentService = Depends(get_document_service),
+    user: User = Depends(get_current_user),
+):
+    """
+    Histograms of per-stage ingestion durations and pages/chunks per second
+    over the most recent successful ingestion runs of the user's documents.
+    """
+    runs = document_service.get_recent_ingestion_runs(limit=limit, user_id=user.id)
+    return build_ingestion_histograms(runs)
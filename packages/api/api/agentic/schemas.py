@@ -1,6 +1,6 @@
 from datetime import datetime
 from enum import Enum
-from typing import Optional
+from typing import Literal, Optional
 
 from pydantic import BaseModel, Field, field_validator
 
@@ -256,3 +256,69 @@ class RAGQueryRequest(BaseModel):
         default_factory=list,
         description="Optional list of document references to use for the query",
     )
+
+
+class IngestionJob(BaseModel):
+    """Schema for a queued document ingestion job."""
+
+    document_id: str = Field(..., description="ID of the document to ingest")
+    user_id: str = Field(..., description="ID of the user who uploaded the document")
+    collection_id: str = Field(..., description="Collection the document belongs to")
+    graph_extract: bool = Field(
+        False, description="Whether to extract a knowledge graph"
+    )
+    cluster_collection: bool = Field(
+        False,
+        description=(
+            "Whether to re-cluster the collection once this job completes and "
+            "no other documents of the collection are queued or ingesting"
+        ),
+    )
+    incremental: bool = Field(
+        False,
+        description="Re-ingest an existing document, re-embedding only changed chunks",
+    )
+    cost: float = Field(
+        1.0, description="Estimated CPU/LLM cost, used for fair scheduling"
+    )
+
+
+class CollectionReindexJob(BaseModel):
+    """Schema for a queued rebuild of a collection's chunks and embeddings."""
+
+    job_type: Literal["collection_reindex"] = "collection_reindex"
+    reindex_id: str = Field(..., description="ID of the collection reindex record")
+    user_id: str = Field(..., description="ID of the user who requested the reindex")
+    collection_id: str = Field(..., description="Collection to rebuild")
+    chunk_size: Optional[int] = Field(
+        None, description="Chunk size in tokens; defaults to the ingestion default"
+    )
+    min_characters_per_chunk: Optional[int] = Field(
+        None, description="Minimum characters per chunk"
+    )
+    cost: float = Field(
+        1.0, description="Estimated CPU/LLM cost, used for fair scheduling"
+    )
+
+
+class EmbeddingCacheStats(BaseModel):
+    memory_items: int = Field(..., description="Vectors held in the in-memory LRU")
+    memory_hits: int = Field(..., description="Lookups served from memory")
+    store_hits: int = Field(..., description="Lookups served from the database")
+    misses: int = Field(..., description="Lookups that required encoding")
+    hit_rate: float = Field(..., description="Fraction of lookups that were hits")
+
+
+class ArtifactCacheStats(BaseModel):
+    hits: int = Field(..., description="Summaries, graphs and OCR text served cached")
+    misses: int = Field(..., description="Lookups that required an LLM call")
+    hit_rate: float = Field(..., description="Fraction of lookups that were hits")
+
+
+class QueryEmbeddingCacheStats(BaseModel):
+    items: int = Field(..., description="Query vectors held in the LRU")
+    hits: int = Field(..., description="Lookups served from the LRU")
+    misses: int = Field(..., description="Lookups that required embedding")
+    expired: int = Field(..., description="Entries dropped for exceeding the TTL")
+    evictions: int = Field(..., description="Entries dropped to stay within size")
+    hit_rate: float = Field(..., description="Fraction of lookups that were hits")
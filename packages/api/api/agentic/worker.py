@@ -0,0 +1,344 @@
+"""Worker process that consumes queued document ingestion jobs."""
+
+import asyncio
+import os
+import socket
+from typing import Any, Optional
+from uuid import uuid4
+
+from loguru import logger
+from sqlalchemy.orm import Session
+
+from api.auth.schemas import UserResponse
+from api.clustering.service import ClusteringService
+from api.config import get_settings
+from api.database import SessionLocal
+from api.document.schemas import ChunkCreate, DocumentResponse, DocumentUpdate
+from api.document.service import DocumentServiceSearch as DocumentService
+from api.message_queue.service import QueueService, get_queue_service
+from api.models import enum
+from api.models.user import User
+from api.storage import storage_service
+
+from .core import DocumentIngestorService, TextEmbedder, TopicModellingService
+from .core.ingestion.scheduler import FairJobQueue, parse_tenant_weights
+from .core.ingestion.schemas import FileInput
+from .dependencies import (
+    get_knowledge_graph_extractor,
+    get_summary_generator,
+    get_text_embedder,
+)
+from .schemas import CollectionReindexJob, IngestionJob
+from .utils import normalize_file_input
+
+
+class IngestionWorker:
+    """
+    Consumes ingestion jobs from RabbitMQ and runs the ingestion pipeline.
+
+    Each job is acknowledged only after the document has been processed. A job
+    that raises is rejected without requeue and lands in the dead-letter queue,
+    with the document marked as failed. Prefetched jobs are run in weighted
+    fair order by user, so a bulk import does not hold up other users' uploads.
+    """
+
+    def __init__(
+        self,
+        queue_service: Optional[QueueService] = None,
+        prefetch_count: Optional[int] = None,
+    ):
+        self.queue_service = queue_service or get_queue_service()
+        settings = get_settings()
+        self.prefetch_count = prefetch_count or settings.INGESTION_PREFETCH_COUNT
+        self.job_queue = FairJobQueue(
+            weights=parse_tenant_weights(settings.INGESTION_TENANT_WEIGHTS)
+        )
+        self.text_embedder: TextEmbedder = get_text_embedder()
+
+        # One loop for the lifetime of the worker so async clients can be reused
+        self._loop = asyncio.new_event_loop()
+
+    def run(self) -> None:
+        """Block and process ingestion jobs until the consumer is stopped."""
+        logger.info("Ingestion worker started")
+        try:
+            self.queue_service.start_ingestion_consumer(
+                self.handle_message,
+                prefetch_count=self.prefetch_count,
+                buffer=self.job_queue,
+            )
+        finally:
+            self._loop.close()
+
+    def handle_message(self, message: dict[str, Any]) -> None:
+        """Process a single ingestion job message."""
+        if message.get("job_type") == "collection_reindex":
+            reindex_job = CollectionReindexJob.model_validate(message)
+            logger.info(
+                f"Processing reindex {reindex_job.reindex_id} "
+                f"of collection {reindex_job.collection_id}"
+            )
+            self._loop.run_until_complete(self.process_reindex_job(reindex_job))
+            return
+
+        job = IngestionJob.model_validate(message)
+        logger.info(f"Processing ingestion job for document {job.document_id}")
+        self._loop.run_until_complete(self.process_job(job))
+
+    async def process_job(self, job: IngestionJob) -> None:
+        """Load the stored file for a job and ingest it."""
+        db = SessionLocal()
+        try:
+            document_service = DocumentService(db)
+            document = document_service.get_document(job.document_id)
+            if not document:
+                # Document was deleted before the job ran; nothing to do
+                logger.warning(f"Document {job.document_id} not found, skipping job")
+                return
+
+            user = db.query(User).filter(User.id == job.user_id).first()
+            if not user:
+                # Left pending, the document would block collection clustering
+                document_service.fail_document(document.id)
+                raise RuntimeError(f"User {job.user_id} not found")
+
+            try:
+                # Parsers read from disk, so large files never sit in memory
+                source_file = storage_service.download_file_to_tempfile(
+                    document.source_file_path,
+                    suffix=os.path.splitext(document.file_name)[1],
+                )
+            except Exception:
+                document_service.update_document(
+                    document_id=document.id,
+                    update_data=DocumentUpdate(status=enum.IngestionStatus.failed),
+                    user=user,
+                )
+                raise
+
+            current_user = UserResponse.model_validate(user)
+            with source_file:
+                input_file = self._source_input(document, source_file.name)
+
+                document_ingestor = DocumentIngestorService(
+                    document_service=document_service,
+                    text_embedder=self.text_embedder,
+                    kg_extractor=get_knowledge_graph_extractor(),
+                    summary_generator=get_summary_generator(),
+                    chunk_batch_size=get_settings().INGESTION_CHUNK_BATCH_SIZE,
+                )
+                await document_ingestor.ingest_file(
+                    input_file=input_file,
+                    document=DocumentResponse.model_validate(document),
+                    graph_extract=job.graph_extract,
+                    user=current_user,
+                    incremental=job.incremental,
+                )
+
+            if job.cluster_collection:
+                await self.cluster_collection_when_drained(
+                    document_service, db, job.collection_id, current_user
+                )
+        finally:
+            db.close()
+
+    async def process_reindex_job(self, job: CollectionReindexJob) -> None:
+        """
+        Rebuild every ingested document of a collection into shadow chunks,
+        then swap them in at once. Search keeps using the old chunks until
+        the swap. A redelivered job skips documents already rebuilt.
+
+        The worker holds a renewed lease on the reindex while it runs, so a
+        duplicate delivery waits for it instead of rebuilding concurrently,
+        and takes over if the lease holder dies.
+        """
+        db = SessionLocal()
+        lease_owner = f"{socket.gethostname()}:{os.getpid()}:{uuid4()}"
+        lease_seconds = get_settings().REINDEX_LEASE_SECONDS
+        try:
+            document_service = DocumentService(db)
+            while True:
+                reindex = document_service.get_collection_reindex(job.reindex_id)
+                if not reindex or reindex.status in (
+                    enum.IngestionStatus.ready,
+                    enum.IngestionStatus.failed,
+                ):
+                    logger.warning(
+                        f"Reindex {job.reindex_id} is not pending, skipping job"
+                    )
+                    return
+                if document_service.acquire_collection_reindex_lease(
+                    job.reindex_id, lease_owner, lease_seconds
+                ):
+                    break
+                logger.info(f"Reindex {job.reindex_id} is leased by another worker")
+                await asyncio.sleep(max(1, lease_seconds // 3))
+
+            user = db.query(User).filter(User.id == job.user_id).first()
+            if not user:
+                raise RuntimeError(f"User {job.user_id} not found")
+
+            chunking = {
+                key: value
+                for key, value in {
+                    "chunk_size": job.chunk_size,
+                    "min_characters_per_chunk": job.min_characters_per_chunk,
+                }.items()
+                if value is not None
+            }
+            document_ingestor = DocumentIngestorService(
+                document_service=document_service,
+                text_embedder=self.text_embedder,
+                kg_extractor=get_knowledge_graph_extractor(),
+                summary_generator=get_summary_generator(),
+                **chunking,
+            )
+
+            documents = document_service.get_reindexable_documents(job.collection_id)
+            rebuilt = document_service.get_shadowed_document_ids(job.reindex_id)
+            progress = {
+                "processed_documents": len(rebuilt),
+                "failed_documents": 0,
+                "chunk_count": reindex.chunk_count,
+            }
+            document_service.update_collection_reindex(
+                job.reindex_id,
+                status=enum.IngestionStatus.processing,
+                total_documents=len(documents),
+                **progress,
+            )
+            semaphore = asyncio.Semaphore(get_settings().REINDEX_CONCURRENCY)
+
+            async def rebuild(document) -> None:
+                async with semaphore:
+                    try:
+                        chunks = await self.rebuild_document(
+                            document, document_ingestor
+                        )
+                        document_service.insert_shadow_chunks(
+                            job.reindex_id, chunks, user
+                        )
+                    except Exception as e:
+                        # The document keeps its current chunks
+                        logger.error(f"Reindex of {document.id} failed: {e}")
+                        progress["failed_documents"] += 1
+                    else:
+                        progress["processed_documents"] += 1
+                        progress["chunk_count"] += len(chunks)
+                    document_service.update_collection_reindex(
+                        job.reindex_id, **progress
+                    )
+
+            async def renew_lease() -> None:
+                while True:
+                    await asyncio.sleep(max(1, lease_seconds // 3))
+                    if not document_service.acquire_collection_reindex_lease(
+                        job.reindex_id, lease_owner, lease_seconds
+                    ):
+                        logger.warning(f"Lost the lease on reindex {job.reindex_id}")
+
+            renewal = asyncio.create_task(renew_lease())
+            try:
+                await asyncio.gather(
+                    *(rebuild(doc) for doc in documents if doc.id not in rebuilt)
+                )
+                swapped = document_service.swap_collection_reindex(
+                    job.reindex_id,
+                    user,
+                    embedding_model=self.text_embedder.model_name,
+                    lease_owner=lease_owner,
+                )
+            except Exception as e:
+                document_service.fail_collection_reindex(
+                    job.reindex_id, str(e), lease_owner=lease_owner
+                )
+                raise
+            finally:
+                renewal.cancel()
+            logger.info(
+                f"Reindex {job.reindex_id} swapped in {swapped} documents "
+                f"({progress['failed_documents']} failed)"
+            )
+        finally:
+            db.close()
+
+    async def rebuild_document(
+        self, document, document_ingestor: DocumentIngestorService
+    ) -> list[ChunkCreate]:
+        """Stream a document's stored file and re-extract, chunk and embed it."""
+        source_file = await asyncio.to_thread(
+            storage_service.download_file_to_tempfile,
+            document.source_file_path,
+            suffix=os.path.splitext(document.file_name)[1],
+        )
+        with source_file:
+            input_file = self._source_input(document, source_file.name)
+            return await document_ingestor.rebuild_chunks(input_file, document.id)
+
+    @staticmethod
+    def _source_input(document, path: str) -> FileInput:
+        """FileInput for a document's stored file downloaded to ``path``."""
+        return normalize_file_input(
+            FileInput(
+                name=document.file_name,
+                file_name=document.file_name,
+                content=path,
+                type=document.file_type,
+                is_path=True,
+            )
+        )
+
+    async def cluster_collection_when_drained(
+        self,
+        document_service: DocumentService,
+        db: Session,
+        collection_id: str,
+        user: UserResponse,
+    ) -> None:
+        """
+        Re-cluster a collection once none of its documents are queued or
+        ingesting. This job's document status is already committed, so of
+        several workers finishing together at least one sees the collection
+        drained; the advisory lock keeps them from clustering concurrently.
+        """
+        if document_service.count_in_flight_collection_documents(collection_id):
+            return
+        with document_service.try_lock_collection(collection_id) as locked:
+            if not locked:
+                logger.info(f"Collection {collection_id} is already being clustered")
+                return
+            await self.cluster_collection(document_service, db, collection_id, user)
+
+    async def cluster_collection(
+        self,
+        document_service: DocumentService,
+        db: Session,
+        collection_id: str,
+        user: UserResponse,
+    ) -> None:
+        """Re-cluster a collection after new documents were ingested."""
+        topic_modelling_service = TopicModellingService(
+            document_service=document_service,
+            clustering_service=ClusteringService(db),
+            embedding_model=self.text_embedder,
+        )
+        try:
+            await topic_modelling_service.cluster_and_store_documents(
+                collection_id=collection_id,
+                user=user,
+                cluster_title_top_n_topics=5,
+                cluster_title_top_n_words=50,
+                title_generated_methods="by_summaries",
+            )
+        except Exception as e:
+            # Clustering is best effort; the ingestion itself succeeded
+            logger.error(f"Automatic clustering failed for {collection_id}: {e}")
+
+
+def run_worker(prefetch_count: Optional[int] = None) -> None:
+    """Entrypoint for the ingestion worker process."""
+    IngestionWorker(prefetch_count=prefetch_count).run()
+
+
+if __name__ == "__main__":
+    run_worker()
@@ -1,3 +1,5 @@
+import asyncio
+
 from fastapi import APIRouter, Depends, Query, status
 
 from ..agentic.agent import rag_agent
@@ -45,7 +47,9 @@ async def create_chat_with_rag(
         else:
             rag_agent.create_flow(flow_type="collection")
 
-        shared_store = rag_agent.run(
+        # The flow blocks on the query batcher and LLM calls; keep the loop free
+        shared_store = await asyncio.to_thread(
+            rag_agent.run,
             collection_chat_id=chat.id,
             user_question=chat_data.message,
             references=None,
@@ -26,6 +26,108 @@ class Settings:
     RABBITMQ_PASSWORD: str = os.getenv("RABBITMQ_DEFAULT_PASS", "guest")
     RABBITMQ_VHOST: str = os.getenv("RABBITMQ_VHOST", "/")
 
+    # Ingestion worker settings
+    # Jobs a worker buffers and reorders fairly between users. Every buffered
+    # delivery must start before RabbitMQ's consumer_timeout (30 min by default)
+    # expires, so only raise this when jobs are short
+    INGESTION_PREFETCH_COUNT: int = int(os.getenv("INGESTION_PREFETCH_COUNT", "1"))
+    UPLOAD_CONCURRENCY: int = int(os.getenv("UPLOAD_CONCURRENCY", "4"))
+    # Chunks embedded and committed per ingestion checkpoint
+    INGESTION_CHUNK_BATCH_SIZE: int = int(
+        os.getenv("INGESTION_CHUNK_BATCH_SIZE", "256")
+    )
+
+    # Ingestion admission control and fair scheduling
+    INGESTION_ADMISSION_ENABLED: bool = (
+        os.getenv("INGESTION_ADMISSION_ENABLED", "true").lower() == "true"
+    )
+    INGESTION_MAX_JOBS_PER_USER: int = int(
+        os.getenv("INGESTION_MAX_JOBS_PER_USER", "20")
+    )
+    INGESTION_MAX_JOBS_PER_COLLECTION: int = int(
+        os.getenv("INGESTION_MAX_JOBS_PER_COLLECTION", "50")
+    )
+    INGESTION_MAX_JOBS_TOTAL: int = int(os.getenv("INGESTION_MAX_JOBS_TOTAL", "200"))
+    # Summed estimated cost of in-flight jobs (1 per job plus 1 per MiB)
+    INGESTION_COST_BUDGET: float = float(os.getenv("INGESTION_COST_BUDGET", "500"))
+    # Fair-share weights by user, e.g. "user_id:2,user_id:0.5"; default 1
+    INGESTION_TENANT_WEIGHTS: str = os.getenv("INGESTION_TENANT_WEIGHTS", "")
+
+    # Documents downloaded and rebuilt concurrently by a collection reindex
+    REINDEX_CONCURRENCY: int = int(os.getenv("REINDEX_CONCURRENCY", "4"))
+    # How long a worker owns a reindex without renewing its lease
+    REINDEX_LEASE_SECONDS: int = int(os.getenv("REINDEX_LEASE_SECONDS", "300"))
+
+    # PDF extraction settings
+    PDF_PARALLEL_PAGE_THRESHOLD: int = int(
+        os.getenv("PDF_PARALLEL_PAGE_THRESHOLD", "200")
+    )
+    PDF_PARALLEL_WORKERS: int = int(
+        os.getenv("PDF_PARALLEL_WORKERS", str(min(4, os.cpu_count() or 1)))
+    )
+
+    # Scanned-PDF OCR settings
+    PDF_OCR_ENABLED: bool = os.getenv("PDF_OCR_ENABLED", "true").lower() == "true"
+    PDF_OCR_CONCURRENCY: int = int(os.getenv("PDF_OCR_CONCURRENCY", "4"))
+    PDF_OCR_RETRIES: int = int(os.getenv("PDF_OCR_RETRIES", "2"))
+    PDF_OCR_DPI: int = int(os.getenv("PDF_OCR_DPI", "150"))
+    PDF_OCR_MIN_CHARACTERS: int = int(os.getenv("PDF_OCR_MIN_CHARACTERS", "16"))
+
+    # Load and warm up the embedding model during API startup
+    EMBEDDER_PRELOAD: bool = os.getenv("EMBEDDER_PRELOAD", "true").lower() == "true"
+
+    # Micro-batching of concurrent query embeddings (search, RAG)
+    EMBED_BATCHING_ENABLED: bool = (
+        os.getenv("EMBED_BATCHING_ENABLED", "true").lower() == "true"
+    )
+    EMBED_BATCH_MAX_SIZE: int = int(os.getenv("EMBED_BATCH_MAX_SIZE", "32"))
+    EMBED_BATCH_WAIT_MS: float = float(os.getenv("EMBED_BATCH_WAIT_MS", "5"))
+
+    # In-process LRU for query embeddings (search, RAG)
+    QUERY_EMBEDDING_CACHE_ENABLED: bool = (
+        os.getenv("QUERY_EMBEDDING_CACHE_ENABLED", "true").lower() == "true"
+    )
+    QUERY_EMBEDDING_CACHE_ITEMS: int = int(
+        os.getenv("QUERY_EMBEDDING_CACHE_ITEMS", "2048")
+    )
+    # 0 keeps entries until size-based eviction
+    QUERY_EMBEDDING_CACHE_TTL_SECONDS: float = float(
+        os.getenv("QUERY_EMBEDDING_CACHE_TTL_SECONDS", "3600")
+    )
+
+    # Embedding model; it must produce the 256-dim vectors chunks are stored as.
+    # The backend defaults to the one registered for the model
+    EMBEDDING_MODEL: str = os.getenv(
+        "EMBEDDING_MODEL", "FlukeTJ/bge-m3-m2v-distilled-256"
+    )
+    EMBEDDING_BACKEND: str = os.getenv("EMBEDDING_BACKEND", "")
+    # Texts encoded per model call when embedding document chunks
+    EMBEDDING_BATCH_SIZE: int = int(os.getenv("EMBEDDING_BATCH_SIZE", "64"))
+    # Instruction set of the int8 ONNX export the onnx backend loads
+    # (arm64, avx2, avx512 or avx512_vnni)
+    ONNX_QUANTIZATION: str = os.getenv("ONNX_QUANTIZATION", "avx2")
+
+    # Embedding cache settings
+    EMBEDDING_CACHE_ENABLED: bool = (
+        os.getenv("EMBEDDING_CACHE_ENABLED", "true").lower() == "true"
+    )
+    EMBEDDING_CACHE_MEMORY_ITEMS: int = int(
+        os.getenv("EMBEDDING_CACHE_MEMORY_ITEMS", "10000")
+    )
+    EMBEDDING_CACHE_MAX_ROWS: int = int(
+        os.getenv("EMBEDDING_CACHE_MAX_ROWS", "1000000")
+    )
+
+    # LLM artifact cache settings (OCR text, summaries, knowledge graphs)
+    ARTIFACT_CACHE_ENABLED: bool = (
+        os.getenv("ARTIFACT_CACHE_ENABLED", "true").lower() == "true"
+    )
+    # 0 keeps entries until size-based eviction
+    ARTIFACT_CACHE_TTL_SECONDS: int = int(
+        os.getenv("ARTIFACT_CACHE_TTL_SECONDS", str(30 * 24 * 3600))
+    )
+    ARTIFACT_CACHE_MAX_ROWS: int = int(os.getenv("ARTIFACT_CACHE_MAX_ROWS", "100000"))
+
     @property
     def MINIO_POLICY(self):
         return {
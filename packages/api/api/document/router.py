@@ -3,7 +3,7 @@
 from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlalchemy.orm import Session, joinedload
 
-from ..agentic.dependencies import TextEmbedder, get_text_embedder
+from ..agentic.dependencies import QueryEmbedder, get_query_embedder
 from ..auth.dependencies import get_current_user
 from ..database import get_db
 from ..models.document import Document, DocumentRelation
@@ -21,8 +21,10 @@ from .schemas import (
     ChunkResponse,
     ChunkSearchResponse,
     DocumentDetailResponse,
+    DocumentEdgeBase,
     DocumentEdgeCreate,
     DocumentEdgeResponse,
+    DocumentNodeBase,
     DocumentNodeCreate,
     DocumentNodeResponse,
     DocumentRelationCreate,
@@ -33,6 +35,7 @@ from .schemas import (
     DocumentSearchResponse,
     DocumentSearchResponseTruncated,
     DocumentUpdate,
+    IngestionRunResponse,
 )
 from .service import DocumentServiceSearch as DocumentService
 
@@ -48,6 +51,48 @@ def list_user_documents(
     return document_service.get_user_documents(current_user.id)
 
 
+# Declared before /{document_id}, which would otherwise capture GET /graph
+@router.post(
+    "/graph",
+    response_model=DocumentRelationWithNodes,
+    status_code=status.HTTP_201_CREATED,
+)
+def create_document_graph(
+    nodes: list[DocumentNodeBase],
+    edges: list[DocumentEdgeBase],
+    document: Document = Depends(get_document_with_modify_permission),
+    current_user: User = Depends(get_current_user),
+    document_service: DocumentService = Depends(get_document_service),
+):
+    """Create a document relation with nodes and edges in a single transaction."""
+    relation = document_service.create_document_graph(
+        relation_data=DocumentRelationCreate(
+            document_id=document.id,
+            title="Graph Relation",
+            description="Automatically created relation for graph",
+        ),
+        nodes_data=nodes,
+        edges_data=edges,
+        user=current_user,
+    )
+
+    return DocumentRelationWithNodes(
+        **DocumentRelationResponse.model_validate(relation).model_dump(),
+        nodes=[DocumentNodeResponse.model_validate(node) for node in relation.nodes],
+        edges=[DocumentEdgeResponse.model_validate(edge) for edge in relation.edges],
+    )
+
+
+@router.get("/graph", include_in_schema=False)
+def create_document_graph_via_get():
+    """Reject the original GET form of /graph, which now requires POST."""
+    raise HTTPException(
+        status_code=status.HTTP_405_METHOD_NOT_ALLOWED,
+        detail="Use POST /documents/graph to create a document graph",
+        headers={"Allow": "POST"},
+    )
+
+
 @router.get("/{document_id}", response_model=DocumentDetailResponse)
 def get_document(
     document: Document = Depends(get_document_or_404),
@@ -112,6 +157,15 @@ def list_document_chunks(
     return document_service.get_document_chunks(document.id)
 
 
+@router.get("/{document_id}/ingestion_runs", response_model=list[IngestionRunResponse])
+def list_document_ingestion_runs(
+    document: Document = Depends(get_document_or_404),
+    document_service: DocumentService = Depends(get_document_service),
+):
+    """List the ingestion runs of a document with their stage timings."""
+    return document_service.get_ingestion_runs(document.id)
+
+
 # Search Documents Chunks
 @router.post(
     "/{document_id}/chunks/search",
@@ -126,7 +180,7 @@ def search_document_chunks(
         min_length=1,
         description="Search query for chunks",
     ),
-    text_embedder: TextEmbedder = Depends(get_text_embedder),
+    text_embedder: QueryEmbedder = Depends(get_query_embedder),
     document_service: DocumentService = Depends(get_document_service),
 ) -> list[ChunkSearchResponse]:
     """Search for chunks in a document."""
@@ -153,7 +207,7 @@ def search_collection_chunks(
         min_length=1,
         description="Search query for chunks",
     ),
-    text_embedder: TextEmbedder = Depends(get_text_embedder),
+    text_embedder: QueryEmbedder = Depends(get_query_embedder),
     document_service: DocumentService = Depends(get_document_service),
 ) -> list[ChunkSearchResponse]:
     """Search for chunks in a collection."""
@@ -180,7 +234,7 @@ def search_collection_documents(
         min_length=1,
         description="Search query for documents",
     ),
-    text_embedder: TextEmbedder = Depends(get_text_embedder),
+    text_embedder: QueryEmbedder = Depends(get_query_embedder),
     document_service: DocumentService = Depends(get_document_service),
 ) -> list[DocumentSearchResponse]:
     """Search for documents in a collection."""
@@ -228,33 +282,6 @@ def create_document_relation(
     return document_service.create_document_relation(relation_data, current_user)
 
 
-@router.get("/graph", response_model=DocumentRelationResponse)
-def create_document_graph(
-    document_id: str,
-    nodes: list[DocumentNodeCreate],
-    edges: list[DocumentEdgeCreate],
-    current_user: User = Depends(get_current_user),
-) -> DocumentRelation:
-    """Create a document relation with nodes and edges."""
-    # Create the relation
-    relation = create_document_relation(
-        DocumentRelationCreate(
-            document_id=document_id,
-            title="Graph Relation",
-            description="Automatically created relation for graph",
-        ),
-    )
-    # Create nodes
-    for node_data in nodes:
-        create_document_node(node_data=node_data, user=current_user)
-
-    # Create edges
-    for edge_data in edges:
-        create_document_edge(edge_data=edge_data, user=current_user)
-
-    return relation
-
-
 @router.get("/{document_id}/relations", response_model=list[DocumentRelationWithNodes])
 def list_document_relations(
     document: Document = Depends(get_document_or_404),
@@ -22,6 +22,9 @@ class DocumentBase(BaseModel):
     source_file_path: str = Field(..., description="Source file path")
     file_type: str = Field(..., description="File type (pdf, txt, doc, etc.)")
     file_size: Optional[int] = Field(None, ge=0, description="File size in bytes")
+    content_hash: Optional[str] = Field(
+        None, description="SHA-256 hex digest of the uploaded file bytes"
+    )
 
 
 class DocumentCreate(DocumentBase):
@@ -52,6 +55,18 @@ class DocumentUpdate(BaseModel):
     is_graph_extracted: Optional[bool] = Field(
         None, description="Whether knowledge graph is extracted"
     )
+    embedding_model: Optional[str] = Field(
+        None, description="Model that produced the chunk embeddings"
+    )
+    is_text_extracted: Optional[bool] = Field(
+        None, description="Whether the full text is extracted and stored"
+    )
+    is_summarized: Optional[bool] = Field(
+        None, description="Whether the title and description are generated"
+    )
+    chunks_persisted: Optional[int] = Field(
+        None, ge=0, description="Number of chunks processed by the vector stage"
+    )
     summary: Optional[str] = Field(
         None, max_length=1000, description="Document summary"
     )
@@ -67,6 +82,10 @@ class DocumentResponse(DocumentBase):
     collection_id: str
     is_vectorized: bool
     is_graph_extracted: bool
+    is_text_extracted: bool = False
+    is_summarized: bool = False
+    chunks_persisted: int = 0
+    embedding_model: Optional[str] = None
     status: enum.IngestionStatus
     created_at: datetime
     updated_at: datetime
@@ -312,3 +331,44 @@ class DocumentDetailResponse(DocumentResponse):
 
     chunks: list[ChunkResponse] = []
     relations: list[DocumentRelationWithNodes] = []
+
+
+class IngestionRunResponse(BaseModel):
+    """Schema for an ingestion run with its stage timings."""
+
+    id: str
+    document_id: str
+    status: enum.IngestionStatus
+    incremental: bool
+    started_at: datetime
+    finished_at: Optional[datetime]
+    duration_seconds: Optional[float]
+    stage_timings: Optional[dict[str, float]] = Field(
+        None, description="Wall-clock seconds spent in each ingestion stage"
+    )
+    file_size: Optional[int]
+    page_count: Optional[int]
+    chunk_count: Optional[int]
+    token_count: Optional[int]
+    error: Optional[str]
+
+    class Config:
+        from_attributes = True
+
+
+class CollectionReindexResponse(BaseModel):
+    """Schema for a collection reindex and its progress."""
+
+    id: str
+    collection_id: str
+    status: enum.IngestionStatus
+    total_documents: int
+    processed_documents: int
+    failed_documents: int
+    chunk_count: int
+    error: Optional[str]
+    started_at: datetime
+    finished_at: Optional[datetime]
+
+    class Config:
+        from_attributes = True
@@ -1,19 +1,41 @@
 """Document service for managing documents and related entities."""
 
+import hashlib
+from collections.abc import Iterator
+from contextlib import contextmanager
+from datetime import timedelta
 from typing import Optional
-from uuid import uuid4
+from uuid import NAMESPACE_URL, uuid4, uuid5
 
 from fastapi import HTTPException, UploadFile, status
-from sqlalchemy import text
+from sqlalchemy import (
+    Text,
+    cast,
+    column,
+    delete,
+    func,
+    insert,
+    literal,
+    or_,
+    select,
+    text,
+    update,
+    values,
+)
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.orm import Session, aliased, joinedload
 
 from ..models.document import (
     Chunk,
+    ChunkShadow,
+    CollectionReindex,
     Document,
     DocumentEdge,
     DocumentNode,
     DocumentRelation,
+    IngestionRun,
 )
+from ..models.enum import IngestionStatus
 from ..models.user import User
 from ..storage import storage_service
 from .schemas import (
@@ -22,7 +44,9 @@ from .schemas import (
     ChunkSearchResponse,
     ChunkUpdate,
     DocumentCreate,
+    DocumentEdgeBase,
     DocumentEdgeCreate,
+    DocumentNodeBase,
     DocumentNodeCreate,
     DocumentRelationCreate,
     DocumentResponse,
@@ -31,6 +55,27 @@ from .schemas import (
 )
 
 
+def hash_chunk_text(chunk_text: str) -> str:
+    """Content hash stored on chunks and used to diff them on re-ingestion."""
+    return hashlib.sha256(chunk_text.encode("utf-8")).hexdigest()
+
+
+def make_chunk_id(document_id: str, start_char: Optional[int], chunk_text: str) -> str:
+    """
+    Deterministic chunk ID from its document, start offset and text, so
+    re-running the same chunking yields the same IDs.
+    """
+    name = f"chunk:{document_id}:{start_char}:{hash_chunk_text(chunk_text)}"
+    return str(uuid5(NAMESPACE_URL, name))
+
+
+def stable_chunk_id(chunk_data: ChunkCreate) -> str:
+    """Deterministic ID of a chunk about to be stored."""
+    return make_chunk_id(
+        chunk_data.document_id, chunk_data.start_char, chunk_data.chunk_text
+    )
+
+
 class DocumentService:
     """Service for managing documents and related operations."""
 
@@ -50,6 +95,7 @@ class DocumentService:
             source_file_path=document_data.source_file_path,
             file_type=document_data.file_type,
             file_size=document_data.file_size,
+            content_hash=document_data.content_hash,
             collection_id=document_data.collection_id,
             created_by=user.id,
             updated_by=user.id,
@@ -64,6 +110,183 @@ class DocumentService:
         """Get a document by ID."""
         return self.db.query(Document).filter(Document.id == document_id).first()
 
+    def find_processed_document_by_hash(
+        self,
+        content_hash: str,
+        user: User,
+        exclude_document_id: Optional[str] = None,
+        embedding_model: Optional[str] = None,
+    ) -> Optional[Document]:
+        """
+        Find a fully ingested document with the same file content hash that
+        ``user`` can view, embedded with ``embedding_model`` when given.
+
+        Artifacts may have been edited by their owner, so documents of other
+        users are never reused.
+        """
+        query = self.db.query(Document).filter(
+            Document.content_hash == content_hash,
+            Document.status == IngestionStatus.ready,
+            Document.is_vectorized.is_(True),
+            # Same rule as _can_view_document
+            Document.created_by == user.id,
+        )
+        if embedding_model:
+            query = query.filter(Document.embedding_model == embedding_model)
+        if exclude_document_id:
+            query = query.filter(Document.id != exclude_document_id)
+        return query.order_by(Document.created_at.asc()).first()
+
+    def clone_document_artifacts(
+        self, source: Document, target_id: str, user: User
+    ) -> Document:
+        """
+        Copy the processed artifacts of ``source`` onto another document.
+
+        Text, summary, chunks (with embeddings) and knowledge graphs are copied
+        with INSERT ... SELECT inside one transaction, so no vectors leave the
+        database. Cloned chunks get the deterministic IDs of the target.
+        """
+        target = self.get_document(target_id)
+        if not target:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND, detail="Document not found"
+            )
+
+        source_chunks = self.db.execute(
+            select(Chunk.id, Chunk.start_char, Chunk.chunk_text).where(
+                Chunk.document_id == source.id
+            )
+        ).all()
+
+        try:
+            target.title = source.title
+            target.document = source.document
+            target.description = source.description
+            target.summary = source.summary
+            target.is_vectorized = source.is_vectorized
+            target.embedding_model = source.embedding_model
+            target.is_graph_extracted = source.is_graph_extracted
+            target.is_text_extracted = source.is_text_extracted
+            target.is_summarized = source.is_summarized
+            target.chunks_persisted = source.chunks_persisted
+            target.updated_by = user.id
+
+            if source_chunks:
+                chunk_ids = values(
+                    column("source_id", Text), column("chunk_id", Text), name="ids"
+                ).data(
+                    [
+                        (
+                            chunk.id,
+                            make_chunk_id(
+                                target_id, chunk.start_char, chunk.chunk_text
+                            ),
+                        )
+                        for chunk in source_chunks
+                    ]
+                )
+                self.db.execute(
+                    insert(Chunk).from_select(
+                        [
+                            "id",
+                            "document_id",
+                            "chunk_text",
+                            "content_hash",
+                            "embedding",
+                            "page_number",
+                            "start_char",
+                            "end_char",
+                            "token_count",
+                            "created_by",
+                            "updated_by",
+                        ],
+                        select(
+                            chunk_ids.c.chunk_id,
+                            literal(target_id),
+                            Chunk.chunk_text,
+                            Chunk.content_hash,
+                            Chunk.embedding,
+                            Chunk.page_number,
+                            Chunk.start_char,
+                            Chunk.end_char,
+                            Chunk.token_count,
+                            literal(user.id),
+                            literal(user.id),
+                        ).join_from(
+                            Chunk, chunk_ids, chunk_ids.c.source_id == Chunk.id
+                        ),
+                    )
+                )
+
+            for relation in self.get_document_relations(source.id):
+                relation_id = str(uuid4())
+                self.db.add(
+                    DocumentRelation(
+                        id=relation_id,
+                        document_id=target_id,
+                        title=relation.title,
+                        description=relation.description,
+                        created_by=user.id,
+                        updated_by=user.id,
+                    )
+                )
+                self.db.flush()
+                self.db.execute(
+                    insert(DocumentNode).from_select(
+                        [
+                            "id",
+                            "document_relation_id",
+                            "title",
+                            "description",
+                            "type",
+                            "label",
+                            "created_by",
+                            "updated_by",
+                        ],
+                        select(
+                            cast(func.gen_random_uuid(), Text),
+                            literal(relation_id),
+                            DocumentNode.title,
+                            DocumentNode.description,
+                            DocumentNode.type,
+                            DocumentNode.label,
+                            literal(user.id),
+                            literal(user.id),
+                        ).where(DocumentNode.document_relation_id == relation.id),
+                    )
+                )
+                self.db.execute(
+                    insert(DocumentEdge).from_select(
+                        [
+                            "id",
+                            "document_relation_id",
+                            "label",
+                            "source",
+                            "target",
+                            "created_by",
+                            "updated_by",
+                        ],
+                        select(
+                            cast(func.gen_random_uuid(), Text),
+                            literal(relation_id),
+                            DocumentEdge.label,
+                            DocumentEdge.source,
+                            DocumentEdge.target,
+                            literal(user.id),
+                            literal(user.id),
+                        ).where(DocumentEdge.document_relation_id == relation.id),
+                    )
+                )
+
+            self.db.commit()
+        except Exception:
+            self.db.rollback()
+            raise
+
+        self.db.refresh(target)
+        return target
+
     def get_collection_documents(self, collection_id: str) -> list[DocumentResponse]:
         """Get all documents in a collection, with created_by and updated_by replaced by usernames."""
         creator_alias = aliased(User)
@@ -128,6 +351,58 @@ class DocumentService:
             .all()
         )
 
+    def get_in_flight_documents(self) -> list:
+        """Get owner, collection, size and type of documents queued or ingesting."""
+        return self.db.execute(
+            select(
+                Document.created_by,
+                Document.collection_id,
+                Document.file_size,
+                Document.file_type,
+            ).where(
+                Document.status.in_(
+                    [IngestionStatus.pending, IngestionStatus.processing]
+                )
+            )
+        ).all()
+
+    def count_in_flight_collection_documents(self, collection_id: str) -> int:
+        """Count the documents of a collection that are queued or ingesting."""
+        return self.db.scalar(
+            select(func.count())
+            .select_from(Document)
+            .where(
+                Document.collection_id == collection_id,
+                Document.status.in_(
+                    [IngestionStatus.pending, IngestionStatus.processing]
+                ),
+            )
+        )
+
+    @contextmanager
+    def try_lock_collection(self, collection_id: str) -> Iterator[bool]:
+        """
+        Hold a session-level advisory lock on a collection, taken without
+        waiting; yields False if another session holds it.
+
+        The lock lives on its own connection, because the ORM session hands
+        its connection back to the pool on every commit.
+        """
+        key = {"key": f"collection:{collection_id}"}
+        with self.db.get_bind().connect() as connection:
+            locked = bool(
+                connection.scalar(
+                    text("SELECT pg_try_advisory_lock(hashtext(:key))"), key
+                )
+            )
+            try:
+                yield locked
+            finally:
+                if locked:
+                    connection.execute(
+                        text("SELECT pg_advisory_unlock(hashtext(:key))"), key
+                    )
+
     def update_document(
         self, document_id: str, update_data: DocumentUpdate, user: User
     ) -> Document:
@@ -156,6 +431,20 @@ class DocumentService:
         self.db.refresh(document)
         return document
 
+    def fail_document(self, document_id: str) -> None:
+        """Mark a document failed on behalf of the ingestion worker."""
+        self.db.rollback()
+        try:
+            self.db.execute(
+                update(Document)
+                .where(Document.id == document_id)
+                .values(status=IngestionStatus.failed)
+            )
+            self.db.commit()
+        except Exception:
+            self.db.rollback()
+            raise
+
     def delete_document(self, document_id: str, user: User) -> bool:
         """Delete a document."""
         document = self.get_document(document_id)
@@ -212,6 +501,387 @@ class DocumentService:
         doc_dict["minio_file_url"] = self.get_file_url(doc.source_file_path, None)
         return doc_dict
 
+    # Ingestion run operations
+    def start_ingestion_run(
+        self, document_id: str, user: User, incremental: bool = False
+    ) -> IngestionRun:
+        """Record the start of an ingestion run."""
+        document = self.get_document(document_id)
+        run = IngestionRun(
+            id=str(uuid4()),
+            document_id=document_id,
+            status=IngestionStatus.processing,
+            incremental=incremental,
+            file_size=document.file_size if document else None,
+            created_by=user.id,
+        )
+        try:
+            self.db.add(run)
+            self.db.commit()
+        except Exception:
+            self.db.rollback()
+            raise
+        self.db.refresh(run)
+        return run
+
+    def finish_ingestion_run(
+        self,
+        run_id: str,
+        status: IngestionStatus,
+        duration_seconds: float,
+        stage_timings: dict[str, float],
+        page_count: Optional[int] = None,
+        chunk_count: Optional[int] = None,
+        token_count: Optional[int] = None,
+        error: Optional[str] = None,
+    ) -> Optional[IngestionRun]:
+        """Store the outcome and metrics of an ingestion run."""
+        run = self.db.query(IngestionRun).filter(IngestionRun.id == run_id).first()
+        if not run:
+            return None
+
+        run.status = status
+        run.finished_at = func.current_timestamp()
+        run.duration_seconds = duration_seconds
+        run.stage_timings = stage_timings
+        run.page_count = page_count
+        run.chunk_count = chunk_count
+        run.token_count = token_count
+        run.error = error
+
+        self.db.commit()
+        self.db.refresh(run)
+        return run
+
+    def get_ingestion_runs(self, document_id: str) -> list[IngestionRun]:
+        """Get the ingestion runs of a document, newest first."""
+        return (
+            self.db.query(IngestionRun)
+            .filter(IngestionRun.document_id == document_id)
+            .order_by(IngestionRun.started_at.desc())
+            .all()
+        )
+
+    def get_recent_ingestion_runs(
+        self,
+        limit: int = 1000,
+        status: IngestionStatus = IngestionStatus.ready,
+        user_id: Optional[str] = None,
+    ) -> list[IngestionRun]:
+        """
+        Get the most recent finished ingestion runs, across all documents or
+        only those of documents created by ``user_id``.
+        """
+        query = self.db.query(IngestionRun).filter(IngestionRun.status == status)
+        if user_id:
+            query = query.join(
+                Document, IngestionRun.document_id == Document.id
+            ).filter(Document.created_by == user_id)
+        return query.order_by(IngestionRun.started_at.desc()).limit(limit).all()
+
+    # Collection reindex operations
+    def start_collection_reindex(
+        self, collection_id: str, user: User
+    ) -> CollectionReindex:
+        """Record a pending reindex of a collection; 409 if one is running."""
+        if self.get_active_collection_reindex(collection_id):
+            raise HTTPException(
+                status_code=status.HTTP_409_CONFLICT,
+                detail="A reindex of this collection is already running",
+            )
+        reindex = CollectionReindex(
+            id=str(uuid4()),
+            collection_id=collection_id,
+            status=IngestionStatus.pending,
+            total_documents=len(self.get_reindexable_documents(collection_id)),
+            created_by=user.id,
+        )
+        self.db.add(reindex)
+        self.db.commit()
+        self.db.refresh(reindex)
+        return reindex
+
+    def get_collection_reindex(self, reindex_id: str) -> Optional[CollectionReindex]:
+        """Get a collection reindex by ID."""
+        return (
+            self.db.query(CollectionReindex)
+            .filter(CollectionReindex.id == reindex_id)
+            .first()
+        )
+
+    def get_latest_collection_reindex(
+        self, collection_id: str
+    ) -> Optional[CollectionReindex]:
+        """Get the most recently started reindex of a collection."""
+        return (
+            self.db.query(CollectionReindex)
+            .filter(CollectionReindex.collection_id == collection_id)
+            .order_by(CollectionReindex.started_at.desc())
+            .first()
+        )
+
+    def get_active_collection_reindex(
+        self, collection_id: str
+    ) -> Optional[CollectionReindex]:
+        """Get the pending or running reindex of a collection, if any."""
+        return (
+            self.db.query(CollectionReindex)
+            .filter(
+                CollectionReindex.collection_id == collection_id,
+                CollectionReindex.status.in_(
+                    [IngestionStatus.pending, IngestionStatus.processing]
+                ),
+            )
+            .first()
+        )
+
+    def get_reindexable_documents(self, collection_id: str) -> list:
+        """
+        Get the ID, name, type and storage path of the ingested documents of a
+        collection, oldest first.
+        """
+        return self.db.execute(
+            select(
+                Document.id,
+                Document.file_name,
+                Document.file_type,
+                Document.source_file_path,
+            )
+            .where(
+                Document.collection_id == collection_id,
+                Document.status == IngestionStatus.ready,
+            )
+            .order_by(Document.created_at)
+        ).all()
+
+    def get_shadowed_document_ids(self, reindex_id: str) -> set[str]:
+        """Get the documents that already have shadow chunks in a reindex."""
+        return set(
+            self.db.scalars(
+                select(ChunkShadow.document_id)
+                .where(ChunkShadow.reindex_id == reindex_id)
+                .distinct()
+            ).all()
+        )
+
+    def insert_shadow_chunks(
+        self, reindex_id: str, chunks_data: list[ChunkCreate], user: User
+    ) -> None:
+        """Idempotently store rebuilt chunks of one document for a reindex."""
+        if not chunks_data:
+            return
+        rows = []
+        for chunk_data in chunks_data:
+            row = self._chunk_row(
+                chunk_data, user, chunk_id=stable_chunk_id(chunk_data)
+            )
+            del row["updated_by"]
+            rows.append({**row, "reindex_id": reindex_id})
+        try:
+            self.db.execute(
+                pg_insert(ChunkShadow).on_conflict_do_nothing(
+                    index_elements=["reindex_id", "id"]
+                ),
+                rows,
+            )
+            self.db.commit()
+        except Exception:
+            self.db.rollback()
+            raise
+
+    def acquire_collection_reindex_lease(
+        self, reindex_id: str, owner: str, lease_seconds: int
+    ) -> bool:
+        """
+        Claim or renew an unfinished reindex for ``owner`` until the lease
+        expires. Returns False if another worker holds an unexpired lease.
+        """
+        result = self.db.execute(
+            update(CollectionReindex)
+            .where(
+                CollectionReindex.id == reindex_id,
+                CollectionReindex.status.in_(
+                    [IngestionStatus.pending, IngestionStatus.processing]
+                ),
+                or_(
+                    CollectionReindex.lease_owner.is_(None),
+                    CollectionReindex.lease_owner == owner,
+                    CollectionReindex.lease_expires_at < func.current_timestamp(),
+                ),
+            )
+            .values(
+                lease_owner=owner,
+                lease_expires_at=func.current_timestamp()
+                + timedelta(seconds=lease_seconds),
+            )
+        )
+        self.db.commit()
+        return result.rowcount == 1
+
+    def release_collection_reindex_lease(self, reindex_id: str, owner: str) -> None:
+        """Give up a reindex lease held by ``owner``."""
+        self.db.execute(
+            update(CollectionReindex)
+            .where(
+                CollectionReindex.id == reindex_id,
+                CollectionReindex.lease_owner == owner,
+            )
+            .values(lease_owner=None, lease_expires_at=None)
+        )
+        self.db.commit()
+
+    def update_collection_reindex(self, reindex_id: str, **values) -> None:
+        """Update the status or progress counters of a reindex."""
+        self.db.execute(
+            update(CollectionReindex)
+            .where(CollectionReindex.id == reindex_id)
+            .values(**values)
+        )
+        self.db.commit()
+
+    def swap_collection_reindex(
+        self,
+        reindex_id: str,
+        user: User,
+        embedding_model: Optional[str] = None,
+        lease_owner: Optional[str] = None,
+    ) -> int:
+        """
+        Replace the live chunks of every rebuilt document with its shadow
+        chunks in one transaction, then mark the reindex ready.
+
+        Chunks whose stable ID survives are updated in place, so chat
+        references to them are kept. Documents that failed to rebuild keep
+        their old chunks, and so do documents updated after the reindex
+        started, whose shadow chunks may be stale. With ``lease_owner`` the
+        swap only happens while that worker still holds the reindex lease.
+        Returns the number of documents swapped.
+        """
+        columns = [
+            "id",
+            "document_id",
+            "chunk_text",
+            "content_hash",
+            "embedding",
+            "page_number",
+            "start_char",
+            "end_char",
+            "token_count",
+            "created_by",
+        ]
+        shadow = select(ChunkShadow).where(ChunkShadow.reindex_id == reindex_id)
+        started_at = (
+            select(CollectionReindex.started_at)
+            .where(CollectionReindex.id == reindex_id)
+            .scalar_subquery()
+        )
+        shadow_document = aliased(Document)
+        rebuilt_ids = (
+            shadow.with_only_columns(ChunkShadow.document_id)
+            .join(shadow_document, shadow_document.id == ChunkShadow.document_id)
+            .where(shadow_document.updated_at <= started_at)
+            .distinct()
+        )
+        shadow_chunk_count = (
+            select(func.count())
+            .select_from(ChunkShadow)
+            .where(
+                ChunkShadow.reindex_id == reindex_id,
+                ChunkShadow.document_id == Document.id,
+            )
+            .scalar_subquery()
+        )
+
+        try:
+            if lease_owner is not None:
+                # Lock the reindex row so the lease cannot change hands mid-swap
+                owner = self.db.scalar(
+                    select(CollectionReindex.lease_owner)
+                    .where(CollectionReindex.id == reindex_id)
+                    .with_for_update()
+                )
+                if owner != lease_owner:
+                    raise RuntimeError(f"Lost the lease on reindex {reindex_id}")
+
+            swapped_ids = list(self.db.scalars(rebuilt_ids).all())
+            self.db.execute(
+                delete(Chunk).where(
+                    Chunk.document_id.in_(swapped_ids),
+                    Chunk.id.not_in(shadow.with_only_columns(ChunkShadow.id)),
+                )
+            )
+            statement = pg_insert(Chunk).from_select(
+                [*columns, "updated_by"],
+                shadow.with_only_columns(
+                    *(getattr(ChunkShadow, column) for column in columns),
+                    literal(user.id),
+                ).where(ChunkShadow.document_id.in_(swapped_ids)),
+            )
+            self.db.execute(
+                statement.on_conflict_do_update(
+                    index_elements=["id"],
+                    set_={
+                        column: getattr(statement.excluded, column)
+                        for column in columns[2:-1] + ["updated_by"]
+                    },
+                )
+            )
+            self.db.execute(
+                update(Document)
+                .where(Document.id.in_(swapped_ids))
+                .values(
+                    is_vectorized=True,
+                    embedding_model=embedding_model,
+                    chunks_persisted=shadow_chunk_count,
+                    updated_by=user.id,
+                )
+            )
+            self.db.execute(
+                delete(ChunkShadow).where(ChunkShadow.reindex_id == reindex_id)
+            )
+            self.db.execute(
+                update(CollectionReindex)
+                .where(CollectionReindex.id == reindex_id)
+                .values(
+                    status=IngestionStatus.ready,
+                    finished_at=func.current_timestamp(),
+                    lease_owner=None,
+                    lease_expires_at=None,
+                )
+            )
+            self.db.commit()
+        except Exception:
+            self.db.rollback()
+            raise
+        return len(swapped_ids)
+
+    def fail_collection_reindex(
+        self, reindex_id: str, error: str, lease_owner: Optional[str] = None
+    ) -> None:
+        """
+        Drop the shadow chunks of a reindex and mark it failed, unless
+        another worker has taken over the lease of ``lease_owner``.
+        """
+        self.db.rollback()
+        statement = (
+            update(CollectionReindex)
+            .where(CollectionReindex.id == reindex_id)
+            .values(
+                status=IngestionStatus.failed,
+                error=error,
+                finished_at=func.current_timestamp(),
+                lease_owner=None,
+                lease_expires_at=None,
+            )
+        )
+        if lease_owner is not None:
+            statement = statement.where(CollectionReindex.lease_owner == lease_owner)
+        if self.db.execute(statement).rowcount:
+            self.db.execute(
+                delete(ChunkShadow).where(ChunkShadow.reindex_id == reindex_id)
+            )
+        self.db.commit()
+
     # Chunk CRUD operations
     def create_chunk(self, chunk_data: ChunkCreate, user: User) -> Chunk:
         """Create a new chunk."""
@@ -219,6 +889,7 @@ class DocumentService:
             id=str(uuid4()),
             document_id=chunk_data.document_id,
             chunk_text=chunk_data.chunk_text,
+            content_hash=hash_chunk_text(chunk_data.chunk_text),
             embedding=chunk_data.embedding,
             start_char=chunk_data.start_char,
             page_number=chunk_data.page_number,
@@ -233,6 +904,107 @@ class DocumentService:
         self.db.refresh(chunk)
         return chunk
 
+    def _chunk_row(
+        self, chunk_data: ChunkCreate, user: User, chunk_id: Optional[str] = None
+    ) -> dict:
+        """Build an insert row for a chunk."""
+        return {
+            "id": chunk_id or str(uuid4()),
+            "document_id": chunk_data.document_id,
+            "chunk_text": chunk_data.chunk_text,
+            "content_hash": hash_chunk_text(chunk_data.chunk_text),
+            "embedding": chunk_data.embedding,
+            "start_char": chunk_data.start_char,
+            "page_number": chunk_data.page_number,
+            "end_char": chunk_data.end_char,
+            "token_count": chunk_data.token_count,
+            "created_by": user.id,
+            "updated_by": user.id,
+        }
+
+    def persist_chunk_batch(
+        self,
+        document_id: str,
+        chunks_data: list[ChunkCreate],
+        chunks_persisted: int,
+        user: User,
+    ) -> None:
+        """
+        Idempotently insert a batch of chunks and advance the document's
+        chunk checkpoint in the same transaction.
+
+        Chunks get stable IDs and conflicting rows are skipped, so replaying a
+        batch after a crash never duplicates chunks.
+        """
+        rows = [
+            self._chunk_row(chunk_data, user, chunk_id=stable_chunk_id(chunk_data))
+            for chunk_data in chunks_data
+        ]
+        try:
+            if rows:
+                self.db.execute(
+                    pg_insert(Chunk).on_conflict_do_nothing(index_elements=["id"]),
+                    rows,
+                )
+            self.db.execute(
+                update(Document)
+                .where(Document.id == document_id)
+                .values(chunks_persisted=chunks_persisted, updated_by=user.id)
+            )
+            self.db.commit()
+        except Exception:
+            self.db.rollback()
+            raise
+
+    def get_chunk_fingerprints(self, document_id: str) -> list:
+        """
+        Get the hash and position of every chunk of a document, without the
+        text or embedding, in document order.
+        """
+        return self.db.execute(
+            select(
+                Chunk.id,
+                Chunk.content_hash,
+                Chunk.page_number,
+                Chunk.start_char,
+                Chunk.end_char,
+                Chunk.token_count,
+            )
+            .where(Chunk.document_id == document_id)
+            .order_by(Chunk.start_char)
+        ).all()
+
+    def apply_chunk_changes(
+        self,
+        inserts: list[ChunkCreate],
+        updates: list[dict],
+        delete_ids: list[str],
+        user: User,
+    ) -> list[str]:
+        """
+        Apply a chunk diff in one transaction.
+
+        ``updates`` are dicts with a chunk ``id`` and the columns to change.
+        Returns the IDs of the inserted chunks.
+        """
+        rows = [self._chunk_row(chunk_data, user) for chunk_data in inserts]
+        try:
+            if delete_ids:
+                self.db.execute(delete(Chunk).where(Chunk.id.in_(delete_ids)))
+            if updates:
+                # Bulk UPDATE by primary key
+                self.db.execute(
+                    update(Chunk), [{**row, "updated_by": user.id} for row in updates]
+                )
+            if rows:
+                self.db.execute(insert(Chunk), rows)
+            self.db.commit()
+        except Exception:
+            self.db.rollback()
+            raise
+
+        return [row["id"] for row in rows]
+
     def get_document_chunks(
         self, document_id: str, embedding: bool = False
     ) -> list[Chunk]:
@@ -261,6 +1033,7 @@ class DocumentService:
         # Update fields if provided
         if update_data.chunk_text is not None:
             chunk.chunk_text = update_data.chunk_text
+            chunk.content_hash = hash_chunk_text(update_data.chunk_text)
         if update_data.page_number is not None:
             chunk.page_number = update_data.page_number
         if update_data.end_char is not None:
@@ -365,6 +1138,90 @@ class DocumentService:
         self.db.refresh(edge)
         return edge
 
+    # Bulk graph operations
+    def _node_row(
+        self, node_data: DocumentNodeBase, relation_id: str, user: User
+    ) -> dict:
+        """Build an insert row for a document node."""
+        return {
+            "id": str(uuid4()),
+            "document_relation_id": relation_id,
+            "title": node_data.title,
+            "description": node_data.description,
+            "type": node_data.type,
+            "label": node_data.label,
+            "created_by": user.id,
+            "updated_by": user.id,
+        }
+
+    def _edge_row(
+        self, edge_data: DocumentEdgeBase, relation_id: str, user: User
+    ) -> dict:
+        """Build an insert row for a document edge."""
+        return {
+            "id": str(uuid4()),
+            "document_relation_id": relation_id,
+            "label": edge_data.label,
+            "source": edge_data.source,
+            "target": edge_data.target,
+            "created_by": user.id,
+            "updated_by": user.id,
+        }
+
+    def create_document_graph(
+        self,
+        relation_data: DocumentRelationCreate,
+        nodes_data: list[DocumentNodeBase],
+        edges_data: list[DocumentEdgeBase],
+        user: User,
+    ) -> DocumentRelation:
+        """
+        Create a document relation with all of its nodes and edges.
+
+        The relation, nodes and edges are written in one transaction together
+        with the document's is_graph_extracted flag, so a failure leaves no
+        partial graph behind.
+        """
+        relation = DocumentRelation(
+            id=str(uuid4()),
+            document_id=relation_data.document_id,
+            title=relation_data.title,
+            description=relation_data.description,
+            created_by=user.id,
+            updated_by=user.id,
+        )
+
+        try:
+            self.db.add(relation)
+            self.db.flush()
+
+            node_rows = [
+                self._node_row(node_data, relation.id, user) for node_data in nodes_data
+            ]
+            if node_rows:
+                self.db.execute(insert(DocumentNode), node_rows)
+
+            edge_rows = [
+                self._edge_row(edge_data, relation.id, user) for edge_data in edges_data
+            ]
+            if edge_rows:
+                self.db.execute(insert(DocumentEdge), edge_rows)
+
+            # Checkpoint in the same transaction so a retry never duplicates it
+            self.db.execute(
+                update(Document)
+                .where(Document.id == relation_data.document_id)
+                .values(is_graph_extracted=True, updated_by=user.id)
+            )
+
+            self.db.commit()
+        except Exception:
+            self.db.rollback()
+            raise
+
+        self.db.refresh(relation)
+        return relation
+
     # Permission helpers
     def _can_modify_document(self, document: Document, user: User) -> bool:
         """Check if user can modify the document."""
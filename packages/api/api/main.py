@@ -1,17 +1,66 @@
 """FastAPI application."""
 
+import asyncio
+from contextlib import asynccontextmanager, suppress
+
 from dotenv import load_dotenv
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from loguru import logger
 
+from api.agentic.dependencies import close_query_embedder, text_embedder_provider
+from api.config import get_settings
 from api.v1.routers import api_router
 
 # Load environment variables
 load_dotenv()
 
+
+# Backoff between embedding model preload attempts
+PRELOAD_RETRY_SECONDS = 5.0
+PRELOAD_RETRY_MAX_SECONDS = 60.0
+
+
+async def preload_embedder() -> None:
+    """Load the embedding model, retrying with backoff until it succeeds."""
+    delay = PRELOAD_RETRY_SECONDS
+    while True:
+        try:
+            await asyncio.to_thread(text_embedder_provider.load)
+            return
+        except Exception as e:
+            logger.warning(f"Embedding model preload failed, retrying in {delay}s: {e}")
+        await asyncio.sleep(delay)
+        delay = min(delay * 2, PRELOAD_RETRY_MAX_SECONDS)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    Load and warm up the embedding model before serving requests, and stop
+    the query embedding batcher on shutdown. If the first load fails, the API
+    serves anyway and keeps retrying in the background; /v1/health/ready
+    stays 503 until the model is loaded.
+    """
+    preload = None
+    if get_settings().EMBEDDER_PRELOAD:
+        try:
+            await asyncio.to_thread(text_embedder_provider.load)
+        except Exception as e:
+            logger.error(f"Embedding model preload failed: {e}")
+            preload = asyncio.create_task(preload_embedder())
+    yield
+    if preload is not None:
+        preload.cancel()
+        with suppress(asyncio.CancelledError):
+            await preload
+    close_query_embedder()
+
+
 app = FastAPI(
     title="The Codex API",
     version="1.0.0",
+    lifespan=lifespan,
 )
 
 # Configure CORS
@@ -37,7 +86,9 @@ def main():
     import uvicorn
 
     parser = argparse.ArgumentParser(description="Agentic RAG API and Flows")
-    parser.add_argument("command", choices=["serve"], help="Command to run.")
+    parser.add_argument(
+        "command", choices=["serve", "worker", "export-onnx"], help="Command to run."
+    )
     parser.add_argument(
         "--host", type=str, default="127.0.0.1", help="Host for the API server."
     )
@@ -50,6 +101,24 @@ def main():
         action="store_true",
         help="Enable auto-reloading for development.",
     )
+    parser.add_argument(
+        "--prefetch",
+        type=int,
+        default=None,
+        help="Max unacknowledged ingestion jobs per worker.",
+    )
+    parser.add_argument(
+        "--model",
+        type=str,
+        default="jaeyong2/bge-m3-Thai",
+        help="Sentence-transformer model to export to int8 ONNX.",
+    )
+    parser.add_argument(
+        "--quantization",
+        choices=["arm64", "avx2", "avx512", "avx512_vnni"],
+        default=get_settings().ONNX_QUANTIZATION,
+        help="Instruction set the int8 ONNX kernels target.",
+    )
 
     args = parser.parse_args()
 
@@ -58,6 +127,35 @@ def main():
 
         uvicorn.run("api.main:app", host=args.host, port=args.port, reload=args.reload)
 
+    elif args.command == "worker":
+        from api.agentic.worker import run_worker
+
+        print("Starting ingestion worker")
+        run_worker(prefetch_count=args.prefetch)
+
+    elif args.command == "export-onnx":
+        from api.agentic.core.embedding.onnx_backend import (
+            check_parity,
+            export_quantized_model,
+        )
+
+        model_dir = export_quantized_model(
+            args.model, cache_folder="cache_models", quantization=args.quantization
+        )
+        print(f"Exported int8 ONNX model to {model_dir}")
+
+        parity = check_parity(
+            args.model, cache_folder="cache_models", quantization=args.quantization
+        )
+        print(
+            f"Parity with PyTorch: min cosine {parity['min_similarity']:.4f}, "
+            f"mean {parity['mean_similarity']:.4f}"
+        )
+        if not parity["passed"]:
+            raise SystemExit(
+                f"int8 model is below the {parity['threshold']} similarity threshold"
+            )
+
 
 if __name__ == "__main__":
     main()
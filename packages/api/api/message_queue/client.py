@@ -2,6 +2,7 @@
 
 import json
 import logging
+from concurrent.futures import Future, ThreadPoolExecutor
 from typing import Any, Callable, Optional
 
 import pika
@@ -68,6 +69,7 @@ class QueueClient:
         durable: bool = True,
         exclusive: bool = False,
         auto_delete: bool = False,
+        arguments: Optional[dict[str, Any]] = None,
     ) -> None:
         """Declare a queue."""
         if not self._channel:
@@ -78,6 +80,7 @@ class QueueClient:
             durable=durable,
             exclusive=exclusive,
             auto_delete=auto_delete,
+            arguments=arguments,
         )
         logger.info(f"Queue '{queue_name}' declared")
 
@@ -169,11 +172,16 @@ class QueueClient:
         queue_name: str,
         callback: Callable[[dict[str, Any]], None],
         auto_ack: bool = False,
+        prefetch_count: Optional[int] = None,
     ) -> None:
         """Start consuming messages from a queue."""
         if not self._channel:
             raise RuntimeError("Not connected to RabbitMQ")
 
+        if prefetch_count:
+            # Limit unacknowledged deliveries held by this consumer
+            self._channel.basic_qos(prefetch_count=prefetch_count)
+
         def wrapper(ch, method, properties, body):
             try:
                 message = json.loads(body.decode())
@@ -195,6 +203,66 @@ class QueueClient:
         logger.info(f"Started consuming from queue '{queue_name}'")
         self._channel.start_consuming()
 
+    def consume_buffered(
+        self,
+        queue_name: str,
+        callback: Callable[[dict[str, Any]], None],
+        buffer: Any,
+        prefetch_count: int,
+    ) -> None:
+        """
+        Consume messages through a reordering buffer.
+
+        Up to ``prefetch_count`` unacknowledged deliveries are pushed into
+        ``buffer`` (``push(message, handle)`` / ``pop()`` / ``len()``), and the
+        callback runs on whichever message the buffer pops next. Messages are
+        acknowledged after the callback succeeds and dead-lettered if it raises.
+        The callback runs on a separate thread while this one keeps processing
+        connection events, so heartbeats continue during long jobs.
+        """
+        if not self._channel or not self._connection:
+            raise RuntimeError("Not connected to RabbitMQ")
+
+        self._channel.basic_qos(prefetch_count=prefetch_count)
+
+        def on_message(ch, method, properties, body):
+            try:
+                buffer.push(json.loads(body.decode()), method.delivery_tag)
+            except Exception as e:
+                logger.error(f"Error decoding message: {e}")
+                ch.basic_nack(delivery_tag=method.delivery_tag, requeue=False)
+
+        self._channel.basic_consume(queue=queue_name, on_message_callback=on_message)
+        logger.info(f"Started buffered consuming from queue '{queue_name}'")
+
+        # Jobs run on their own thread so this one keeps servicing heartbeats;
+        # acks are sent from here, the only thread that touches the channel
+        executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="consumer")
+        running: Optional[tuple[Future, int]] = None
+        try:
+            while self._channel.is_open:
+                # Block for events unless a buffered job is waiting to start
+                ready = running is None and len(buffer)
+                self._connection.process_data_events(time_limit=0 if ready else 1)
+
+                if running is not None and running[0].done():
+                    future, delivery_tag = running
+                    running = None
+                    try:
+                        future.result()
+                        self._channel.basic_ack(delivery_tag=delivery_tag)
+                    except Exception as e:
+                        logger.error(f"Error processing message: {e}")
+                        self._channel.basic_nack(
+                            delivery_tag=delivery_tag, requeue=False
+                        )
+
+                if running is None and len(buffer):
+                    message, delivery_tag = buffer.pop()
+                    running = (executor.submit(callback, message), delivery_tag)
+        finally:
+            executor.shutdown(wait=True)
+
     def get_message(self, queue_name: str) -> Optional[dict[str, Any]]:
         """Get a single message from a queue (polling)."""
         if not self._channel:
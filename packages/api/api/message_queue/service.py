@@ -1,6 +1,8 @@
 """Queue service for handling common queue operations."""
 
 import logging
+from collections.abc import Iterator
+from contextlib import contextmanager
 from enum import Enum
 from typing import Any, Callable, Optional
 
@@ -15,12 +17,17 @@ class QueueType(str, Enum):
     SYSTEM_EVENTS = "system_events"
 
 
+# Work queue for document ingestion jobs (not bound to the events exchange)
+INGESTION_QUEUE = "document_ingestion"
+INGESTION_DEAD_LETTER_EXCHANGE = "document_ingestion.dlx"
+INGESTION_DEAD_LETTER_QUEUE = "document_ingestion.dead"
+
+
 class QueueService:
     """High-level service for queue operations."""
 
     def __init__(self):
         """Initialize the queue service."""
-        self.client = QueueClient()
         self._initialized_queues: set[str] = set()
 
         try:
@@ -28,21 +35,91 @@ class QueueService:
         except Exception as e:
             logger.warning(f"Failed to auto-initialize queues on startup: {e}")
 
+    @contextmanager
+    def _connect(self) -> Iterator[QueueClient]:
+        """
+        Open a dedicated connection for one operation.
+
+        pika connections are not thread-safe, and endpoints publish from
+        worker threads, so operations never share a client.
+        """
+        client = QueueClient()
+        with client:
+            yield client
+
     def initialize_default_queues(self) -> None:
         """Initialize all default queues and exchanges."""
-        with self.client:
+        with self._connect() as client:
             # Declare default exchanges
-            self.client.declare_exchange("events", "fanout")
+            client.declare_exchange("events", "fanout")
 
             # Declare and bind queues
             for queue_type in QueueType:
                 queue_name = queue_type.value
-                self.client.declare_queue(queue_name, durable=True)
-                self.client.bind_queue(queue_name, "events", "")
+                client.declare_queue(queue_name, durable=True)
+                client.bind_queue(queue_name, "events", "")
                 self._initialized_queues.add(queue_name)
 
             logger.info("Default queues initialized")
 
+    def initialize_ingestion_queues(self) -> None:
+        """Initialize the ingestion work queue and its dead-letter queue."""
+        with self._connect() as client:
+            client.declare_exchange(INGESTION_DEAD_LETTER_EXCHANGE, "fanout")
+            client.declare_queue(INGESTION_DEAD_LETTER_QUEUE, durable=True)
+            client.bind_queue(
+                INGESTION_DEAD_LETTER_QUEUE, INGESTION_DEAD_LETTER_EXCHANGE, ""
+            )
+
+            # Rejected jobs are routed to the dead-letter exchange
+            client.declare_queue(
+                INGESTION_QUEUE,
+                durable=True,
+                arguments={"x-dead-letter-exchange": INGESTION_DEAD_LETTER_EXCHANGE},
+            )
+            self._initialized_queues.add(INGESTION_QUEUE)
+
+            logger.info("Ingestion queues initialized")
+
+    def publish_ingestion_job(self, job: dict[str, Any]) -> None:
+        """Publish a document ingestion job to the work queue."""
+        if INGESTION_QUEUE not in self._initialized_queues:
+            self.initialize_ingestion_queues()
+
+        with self._connect() as client:
+            client.publish_to_queue(INGESTION_QUEUE, job)
+
+        logger.info(f"Published ingestion job for document {job.get('document_id')}")
+
+    def start_ingestion_consumer(
+        self,
+        callback: Callable[[dict[str, Any]], None],
+        prefetch_count: int = 1,
+        buffer: Optional[Any] = None,
+    ) -> None:
+        """
+        Consume ingestion jobs; failed jobs are dead-lettered, not requeued.
+        With a ``buffer``, prefetched jobs are run in the order it pops them.
+        """
+        if INGESTION_QUEUE not in self._initialized_queues:
+            self.initialize_ingestion_queues()
+
+        with self._connect() as client:
+            logger.info(
+                f"Starting ingestion consumer (prefetch_count={prefetch_count})"
+            )
+            if buffer is not None:
+                client.consume_buffered(
+                    INGESTION_QUEUE, callback, buffer, prefetch_count=prefetch_count
+                )
+                return
+            client.consume_messages(
+                INGESTION_QUEUE,
+                callback,
+                auto_ack=False,
+                prefetch_count=prefetch_count,
+            )
+
     def publish_system_event(
         self,
         event_type: str,
@@ -54,8 +131,8 @@ class QueueService:
             "data": data,
         }
 
-        with self.client:
-            self.client.publish_message(
+        with self._connect() as client:
+            client.publish_message(
                 exchange="events",
                 routing_key="",  # Fanout exchange ignores routing key
                 message=message,
@@ -76,17 +153,17 @@ class QueueService:
         if queue_name not in self._initialized_queues:
             self.initialize_default_queues()
 
-        with self.client:
+        with self._connect() as client:
             logger.info(f"Starting consumer for queue: {queue_name}")
-            self.client.consume_messages(queue_name, callback, auto_ack)
+            client.consume_messages(queue_name, callback, auto_ack)
 
     def get_queue_message(self, queue_type: QueueType) -> Optional[dict[str, Any]]:
         """Get a single message from a queue (polling)."""
         queue_name = queue_type.value
 
         try:
-            with self.client:
-                message = self.client.get_message(queue_name)
+            with self._connect() as client:
+                message = client.get_message(queue_name)
                 if message:
                     logger.info(f"Retrieved message from queue {queue_name}: {message}")
                 else:
@@ -99,8 +176,8 @@ class QueueService:
     def get_queue_message_from_channel(self, channel: str) -> Optional[dict[str, Any]]:
         """Get a single message from a specific channel (for entity-specific queues)."""
         try:
-            with self.client:
-                message = self.client.get_message(channel)
+            with self._connect() as client:
+                message = client.get_message(channel)
                 if message:
                     logger.info(f"Retrieved message from channel {channel}: {message}")
                 else:
@@ -114,15 +191,15 @@ class QueueService:
         """Purge all messages from a queue."""
         queue_name = queue_type.value
 
-        with self.client:
-            return self.client.purge_queue(queue_name)
+        with self._connect() as client:
+            return client.purge_queue(queue_name)
 
     def health_check(self) -> bool:
         """Check if RabbitMQ connection is healthy."""
         try:
-            with self.client:
+            with self._connect() as client:
                 # Try to declare a temporary queue to test connection
-                self.client.declare_queue("health_check", auto_delete=True)
+                client.declare_queue("health_check", auto_delete=True)
                 return True
         except Exception as e:
             logger.error(f"Queue health check failed: {e}")
@@ -138,8 +215,8 @@ class QueueService:
             "data": data,
         }
         channel = f"document_{document_id}"
-        with self.client:
-            self.client.publish_to_queue(channel, message)
+        with self._connect() as client:
+            client.publish_to_queue(channel, message)
 
     def publish_collection_event(
         self, collection_id: str, event_type: str, data: dict[str, Any]
@@ -151,8 +228,8 @@ class QueueService:
             "data": data,
         }
         channel = f"collection_{collection_id}"
-        with self.client:
-            self.client.publish_to_queue(channel, message)
+        with self._connect() as client:
+            client.publish_to_queue(channel, message)
 
     def publish_chat_event(
         self, chat_id: str, event_type: str, data: dict[str, Any]
@@ -164,8 +241,8 @@ class QueueService:
             "data": data,
         }
         channel = f"chat_{chat_id}"
-        with self.client:
-            self.client.publish_to_queue(channel, message)
+        with self._connect() as client:
+            client.publish_to_queue(channel, message)
 
 
 # Singleton instance
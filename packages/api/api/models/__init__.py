@@ -1,5 +1,6 @@
 """Database models."""
 
+from .artifact import ArtifactCacheEntry
 from .base import Base
 from .chat import CollectionChat, CollectionChatHistory, CollectionChatReference
 from .clustering import Clustering, ClusteringChild, ClusteringTopic
@@ -11,14 +12,19 @@ from .collection import (
 )
 from .document import (
     Chunk,
+    ChunkShadow,
+    CollectionReindex,
     Document,
     DocumentEdge,
     DocumentNode,
     DocumentRelation,
+    IngestionRun,
 )
+from .embedding import EmbeddingCacheEntry
 from .user import User
 
 __all__ = [
+    "ArtifactCacheEntry",
     "Base",
     "Collection",
     "CollectionEdge",
@@ -26,9 +32,13 @@ __all__ = [
     "CollectionRelation",
     "Document",
     "Chunk",
+    "ChunkShadow",
+    "CollectionReindex",
     "DocumentEdge",
     "DocumentNode",
     "DocumentRelation",
+    "EmbeddingCacheEntry",
+    "IngestionRun",
     "User",
     "CollectionChat",
     "CollectionChatHistory",
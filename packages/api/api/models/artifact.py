@@ -0,0 +1,24 @@
+"""LLM artifact cache models."""
+
+from datetime import datetime
+from typing import Any, Optional
+
+from sqlalchemy import JSON, TIMESTAMP, Text
+from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy.sql import func
+
+from .base import Base
+
+
+class ArtifactCacheEntry(Base):
+    __tablename__ = "artifact_cache"
+
+    # "<artifact type>:<model>:<sha256 of prompt and content>"
+    key: Mapped[str] = mapped_column(Text, primary_key=True)
+    artifact_type: Mapped[str] = mapped_column(Text, nullable=False)
+    model_name: Mapped[str] = mapped_column(Text, nullable=False)
+    payload: Mapped[Any] = mapped_column(JSON, nullable=False)
+    created_at: Mapped[datetime] = mapped_column(
+        TIMESTAMP, nullable=False, server_default=func.current_timestamp(), index=True
+    )
+    expires_at: Mapped[Optional[datetime]] = mapped_column(TIMESTAMP, index=True)
@@ -4,7 +4,7 @@ from datetime import datetime
 from typing import TYPE_CHECKING, Optional
 
 from pgvector.sqlalchemy import Vector
-from sqlalchemy import TIMESTAMP, Boolean, Enum, ForeignKey, Integer, Text
+from sqlalchemy import JSON, TIMESTAMP, Boolean, Enum, Float, ForeignKey, Integer, Text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from sqlalchemy.sql import func
 
@@ -32,11 +32,18 @@ class Document(Base):
     source_file_path: Mapped[str] = mapped_column(Text)
     file_type: Mapped[str] = mapped_column(Text)
     file_size: Mapped[Optional[int]] = mapped_column(Integer)
+    content_hash: Mapped[Optional[str]] = mapped_column(Text, index=True)
     status: Mapped[IngestionStatus] = mapped_column(
         Enum(IngestionStatus), default=IngestionStatus.pending
     )
     is_vectorized: Mapped[bool] = mapped_column(Boolean, default=False)
+    # Model that produced the chunk embeddings; a different model re-embeds all
+    embedding_model: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
     is_graph_extracted: Mapped[bool] = mapped_column(Boolean, default=False)
+    # Ingestion checkpoints, so a retried ingestion resumes where it stopped
+    is_text_extracted: Mapped[bool] = mapped_column(Boolean, default=False)
+    is_summarized: Mapped[bool] = mapped_column(Boolean, default=False)
+    chunks_persisted: Mapped[int] = mapped_column(Integer, default=0)
     created_by: Mapped[Optional[str]] = mapped_column(
         Text, ForeignKey("user.id", ondelete="SET NULL")
     )
@@ -71,6 +78,8 @@ class Chunk(Base):
         Text, ForeignKey("document.id", ondelete="CASCADE")
     )
     chunk_text: Mapped[str] = mapped_column(Text)
+    # sha256 of chunk_text, used to diff chunks on re-ingestion
+    content_hash: Mapped[Optional[str]] = mapped_column(Text)
     embedding: Mapped[Optional[list[float]]] = mapped_column(Vector(256))
     page_number: Mapped[Optional[int]] = mapped_column(Integer)
     start_char: Mapped[Optional[int]] = mapped_column(Integer)
@@ -97,6 +106,90 @@ class Chunk(Base):
     updater: Mapped[Optional["User"]] = relationship("User", foreign_keys=[updated_by])
 
 
+class IngestionRun(Base):
+    __tablename__ = "ingestion_run"
+
+    id: Mapped[str] = mapped_column(Text, primary_key=True)
+    document_id: Mapped[str] = mapped_column(
+        Text, ForeignKey("document.id", ondelete="CASCADE"), index=True
+    )
+    status: Mapped[IngestionStatus] = mapped_column(
+        Enum(IngestionStatus), default=IngestionStatus.processing
+    )
+    incremental: Mapped[bool] = mapped_column(Boolean, default=False)
+    started_at: Mapped[datetime] = mapped_column(
+        TIMESTAMP, server_default=func.current_timestamp(), index=True
+    )
+    finished_at: Mapped[Optional[datetime]] = mapped_column(TIMESTAMP)
+    duration_seconds: Mapped[Optional[float]] = mapped_column(Float)
+    # {"extraction": 1.2, "summary": 3.4, ...} wall seconds per stage
+    stage_timings: Mapped[Optional[dict]] = mapped_column(JSON)
+    file_size: Mapped[Optional[int]] = mapped_column(Integer)
+    page_count: Mapped[Optional[int]] = mapped_column(Integer)
+    chunk_count: Mapped[Optional[int]] = mapped_column(Integer)
+    token_count: Mapped[Optional[int]] = mapped_column(Integer)
+    error: Mapped[Optional[str]] = mapped_column(Text)
+    created_by: Mapped[Optional[str]] = mapped_column(
+        Text, ForeignKey("user.id", ondelete="SET NULL")
+    )
+
+
+class CollectionReindex(Base):
+    """A rebuild of a collection's chunks and embeddings from stored files."""
+
+    __tablename__ = "collection_reindex"
+
+    id: Mapped[str] = mapped_column(Text, primary_key=True)
+    collection_id: Mapped[str] = mapped_column(
+        Text, ForeignKey("collection.id", ondelete="CASCADE"), index=True
+    )
+    status: Mapped[IngestionStatus] = mapped_column(
+        Enum(IngestionStatus), default=IngestionStatus.pending
+    )
+    total_documents: Mapped[int] = mapped_column(Integer, default=0)
+    processed_documents: Mapped[int] = mapped_column(Integer, default=0)
+    failed_documents: Mapped[int] = mapped_column(Integer, default=0)
+    chunk_count: Mapped[int] = mapped_column(Integer, default=0)
+    error: Mapped[Optional[str]] = mapped_column(Text)
+    started_at: Mapped[datetime] = mapped_column(
+        TIMESTAMP, server_default=func.current_timestamp()
+    )
+    finished_at: Mapped[Optional[datetime]] = mapped_column(TIMESTAMP)
+    # Worker currently rebuilding the collection, until the lease expires
+    lease_owner: Mapped[Optional[str]] = mapped_column(Text)
+    lease_expires_at: Mapped[Optional[datetime]] = mapped_column(TIMESTAMP)
+    created_by: Mapped[Optional[str]] = mapped_column(
+        Text, ForeignKey("user.id", ondelete="SET NULL")
+    )
+
+
+class ChunkShadow(Base):
+    """
+    Chunks built by a collection reindex. They are invisible to search until
+    the reindex swaps them into the chunk table.
+    """
+
+    __tablename__ = "chunk_shadow"
+
+    reindex_id: Mapped[str] = mapped_column(
+        Text, ForeignKey("collection_reindex.id", ondelete="CASCADE"), primary_key=True
+    )
+    id: Mapped[str] = mapped_column(Text, primary_key=True)
+    document_id: Mapped[str] = mapped_column(
+        Text, ForeignKey("document.id", ondelete="CASCADE"), index=True
+    )
+    chunk_text: Mapped[str] = mapped_column(Text)
+    content_hash: Mapped[Optional[str]] = mapped_column(Text)
+    embedding: Mapped[Optional[list[float]]] = mapped_column(Vector(256))
+    page_number: Mapped[Optional[int]] = mapped_column(Integer)
+    start_char: Mapped[Optional[int]] = mapped_column(Integer)
+    end_char: Mapped[Optional[int]] = mapped_column(Integer)
+    token_count: Mapped[Optional[int]] = mapped_column(Integer)
+    created_by: Mapped[Optional[str]] = mapped_column(
+        Text, ForeignKey("user.id", ondelete="SET NULL")
+    )
+
+
 class DocumentRelation(Base):
     __tablename__ = "document_relation"
 
@@ -0,0 +1,26 @@
+"""Embedding cache models."""
+
+from datetime import datetime
+
+from sqlalchemy import TIMESTAMP, Integer, LargeBinary, Text
+from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy.sql import func
+
+from .base import Base
+
+
+class EmbeddingCacheEntry(Base):
+    __tablename__ = "embedding_cache"
+
+    # "<model>:<normalize>:<sha256 of text>"
+    key: Mapped[str] = mapped_column(Text, primary_key=True)
+    model_name: Mapped[str] = mapped_column(Text, nullable=False)
+    # float32 vector bytes; stored raw so models of any dimension can share it
+    embedding: Mapped[bytes] = mapped_column(LargeBinary, nullable=False)
+    dimension: Mapped[int] = mapped_column(Integer, nullable=False)
+    created_at: Mapped[datetime] = mapped_column(
+        TIMESTAMP, nullable=False, server_default=func.current_timestamp()
+    )
+    last_used_at: Mapped[datetime] = mapped_column(
+        TIMESTAMP, nullable=False, server_default=func.current_timestamp(), index=True
+    )
@@ -1,9 +1,12 @@
 """Service for file storage operations using MinIO."""
 
-import io
+import asyncio
+import hashlib
 import json
+import shutil
+import tempfile
 from datetime import timedelta
-from typing import Optional
+from typing import BinaryIO, NamedTuple, Optional
 
 from fastapi import HTTPException, UploadFile, status
 from fastapi.responses import Response
@@ -13,6 +16,36 @@ from minio.error import S3Error
 from ..config import get_settings
 from ..models.user import User
 
+# MinIO multipart part size; the minimum allowed by S3 is 5 MiB
+UPLOAD_PART_SIZE = 16 * 1024 * 1024
+DOWNLOAD_CHUNK_SIZE = 1024 * 1024
+
+
+class StoredObject(NamedTuple):
+    """Result of a streamed upload."""
+
+    object_name: str
+    size: int
+    sha256: str
+
+
+class _HashingReader:
+    """File wrapper that hashes and counts bytes as they are read."""
+
+    def __init__(self, file_obj: BinaryIO):
+        self._file = file_obj
+        self._hasher = hashlib.sha256()
+        self.size = 0
+
+    def read(self, size: int = -1) -> bytes:
+        data = self._file.read(size)
+        self._hasher.update(data)
+        self.size += len(data)
+        return data
+
+    def hexdigest(self) -> str:
+        return self._hasher.hexdigest()
+
 
 class StorageService:
     """Service for file storage operations using MinIO."""
@@ -153,6 +186,29 @@ class StorageService:
         Returns:
             The object name/path in MinIO
         """
+        stored = await self.upload_stream_to_storage(file, object_name, bucket_name)
+        return stored.object_name
+
+    async def upload_stream_to_storage(
+        self,
+        file: UploadFile,
+        object_name: Optional[str] = None,
+        bucket_name: Optional[str] = None,
+    ) -> StoredObject:
+        """
+        Stream an uploaded file to MinIO without reading it into memory.
+
+        The upload is read from its spooled temporary file in parts and sent
+        as a multipart upload; the SHA-256 and size are computed on the way.
+
+        Args:
+            file: The file to upload
+            object_name: The name to store the file as (defaults to file.filename)
+            bucket_name: The bucket to upload to (defaults to settings bucket)
+
+        Returns:
+            The object name, size and SHA-256 hex digest of the stored file
+        """
         if bucket_name is None:
             bucket_name = self.settings.MINIO_BUCKET_NAME
 
@@ -169,20 +225,24 @@ class StorageService:
             # Ensure bucket exists
             self.ensure_bucket_exists(bucket_name)
 
-            # Read file content
-            content = await file.read()
-            content_stream = io.BytesIO(content)
+            await file.seek(0)
+            reader = _HashingReader(file.file)
 
-            # Upload file
-            self.client.put_object(
+            # Upload off the event loop; put_object is blocking I/O. An unknown
+            # length makes MinIO stream the data as a multipart upload.
+            await asyncio.to_thread(
+                self.client.put_object,
                 bucket_name=bucket_name,
                 object_name=object_name,
-                data=content_stream,
-                length=len(content),
+                data=reader,
+                length=-1,
+                part_size=UPLOAD_PART_SIZE,
                 content_type=file.content_type,
             )
 
-            return object_name
+            return StoredObject(
+                object_name=object_name, size=reader.size, sha256=reader.hexdigest()
+            )
 
         except S3Error as e:
             raise HTTPException(
@@ -275,6 +335,55 @@ class StorageService:
             if "response" in locals():
                 response.close()
 
+    def download_file_to_tempfile(
+        self,
+        object_name: str,
+        bucket_name: Optional[str] = None,
+        suffix: str = "",
+    ) -> "tempfile._TemporaryFileWrapper":
+        """
+        Stream a file from MinIO into a named temporary file.
+
+        The caller owns the returned file; it is deleted when closed.
+
+        Args:
+            object_name: The name of the object to download
+            bucket_name: The bucket to download from (defaults to settings bucket)
+            suffix: Suffix for the temporary file name (e.g. '.pdf')
+
+        Returns:
+            The open temporary file, rewound to the start
+        """
+        if bucket_name is None:
+            bucket_name = self.settings.MINIO_BUCKET_NAME
+
+        tmp = tempfile.NamedTemporaryFile(suffix=suffix)  # noqa: SIM115
+        try:
+            response = self.client.get_object(bucket_name, object_name)
+            try:
+                shutil.copyfileobj(response, tmp, DOWNLOAD_CHUNK_SIZE)
+            finally:
+                response.close()
+                response.release_conn()
+            tmp.flush()
+            tmp.seek(0)
+            return tmp
+
+        except S3Error as e:
+            tmp.close()
+            if e.code == "NoSuchKey":
+                raise HTTPException(
+                    status_code=status.HTTP_404_NOT_FOUND,
+                    detail="File not found",
+                ) from e
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail=f"Failed to download file: {e}",
+            ) from e
+        except Exception:
+            tmp.close()
+            raise
+
     def delete_file_from_storage(
         self,
         object_name: str,
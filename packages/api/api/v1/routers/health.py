@@ -1,4 +1,8 @@
 from fastapi import APIRouter
+from fastapi.responses import JSONResponse
+
+from ...agentic.dependencies import text_embedder_provider
+from ...config import get_settings
 
 router = APIRouter(
     prefix="/v1/health",
@@ -9,3 +13,20 @@ router = APIRouter(
 @router.get("/")
 async def health_check():
     return {"status": "healthy"}
+
+
+@router.get("/ready")
+async def readiness_check():
+    """
+    Ready once the embedding model is loaded and warmed up; 503 until then.
+    Without preloading the model loads on first use, so the API is ready as
+    soon as it serves.
+    """
+    ready = text_embedder_provider.is_ready or not get_settings().EMBEDDER_PRELOAD
+    state = {
+        "status": "ready" if ready else "not_ready",
+        "embedder": text_embedder_provider.state(),
+    }
+    if not ready:
+        return JSONResponse(status_code=503, content=state)
+    return state
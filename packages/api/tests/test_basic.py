@@ -9,3 +9,9 @@ def test_health_check():
     response = client.get("/v1/health/")
     assert response.status_code == 200
     assert response.json() == {"status": "healthy"}
+
+
+def test_document_graph_requires_post():
+    response = client.get("/documents/graph")
+    assert response.status_code == 405
+    assert response.headers["allow"] == "POST"
@@ -0,0 +1,119 @@
+from types import SimpleNamespace
+
+from api.agentic.core.ingestion.document_ingest import DocumentIngestorService
+from api.agentic.core.ingestion.schemas import ChunkMetadata, DocumentChunk
+from api.document.schemas import ChunkCreate
+from api.document.service import hash_chunk_text, stable_chunk_id
+
+
+def make_chunk(text, start, page=None):
+    return DocumentChunk(
+        file_name="doc.txt",
+        file_type=".txt",
+        chunk_text=text,
+        chunk_metadata=ChunkMetadata(
+            start_index=start,
+            end_index=start + len(text),
+            token_count=len(text.split()),
+            page_number=page,
+        ),
+    )
+
+
+def make_row(row_id, text, start, page=None):
+    return SimpleNamespace(
+        id=row_id,
+        content_hash=hash_chunk_text(text),
+        page_number=page,
+        start_char=start,
+        end_char=start + len(text),
+        token_count=len(text.split()),
+    )
+
+
+def test_hash_chunk_text_is_stable_and_content_sensitive():
+    assert hash_chunk_text("hello") == hash_chunk_text("hello")
+    assert hash_chunk_text("hello") != hash_chunk_text("hello ")
+    assert len(hash_chunk_text("สวัสดี")) == 64
+
+
+def test_stable_chunk_id_depends_on_document_offset_and_text():
+    chunk = ChunkCreate(
+        chunk_text="hello", start_char=0, embedding=[0.0], document_id="doc-1"
+    )
+
+    assert stable_chunk_id(chunk) == stable_chunk_id(chunk.model_copy())
+    assert stable_chunk_id(chunk) != stable_chunk_id(
+        chunk.model_copy(update={"start_char": 5})
+    )
+    assert stable_chunk_id(chunk) != stable_chunk_id(
+        chunk.model_copy(update={"document_id": "doc-2"})
+    )
+    assert stable_chunk_id(chunk) != stable_chunk_id(
+        chunk.model_copy(update={"chunk_text": "hello!"})
+    )
+
+
+def test_diff_chunks_keeps_unchanged_and_moves_shifted_chunks():
+    existing = [make_row("a", "first", 0), make_row("b", "second", 6)]
+    chunks = [make_chunk("first", 0), make_chunk("second", 10)]
+
+    new_chunks, updates, delete_ids = DocumentIngestorService.diff_chunks(
+        chunks, existing
+    )
+
+    assert new_chunks == []
+    assert updates == [{"id": "b", "start_char": 10, "end_char": 16}]
+    assert delete_ids == []
+
+
+def test_diff_chunks_embeds_new_text_and_deletes_removed_rows():
+    existing = [make_row("a", "first", 0), make_row("b", "gone", 6)]
+    chunks = [make_chunk("first", 0), make_chunk("added", 6)]
+
+    new_chunks, updates, delete_ids = DocumentIngestorService.diff_chunks(
+        chunks, existing
+    )
+
+    assert [chunk.chunk_text for chunk in new_chunks] == ["added"]
+    assert updates == []
+    assert delete_ids == ["b"]
+
+
+def test_diff_chunks_matches_duplicate_text_once_per_row():
+    existing = [make_row("a", "same", 0)]
+    chunks = [make_chunk("same", 0), make_chunk("same", 5)]
+
+    new_chunks, updates, delete_ids = DocumentIngestorService.diff_chunks(
+        chunks, existing
+    )
+
+    assert [chunk.chunk_metadata.start_index for chunk in new_chunks] == [5]
+    assert updates == []
+    assert delete_ids == []
+
+
+def test_carry_page_numbers_uses_the_preceding_existing_chunk():
+    existing = [
+        make_row("a", "one", 0, page=1),
+        make_row("b", "two", 100, page=2),
+        make_row("c", "three", 200, page=3),
+    ]
+    chunks = [
+        make_chunk("one", 0),
+        make_chunk("edited", 150),
+        make_chunk("tail", 260),
+        make_chunk("kept", 120, page=7),
+    ]
+
+    DocumentIngestorService.carry_page_numbers(chunks, existing)
+
+    assert [chunk.chunk_metadata.page_number for chunk in chunks] == [1, 2, 3, 7]
+
+
+def test_carry_page_numbers_without_paged_rows_leaves_chunks_alone():
+    chunks = [make_chunk("one", 0)]
+
+    DocumentIngestorService.carry_page_numbers(chunks, [make_row("a", "one", 0)])
+
+    assert chunks[0].chunk_metadata.page_number is None
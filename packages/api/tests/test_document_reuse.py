@@ -0,0 +1,73 @@
+from types import SimpleNamespace
+
+from sqlalchemy.dialects import postgresql
+
+from api.document.service import DocumentService, make_chunk_id
+from api.models.document import Document
+
+
+class RecordingSession:
+    def __init__(self, rows=()):
+        self.rows = list(rows)
+        self.criteria = []
+        self.statements = []
+
+    def query(self, model):
+        return self
+
+    def filter(self, *criteria):
+        self.criteria.extend(criteria)
+        return self
+
+    def order_by(self, *args):
+        return self
+
+    def first(self):
+        return Document(id="target")
+
+    def all(self):
+        return []
+
+    def execute(self, statement):
+        self.statements.append(statement)
+        return SimpleNamespace(all=lambda: self.rows)
+
+    def commit(self):
+        pass
+
+    def refresh(self, instance):
+        pass
+
+
+def compile_sql(clause):
+    return str(
+        clause.compile(
+            dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True}
+        )
+    )
+
+
+def test_hash_lookup_only_reuses_documents_of_the_user():
+    db = RecordingSession()
+
+    DocumentService(db).find_processed_document_by_hash(
+        "hash", SimpleNamespace(id="user-1"), exclude_document_id="target"
+    )
+
+    assert "document.created_by = 'user-1'" in [
+        compile_sql(criterion) for criterion in db.criteria
+    ]
+
+
+def test_cloned_chunks_get_deterministic_ids_of_the_target():
+    db = RecordingSession(
+        rows=[SimpleNamespace(id="source-chunk", start_char=0, chunk_text="hello")]
+    )
+
+    DocumentService(db).clone_document_artifacts(
+        Document(id="source"), "target", SimpleNamespace(id="user-1")
+    )
+
+    insert_sql = compile_sql(db.statements[1])
+    assert f"'{make_chunk_id('target', 0, 'hello')}'" in insert_sql
+    assert "gen_random_uuid" not in insert_sql
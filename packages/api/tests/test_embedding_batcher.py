@@ -0,0 +1,131 @@
+import threading
+import time
+
+import numpy as np
+import pytest
+
+from api.agentic import dependencies
+from api.agentic.core.embedding.batcher import EmbeddingBatcher
+from api.config import get_settings
+
+
+class FakeEmbedder:
+    model_name = "fake-model"
+
+    def __init__(self, fail=False):
+        self.fail = fail
+        self.calls = []
+
+    def get_embedding(self, texts, normalize=True):
+        self.calls.append((list(texts), normalize))
+        if self.fail:
+            raise RuntimeError("encode failed")
+        return np.array([[len(text), float(normalize)] for text in texts])
+
+
+def embed_concurrently(batcher, texts, normalize=True):
+    results = {}
+    start = threading.Barrier(len(texts))
+
+    def worker(text):
+        start.wait()
+        results[text] = batcher.get_embedding(text, normalize=normalize)
+
+    threads = [threading.Thread(target=worker, args=(text,)) for text in texts]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return results
+
+
+def test_concurrent_requests_share_one_encode():
+    embedder = FakeEmbedder()
+    batcher = EmbeddingBatcher(embedder, max_batch_size=8, max_wait_ms=200)
+    texts = ["a", "bb", "ccc", "dddd"]
+
+    results = embed_concurrently(batcher, texts)
+    batcher.close()
+
+    assert len(embedder.calls) == 1
+    assert sorted(embedder.calls[0][0]) == texts
+    for text in texts:
+        assert results[text].tolist() == [len(text), 1.0]
+    assert batcher.stats()["largest_batch"] == 4
+
+
+def test_batches_are_capped_at_max_batch_size():
+    embedder = FakeEmbedder()
+    batcher = EmbeddingBatcher(embedder, max_batch_size=2, max_wait_ms=200)
+
+    embed_concurrently(batcher, ["a", "b", "c", "d", "e"])
+    batcher.close()
+
+    assert all(len(texts) <= 2 for texts, _ in embedder.calls)
+    assert batcher.stats()["items"] == 5
+
+
+def test_normalize_flags_are_encoded_separately():
+    embedder = FakeEmbedder()
+    batcher = EmbeddingBatcher(embedder, max_batch_size=8, max_wait_ms=100)
+
+    normalized = batcher.submit("a", normalize=True)
+    raw = batcher.submit("b", normalize=False)
+
+    assert normalized.result(timeout=5).tolist() == [1, 1.0]
+    assert raw.result(timeout=5).tolist() == [1, 0.0]
+    batcher.close()
+    assert sorted(normalize for _, normalize in embedder.calls) == [False, True]
+
+
+def test_encode_failure_is_raised_to_every_caller():
+    batcher = EmbeddingBatcher(FakeEmbedder(fail=True), max_wait_ms=50)
+
+    futures = [batcher.submit("a"), batcher.submit("b")]
+
+    for future in futures:
+        with pytest.raises(RuntimeError, match="encode failed"):
+            future.result(timeout=5)
+    batcher.close()
+
+
+def test_submit_after_close_is_rejected():
+    batcher = EmbeddingBatcher(FakeEmbedder(), max_wait_ms=1)
+
+    result = batcher.get_embedding("abc")
+    batcher.close()
+
+    assert result.tolist() == [3, 1.0]
+    with pytest.raises(RuntimeError):
+        batcher.submit("late")
+
+
+def test_concurrent_first_requests_share_one_query_batcher(monkeypatch):
+    created = []
+
+    class SlowBatcher(EmbeddingBatcher):
+        def __init__(self, *args, **kwargs):
+            time.sleep(0.05)
+            super().__init__(*args, **kwargs)
+            created.append(self)
+
+    monkeypatch.setattr(get_settings(), "EMBED_BATCHING_ENABLED", True)
+    monkeypatch.setattr(dependencies, "EmbeddingBatcher", SlowBatcher)
+    monkeypatch.setattr(dependencies, "get_text_embedder", FakeEmbedder)
+    monkeypatch.setattr(dependencies, "_query_batcher", None)
+    batchers = []
+    start = threading.Barrier(4)
+
+    def worker():
+        start.wait()
+        batchers.append(dependencies.get_query_batcher())
+
+    threads = [threading.Thread(target=worker) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    dependencies.close_query_embedder()
+
+    assert len(created) == 1
+    assert all(batcher is created[0] for batcher in batchers)
@@ -0,0 +1,55 @@
+import asyncio
+
+from fastapi.testclient import TestClient
+
+import api.main
+from api.agentic.core.embedding.provider import EmbedderProvider
+from api.config import get_settings
+from api.main import app
+
+client = TestClient(app)
+
+
+class FlakyProvider:
+    def __init__(self, failures):
+        self.failures = failures
+        self.calls = 0
+
+    def load(self):
+        self.calls += 1
+        if self.calls <= self.failures:
+            raise RuntimeError("model download failed")
+
+
+def test_preload_embedder_retries_until_loaded(monkeypatch):
+    provider = FlakyProvider(failures=2)
+    monkeypatch.setattr(api.main, "text_embedder_provider", provider)
+    monkeypatch.setattr(api.main, "PRELOAD_RETRY_SECONDS", 0)
+
+    asyncio.run(api.main.preload_embedder())
+
+    assert provider.calls == 3
+
+
+def test_readiness_without_preload_is_ready(monkeypatch):
+    monkeypatch.setattr(get_settings(), "EMBEDDER_PRELOAD", False)
+    monkeypatch.setattr(
+        "api.v1.routers.health.text_embedder_provider", EmbedderProvider(object)
+    )
+
+    response = client.get("/v1/health/ready")
+
+    assert response.status_code == 200
+    assert response.json()["status"] == "ready"
+
+
+def test_readiness_waits_for_preloaded_model(monkeypatch):
+    monkeypatch.setattr(get_settings(), "EMBEDDER_PRELOAD", True)
+    monkeypatch.setattr(
+        "api.v1.routers.health.text_embedder_provider", EmbedderProvider(object)
+    )
+
+    response = client.get("/v1/health/ready")
+
+    assert response.status_code == 503
+    assert response.json()["embedder"]["status"] == "not_loaded"
@@ -0,0 +1,107 @@
+import asyncio
+from types import SimpleNamespace
+
+from api.agentic.core.ingestion.document_ingest import DocumentIngestorService
+from api.agentic.core.ingestion.metrics import IngestionMetrics
+from api.agentic.core.ingestion.schemas import (
+    ChunkMetadata,
+    DocumentChunk,
+    FileInput,
+    document_details,
+)
+from api.document.schemas import ChunkCreate
+from api.document.service import make_chunk_id, stable_chunk_id
+
+
+def make_chunk(text, start):
+    return DocumentChunk(
+        file_name="doc.txt",
+        file_type=".txt",
+        chunk_text=text,
+        chunk_metadata=ChunkMetadata(start_index=start, end_index=start + len(text)),
+    )
+
+
+class FakeDocumentService:
+    def __init__(self):
+        self.updates = []
+
+    def update_document(self, document_id, update_data, user):
+        self.updates.append(update_data.model_dump(exclude_unset=True))
+
+
+def make_ingestor(summary):
+    ingestor = object.__new__(DocumentIngestorService)
+    ingestor.document_service = FakeDocumentService()
+
+    async def get_document_summary(full_text, language):
+        return summary
+
+    ingestor.get_document_summary = get_document_summary
+    return ingestor
+
+
+def run_summary_stage(ingestor):
+    input_file = FileInput(
+        content="Some text",
+        file_name="doc.txt",
+        name="doc.txt",
+        type=".txt",
+        full_text="Some text",
+    )
+    asyncio.run(
+        ingestor._summary_stage(
+            input_file, "doc-1", SimpleNamespace(id="user-1"), IngestionMetrics()
+        )
+    )
+
+
+def test_stable_chunk_id_matches_make_chunk_id():
+    chunk = ChunkCreate(
+        chunk_text="hello", start_char=3, embedding=[0.0], document_id="doc-1"
+    )
+
+    assert stable_chunk_id(chunk) == make_chunk_id("doc-1", 3, "hello")
+
+
+def test_persisted_prefix_counts_leading_stored_chunks():
+    chunks = [make_chunk("a", 0), make_chunk("b", 2), make_chunk("c", 4)]
+    stored = {make_chunk_id("doc-1", 0, "a"), make_chunk_id("doc-1", 2, "b")}
+
+    assert DocumentIngestorService.persisted_prefix(chunks, "doc-1", stored) == 2
+    assert DocumentIngestorService.persisted_prefix(chunks, "doc-2", stored) == 0
+
+
+def test_persisted_prefix_stops_where_chunking_changed():
+    chunks = [make_chunk("a", 0), make_chunk("b changed", 2), make_chunk("c", 4)]
+    stored = {
+        make_chunk_id("doc-1", 0, "a"),
+        make_chunk_id("doc-1", 2, "b"),
+        make_chunk_id("doc-1", 4, "c"),
+    }
+
+    assert DocumentIngestorService.persisted_prefix(chunks, "doc-1", stored) == 1
+
+
+def test_summary_stage_checkpoints_a_generated_summary():
+    ingestor = make_ingestor(document_details(title="Title", description="About"))
+
+    run_summary_stage(ingestor)
+
+    assert ingestor.document_service.updates == [
+        {"title": "Title", "description": "About", "is_summarized": True}
+    ]
+
+
+def test_summary_stage_skips_checkpoint_when_generation_failed():
+    ingestor = make_ingestor(document_details())
+
+    run_summary_stage(ingestor)
+
+    assert ingestor.document_service.updates == []
+
+
+def test_service_forwards_chunk_batch_size():
+    ingestor = DocumentIngestorService(None, None, None, None, chunk_batch_size=10)
+
+    assert ingestor.chunk_batch_size == 10
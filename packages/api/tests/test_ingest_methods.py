@@ -0,0 +1,81 @@
+import fitz
+
+from api.agentic.core.ingestion import ingest_methods
+from api.agentic.core.ingestion.ingest_methods import (
+    _build_parsed_document,
+    _use_pdf_pool,
+    parse_pdf_document,
+)
+
+
+def make_pdf(page_texts):
+    doc = fitz.open()
+    for text in page_texts:
+        page = doc.new_page()
+        if text:
+            page.insert_text((72, 72), text)
+    data = doc.tobytes()
+    doc.close()
+    return data
+
+
+def assert_offsets_match(parsed):
+    for page in parsed.pages:
+        assert parsed.full_text[page.start_offset : page.end_offset] == page.text
+
+
+def test_build_parsed_document_keeps_offsets_with_surrounding_whitespace():
+    parsed = _build_parsed_document(["  \n first page", "", "third page \n"])
+
+    assert [page.page_number for page in parsed.pages] == [1, 2, 3]
+    assert_offsets_match(parsed)
+    assert parsed.pages[2].start_offset == parsed.full_text.index("third page")
+
+
+def test_parse_pdf_document_page_offsets():
+    pdf = make_pdf(["First page text", "", "Third page text"])
+
+    parsed = parse_pdf_document(pdf, parallel_page_threshold=1000)
+
+    assert len(parsed.pages) == 3
+    assert "First page text" in parsed.pages[0].text
+    assert parsed.pages[1].text.strip() == ""
+    assert "Third page text" in parsed.pages[2].text
+    assert_offsets_match(parsed)
+
+
+def test_parse_pdf_document_parallel_matches_serial():
+    pdf = make_pdf([f"Page {number}" for number in range(1, 7)])
+
+    serial = parse_pdf_document(pdf, parallel_page_threshold=1000)
+    parallel = parse_pdf_document(pdf, parallel_page_threshold=2, max_workers=2)
+
+    assert parallel.full_text == serial.full_text
+    assert parallel.pages == serial.pages
+    assert_offsets_match(parallel)
+
+
+class FakePool:
+    def __init__(self, max_workers, mp_context):
+        self.max_workers = max_workers
+        self.shut_down = False
+
+    def shutdown(self, wait):
+        self.shut_down = True
+
+
+def test_resized_pdf_pool_is_shut_down_after_its_last_user(monkeypatch):
+    monkeypatch.setattr(ingest_methods, "ProcessPoolExecutor", FakePool)
+    monkeypatch.setattr(ingest_methods, "_pdf_pool", None)
+    monkeypatch.setattr(ingest_methods, "_pdf_pool_users", {})
+
+    with _use_pdf_pool(2) as old_pool:
+        with _use_pdf_pool(3) as new_pool:
+            assert new_pool is not old_pool
+            assert not old_pool.shut_down
+        assert not old_pool.shut_down
+    assert old_pool.shut_down
+
+    with _use_pdf_pool(3) as pool:
+        assert pool is new_pool
+    assert not new_pool.shut_down
@@ -0,0 +1,76 @@
+from types import SimpleNamespace
+
+from api.agentic.core.ingestion.metrics import (
+    DURATION_BUCKETS,
+    STAGES,
+    IngestionMetrics,
+    _histogram,
+    build_ingestion_histograms,
+)
+
+
+def make_run(duration, stage_timings=None, page_count=None, chunk_count=None):
+    return SimpleNamespace(
+        duration_seconds=duration,
+        stage_timings=stage_timings,
+        page_count=page_count,
+        chunk_count=chunk_count,
+    )
+
+
+def test_histogram_buckets_are_cumulative():
+    histogram = _histogram([0.05, 0.3, 0.3, 7, 1000], DURATION_BUCKETS)
+
+    counts = {bucket["le"]: bucket["count"] for bucket in histogram["buckets"]}
+    assert counts[0.1] == 1
+    assert counts[0.5] == 3
+    assert counts[5] == 3
+    assert counts[10] == 4
+    assert counts[600] == 4
+    assert counts["+Inf"] == 5
+    assert histogram["count"] == 5
+    assert histogram["sum"] == 0.05 + 0.3 + 0.3 + 7 + 1000
+    assert histogram["p50"] == 0.3
+    assert histogram["p95"] == 1000
+
+
+def test_histogram_of_no_values():
+    histogram = _histogram([], DURATION_BUCKETS)
+
+    assert histogram["count"] == 0
+    assert histogram["p50"] is None
+    assert all(bucket["count"] == 0 for bucket in histogram["buckets"])
+
+
+def test_build_ingestion_histograms_throughput_and_stages():
+    runs = [
+        make_run(10, {"extraction": 2, "embedding": 6}, page_count=20, chunk_count=50),
+        make_run(4, {"extraction": 1, "custom": 3}, chunk_count=8),
+        make_run(None, {"summary": 1}),
+    ]
+
+    result = build_ingestion_histograms(runs)
+
+    assert result["runs"] == 3
+    assert result["total_seconds"]["count"] == 2
+    assert result["pages_per_second"]["sum"] == 2
+    assert result["chunks_per_second"]["sum"] == 5 + 2
+    assert set(STAGES) <= set(result["stage_seconds"])
+    assert result["stage_seconds"]["extraction"]["count"] == 2
+    assert result["stage_seconds"]["summary"]["count"] == 1
+    assert result["stage_seconds"]["custom"]["sum"] == 3
+    assert result["stage_seconds"]["graph"]["count"] == 0
+
+
+def test_ingestion_metrics_accumulates_repeated_stages():
+    metrics = IngestionMetrics()
+
+    with metrics.stage("embedding"):
+        pass
+    first = metrics.stage_seconds["embedding"]
+    with metrics.stage("embedding"):
+        pass
+
+    assert metrics.stage_seconds["embedding"] >= first
+    assert list(metrics.stage_seconds) == ["embedding"]
+    assert metrics.summary().startswith("total=")
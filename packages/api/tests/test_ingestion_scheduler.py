@@ -0,0 +1,106 @@
+import pytest
+
+from api.agentic.core.ingestion.scheduler import (
+    BASE_JOB_COST,
+    DEFAULT_JOB_SECONDS,
+    IMAGE_OCR_COST,
+    MAX_RETRY_AFTER,
+    AdmissionController,
+    FairJobQueue,
+    InFlightJob,
+    IngestionRejected,
+    estimate_job_cost,
+    parse_tenant_weights,
+)
+
+
+def test_estimate_job_cost_grows_with_size_and_images():
+    assert estimate_job_cost(None, None) == BASE_JOB_COST
+    assert estimate_job_cost(2 * 1024 * 1024, "application/pdf") == BASE_JOB_COST + 2
+    assert estimate_job_cost(0, "image/png") == BASE_JOB_COST + IMAGE_OCR_COST
+
+
+def test_parse_tenant_weights():
+    assert parse_tenant_weights("a:2, b:0.5,") == {"a": 2.0, "b": 0.5}
+    with pytest.raises(ValueError):
+        parse_tenant_weights("a:0")
+
+
+def test_admission_allows_jobs_within_limits():
+    controller = AdmissionController(max_jobs_per_user=3)
+    in_flight = [InFlightJob("u1", "c1", 1.0)]
+
+    controller.admit(in_flight, "u1", "c1", [1.0, 1.0])
+
+
+def test_admission_rejects_per_user_overflow_with_retry_after():
+    controller = AdmissionController(max_jobs_per_user=2)
+    in_flight = [InFlightJob("u1", "c1", 1.0), InFlightJob("u2", "c1", 1.0)]
+
+    with pytest.raises(IngestionRejected) as excinfo:
+        controller.admit(in_flight, "u1", "c2", [1.0, 1.0], recent_durations=[10, 20])
+
+    assert excinfo.value.reason == "per-user ingestion limit reached"
+    # One job too many, at the median recent duration
+    assert excinfo.value.retry_after == 20
+
+
+def test_admission_rejects_collection_and_budget_limits():
+    in_flight = [InFlightJob("u1", "c1", 5.0)]
+
+    with pytest.raises(IngestionRejected) as excinfo:
+        AdmissionController(max_jobs_per_collection=1).admit(
+            in_flight, "u2", "c1", [1.0]
+        )
+    assert excinfo.value.reason == "per-collection ingestion limit reached"
+
+    with pytest.raises(IngestionRejected) as excinfo:
+        AdmissionController(cost_budget=8.0).admit(in_flight, "u2", "c2", [2.0, 2.0])
+    assert excinfo.value.reason == "ingestion budget is exhausted"
+
+
+def test_estimate_retry_after_defaults_and_caps():
+    assert AdmissionController.estimate_retry_after(1, []) == DEFAULT_JOB_SECONDS
+    assert AdmissionController.estimate_retry_after(1000, [60]) == MAX_RETRY_AFTER
+
+
+def drain(queue):
+    order = []
+    while len(queue):
+        message, _ = queue.pop()
+        order.append(message["id"])
+    return order
+
+
+def test_fair_queue_interleaves_tenants():
+    queue = FairJobQueue()
+    for number in range(3):
+        queue.push({"id": f"a{number}", "user_id": "a"})
+    queue.push({"id": "b0", "user_id": "b"})
+
+    assert drain(queue) == ["a0", "b0", "a1", "a2"]
+
+
+def test_fair_queue_honours_weights_and_costs():
+    queue = FairJobQueue(weights={"a": 2.0})
+    for number in range(4):
+        queue.push({"id": f"a{number}", "user_id": "a"})
+    for number in range(2):
+        queue.push({"id": f"b{number}", "user_id": "b"})
+    queue.push({"id": "big", "user_id": "c", "cost": 10})
+
+    order = drain(queue)
+
+    assert order[:3] == ["a0", "a1", "b0"]
+    assert order[-1] == "big"
+
+
+def test_fair_queue_returns_handles_and_resets_when_idle():
+    queue = FairJobQueue()
+    queue.push({"id": "a0", "user_id": "a", "cost": 50}, handle=7)
+
+    assert queue.pop() == ({"id": "a0", "user_id": "a", "cost": 50}, 7)
+
+    queue.push({"id": "a1", "user_id": "a"})
+    queue.push({"id": "b0", "user_id": "b"})
+    assert drain(queue) == ["a1", "b0"]
@@ -0,0 +1,99 @@
+import asyncio
+import io
+
+from PIL import Image
+
+from api.agentic.core.ingestion.typhoon_ocr import ocr_utils
+from api.agentic.core.ingestion.typhoon_ocr.ocr_utils import (
+    MAX_IMAGE_LONG_EDGE,
+    downscale_image,
+    ocr_image_document,
+    prepare_image_for_ocr,
+)
+from api.config import get_settings
+
+
+def make_image(width, height, dpi=None):
+    """A white image round-tripped through PNG, as uploads arrive."""
+    buffer = io.BytesIO()
+    params = {"dpi": (dpi, dpi)} if dpi else {}
+    Image.new("RGB", (width, height), "white").save(buffer, format="PNG", **params)
+    buffer.seek(0)
+    return Image.open(buffer)
+
+
+def sizes(images):
+    return [image.size for image in images]
+
+
+def test_dpi_tagged_letter_scan_is_scaled_once():
+    # 300 dpi -> 200 dpi gives 1700x2200, then the long edge is capped at 1800
+    assert sizes(prepare_image_for_ocr(make_image(2550, 3300, dpi=300))) == [
+        (1391, 1800)
+    ]
+
+
+def test_high_dpi_scan_is_not_shrunk_below_target():
+    assert sizes(prepare_image_for_ocr(make_image(5100, 6600, dpi=600))) == [
+        (1391, 1800)
+    ]
+
+
+def test_untagged_image_within_limits_is_unchanged():
+    assert sizes(prepare_image_for_ocr(make_image(1200, 1600))) == [(1200, 1600)]
+
+
+def test_tall_screenshot_is_tiled_at_readable_width():
+    tiles = prepare_image_for_ocr(make_image(1000, 8000, dpi=300))
+
+    # DPI scaling alone: 1000x8000 at 300 dpi -> 667x5333, then tiled
+    assert all(tile.width == 667 for tile in tiles)
+    assert sum(tile.height for tile in tiles) == 5333
+    assert all(tile.height <= 667 * 1.5 for tile in tiles)
+
+
+def test_wide_tall_screenshot_tiles_keep_the_width_cap():
+    tiles = prepare_image_for_ocr(make_image(2400, 12000))
+
+    # Width capped to 1800, tiles of ~1.25 widths only lose a little more
+    assert all(max(tile.size) <= MAX_IMAGE_LONG_EDGE for tile in tiles)
+    assert all(tile.width >= 1600 for tile in tiles)
+
+
+def test_downscale_image_without_target_dpi_only_caps_long_edge():
+    image = make_image(1000, 1000, dpi=600)
+
+    assert downscale_image(image).size == (333, 333)
+    assert downscale_image(image, target_dpi=None).size == (1000, 1000)
+
+
+def test_tile_requests_share_the_ocr_concurrency_cap(monkeypatch):
+    monkeypatch.setattr(get_settings(), "PDF_OCR_CONCURRENCY", 2)
+    monkeypatch.setattr(get_settings(), "ARTIFACT_CACHE_ENABLED", False)
+    in_flight = []
+    peak = []
+
+    async def call_ocr_model(prompt_text, image_base64, litellm_params=None):
+        in_flight.append(image_base64)
+        peak.append(len(in_flight))
+        await asyncio.sleep(0.01)
+        in_flight.remove(image_base64)
+        return "text"
+
+    monkeypatch.setattr(ocr_utils, "_call_ocr_model", call_ocr_model)
+    buffer = io.BytesIO()
+    Image.new("RGB", (400, 3000), "white").save(buffer, format="PNG")
+
+    async def ocr_two_images():
+        return await asyncio.gather(
+            ocr_image_document(buffer.getvalue()),
+            ocr_image_document(buffer.getvalue()),
+        )
+
+    results = asyncio.run(ocr_two_images())
+
+    tiles = len(prepare_image_for_ocr(make_image(400, 3000)))
+    assert tiles > 2
+    assert results == ["\n".join(["text"] * tiles)] * 2
+    assert len(peak) == 2 * tiles
+    assert max(peak) == 2
@@ -0,0 +1,170 @@
+import io
+import zipfile
+
+from api.agentic.core.ingestion.office import (
+    parse_docx_document,
+    parse_office_document,
+    parse_pptx_document,
+    parse_xlsx_document,
+)
+
+W = 'xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main"'
+S = 'xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main"'
+P = 'xmlns:p="http://schemas.openxmlformats.org/presentationml/2006/main"'
+A = 'xmlns:a="http://schemas.openxmlformats.org/drawingml/2006/main"'
+R = 'xmlns:r="http://schemas.openxmlformats.org/officeDocument/2006/relationships"'
+REL = 'xmlns="http://schemas.openxmlformats.org/package/2006/relationships"'
+
+
+def make_zip(parts):
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w") as archive:
+        for name, content in parts.items():
+            archive.writestr(name, content)
+    return buffer.getvalue()
+
+
+def relationships(*targets):
+    items = "".join(
+        f'<Relationship Id="{rel_id}" Type="t" Target="{target}"/>'
+        for rel_id, target in targets
+    )
+    return f"<Relationships {REL}>{items}</Relationships>"
+
+
+def paragraph(text):
+    return f"<w:p><w:r><w:t>{text}</w:t></w:r></w:p>"
+
+
+def cell(text):
+    return f"<w:tc>{paragraph(text)}</w:tc>"
+
+
+def make_docx():
+    body = (
+        paragraph("Introduction")
+        + '<w:p><w:r><w:t>Before</w:t><w:br w:type="page"/>'
+        + "<w:t>After</w:t></w:r></w:p>"
+        + "<w:tbl>"
+        + f"<w:tr>{cell('Name')}{cell('Qty')}</w:tr>"
+        + f"<w:tr>{cell('Apples')}<w:tc><w:p/></w:tc></w:tr>"
+        + "</w:tbl>"
+        + "<w:p><w:r><w:t>Line</w:t><w:tab/><w:t>tabbed</w:t></w:r></w:p>"
+    )
+    document = f"<w:document {W}><w:body>{body}</w:body></w:document>"
+    return make_zip({"word/document.xml": document})
+
+
+def make_xlsx():
+    workbook = (
+        f"<workbook {S} {R}><sheets>"
+        '<sheet name="Second" sheetId="2" r:id="rId2"/>'
+        '<sheet name="First" sheetId="1" r:id="rId1"/>'
+        '<sheet name="Empty" sheetId="3" r:id="rId3"/>'
+        "</sheets></workbook>"
+    )
+    shared = (
+        f"<sst {S}>"
+        "<si><t>Name</t></si>"
+        "<si><r><t>Rich </t></r><r><t>text</t></r>"
+        "<rPh><t>reading</t></rPh></si>"
+        "</sst>"
+    )
+    first = (
+        f"<worksheet {S}><sheetData>"
+        '<row r="1"><c r="A1" t="s"><v>0</v></c><c r="B1" t="s"><v>1</v></c></row>'
+        '<row r="2"><c r="A2" t="inlineStr"><is><t>Inline</t></is></c>'
+        '<c r="B2" t="b"><v>1</v></c><c r="C2" t="b"><v>0</v></c>'
+        '<c r="D2"><v>42.5</v></c></row>'
+        '<row r="3"><c r="A3"><v> </v></c></row>'
+        "</sheetData></worksheet>"
+    )
+    second = (
+        f"<worksheet {S}><sheetData>"
+        '<row r="1"><c r="A1" t="str"><v>Formula result</v></c></row>'
+        "</sheetData></worksheet>"
+    )
+    empty = f"<worksheet {S}><sheetData/></worksheet>"
+    return make_zip(
+        {
+            "xl/workbook.xml": workbook,
+            "xl/_rels/workbook.xml.rels": relationships(
+                ("rId1", "worksheets/sheet1.xml"),
+                ("rId2", "worksheets/sheet2.xml"),
+                ("rId3", "/xl/worksheets/sheet3.xml"),
+            ),
+            "xl/sharedStrings.xml": shared,
+            "xl/worksheets/sheet1.xml": first,
+            "xl/worksheets/sheet2.xml": second,
+            "xl/worksheets/sheet3.xml": empty,
+        }
+    )
+
+
+def slide(*paragraphs):
+    body = "".join(f"<a:p><a:r><a:t>{text}</a:t></a:r></a:p>" for text in paragraphs)
+    return (
+        f"<p:sld {P} {A}><p:cSld><p:spTree><p:sp><p:txBody>{body}"
+        "</p:txBody></p:sp></p:spTree></p:cSld></p:sld>"
+    )
+
+
+def make_pptx():
+    presentation = (
+        f"<p:presentation {P} {R}><p:sldIdLst>"
+        '<p:sldId id="256" r:id="rId2"/>'
+        '<p:sldId id="257" r:id="rId1"/>'
+        "</p:sldIdLst></p:presentation>"
+    )
+    notes = (
+        f"<p:notes {P} {A}><p:cSld><p:spTree><p:sp><p:txBody>"
+        "<a:p><a:r><a:t>Speak</a:t></a:r><a:br/><a:r><a:t>slowly</a:t></a:r></a:p>"
+        "</p:txBody></p:sp></p:spTree></p:cSld></p:notes>"
+    )
+    return make_zip(
+        {
+            "ppt/presentation.xml": presentation,
+            "ppt/_rels/presentation.xml.rels": relationships(
+                ("rId1", "slides/slide1.xml"), ("rId2", "slides/slide2.xml")
+            ),
+            "ppt/slides/slide1.xml": slide("Second slide"),
+            "ppt/slides/slide2.xml": slide("Title", "Bullet"),
+            "ppt/slides/_rels/slide2.xml.rels": relationships(
+                ("rId1", "../notesSlides/notesSlide1.xml")
+            ),
+            "ppt/notesSlides/notesSlide1.xml": notes,
+        }
+    )
+
+
+def test_docx_splits_at_page_breaks_and_flattens_tables():
+    sections = parse_docx_document(make_docx())
+
+    assert sections == [
+        "Introduction\nBefore",
+        "After\nName | Qty\nApples\nLine\ttabbed",
+    ]
+
+
+def test_xlsx_reads_shared_inline_and_boolean_cells_in_sheet_order():
+    pages = parse_xlsx_document(make_xlsx())
+
+    assert pages == [
+        "Sheet: Second\nFormula result",
+        "Sheet: First\nName | Rich text\nInline | TRUE | FALSE | 42.5",
+        "",
+    ]
+
+
+def test_pptx_orders_slides_and_appends_notes():
+    pages = parse_pptx_document(make_pptx())
+
+    assert pages == ["Title\nBullet\nNotes: Speak\nslowly", "Second slide"]
+
+
+def test_parse_office_document_builds_pages_with_offsets():
+    parsed = parse_office_document(make_pptx(), ".pptx")
+
+    assert [page.page_number for page in parsed.pages] == [1, 2]
+    for page in parsed.pages:
+        assert parsed.full_text[page.start_offset : page.end_offset] == page.text
@@ -0,0 +1,57 @@
+from api.agentic import dependencies
+from api.agentic.core.embedding.embedding import TextEmbedder
+from api.agentic.core.embedding.onnx_backend import (
+    onnx_model_dir,
+    quantized_file_name,
+    source_model_name,
+)
+from api.config import get_settings
+
+
+def test_model_names_round_trip():
+    assert source_model_name("org/model-int8") == "org/model"
+    assert source_model_name("org/model") == "org/model"
+    assert onnx_model_dir("org/model", "cache") == onnx_model_dir(
+        "org/model-int8", "cache"
+    )
+
+
+def test_quantized_file_name_selects_the_configured_target(tmp_path):
+    onnx_dir = tmp_path / "onnx"
+    onnx_dir.mkdir()
+    for target in ("arm64", "avx2", "avx512_vnni"):
+        (onnx_dir / f"model_qint8_{target}.onnx").write_bytes(b"")
+
+    assert quantized_file_name(str(tmp_path), "avx2") == "onnx/model_qint8_avx2.onnx"
+    assert (
+        quantized_file_name(str(tmp_path), "avx512_vnni")
+        == "onnx/model_qint8_avx512_vnni.onnx"
+    )
+    assert quantized_file_name(str(tmp_path), "avx512") is None
+
+
+def test_embedding_cache_keys_depend_on_the_onnx_export(monkeypatch):
+    monkeypatch.setattr(TextEmbedder, "_load_model", lambda self: None)
+
+    def cache_key(backend, quantization):
+        embedder = TextEmbedder(
+            "org/model-int8", backend=backend, onnx_quantization=quantization
+        )
+        return embedder._cache_key("text", True)
+
+    assert cache_key("onnx", "avx2") != cache_key("onnx", "avx512_vnni")
+    assert cache_key("model2vec", "avx2") == cache_key("model2vec", "avx512_vnni")
+
+
+def test_text_embedder_model_comes_from_settings(monkeypatch):
+    monkeypatch.setattr(get_settings(), "EMBEDDING_MODEL", "jaeyong2/bge-m3-Thai-int8")
+    monkeypatch.setattr(get_settings(), "EMBEDDING_BACKEND", "")
+    monkeypatch.setattr(dependencies, "TextEmbedder", dict)
+
+    embedder = dependencies.build_text_embedder()
+
+    assert embedder["model_name"] == "jaeyong2/bge-m3-Thai-int8"
+    assert embedder["backend"] == "onnx"
+
+    monkeypatch.setattr(get_settings(), "EMBEDDING_BACKEND", "sentence_transformer")
+    assert dependencies.build_text_embedder()["backend"] == "sentence_transformer"
@@ -0,0 +1,107 @@
+import numpy as np
+import pytest
+
+from api.agentic.core.embedding import query_cache
+from api.agentic.core.embedding.query_cache import (
+    CachedQueryEmbedder,
+    QueryEmbeddingCache,
+    normalize_query,
+)
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def monotonic(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake = FakeClock()
+    monkeypatch.setattr(query_cache.time, "monotonic", fake.monotonic)
+    return fake
+
+
+class FakeEmbedder:
+    model_name = "fake-model"
+
+    def __init__(self):
+        self.calls = []
+
+    def get_embedding(self, text, normalize=True):
+        self.calls.append(text)
+        return np.array([len(text), float(normalize)])
+
+
+def test_normalize_query():
+    assert normalize_query("  what   is\tthis\n ") == "what is this"
+    # NFKC folds full-width characters
+    assert normalize_query("ＡＢＣ") == "ABC"
+
+
+def test_cache_hit_and_miss_counters(clock):
+    cache = QueryEmbeddingCache(max_items=4, ttl_seconds=60)
+
+    assert cache.get("m", True, "q") is None
+    cache.put("m", True, "q", [1.0, 2.0])
+    vector = cache.get("m", True, "q")
+
+    assert vector.dtype == np.float32
+    assert not vector.flags.writeable
+    assert cache.get("m", False, "q") is None
+    assert cache.get("other", True, "q") is None
+    stats = cache.stats()
+    assert (stats["hits"], stats["misses"]) == (1, 3)
+    assert stats["hit_rate"] == 0.25
+
+
+def test_entries_expire_after_ttl(clock):
+    cache = QueryEmbeddingCache(ttl_seconds=60)
+    cache.put("m", True, "q", [1.0])
+
+    clock.now += 59
+    assert cache.get("m", True, "q") is not None
+    clock.now += 2
+    assert cache.get("m", True, "q") is None
+    assert cache.stats()["expired"] == 1
+    assert cache.stats()["items"] == 0
+
+
+def test_zero_ttl_keeps_entries(clock):
+    cache = QueryEmbeddingCache(ttl_seconds=0)
+    cache.put("m", True, "q", [1.0])
+
+    clock.now += 10**6
+
+    assert cache.get("m", True, "q") is not None
+
+
+def test_least_recently_used_entry_is_evicted(clock):
+    cache = QueryEmbeddingCache(max_items=2, ttl_seconds=0)
+    cache.put("m", True, "a", [1.0])
+    cache.put("m", True, "b", [2.0])
+
+    # Touch "a" so "b" becomes the least recently used
+    cache.get("m", True, "a")
+    cache.put("m", True, "c", [3.0])
+
+    assert cache.get("m", True, "b") is None
+    assert cache.get("m", True, "a") is not None
+    assert cache.get("m", True, "c") is not None
+    assert cache.stats()["evictions"] == 1
+
+
+def test_cached_query_embedder_reuses_normalized_queries(clock):
+    embedder = FakeEmbedder()
+    cached = CachedQueryEmbedder(embedder, QueryEmbeddingCache())
+
+    first = cached.get_embedding("hello   world")
+    second = cached.get_embedding(" hello world ")
+    raw = cached.get_embedding("hello world", normalize=False)
+
+    assert embedder.calls == ["hello world", "hello world"]
+    assert np.array_equal(first, second)
+    assert raw.tolist() == [11, 0.0]
+    assert cached.model_name == "fake-model"
@@ -0,0 +1,162 @@
+import json
+import threading
+import time
+
+from api.agentic.core.ingestion.scheduler import FairJobQueue
+from api.message_queue import service
+from api.message_queue.client import QueueClient
+from api.message_queue.service import QueueService
+
+
+class FakeChannel:
+    def __init__(self, deliveries):
+        self.deliveries = list(deliveries)
+        self.on_message = None
+        self.acked = []
+        self.nacked = []
+        self.is_open = True
+
+    def basic_qos(self, prefetch_count):
+        self.prefetch_count = prefetch_count
+
+    def basic_consume(self, queue, on_message_callback):
+        self.on_message = on_message_callback
+
+    def basic_ack(self, delivery_tag):
+        self.acked.append(delivery_tag)
+
+    def basic_nack(self, delivery_tag, requeue):
+        self.nacked.append(delivery_tag)
+
+
+class FakeMethod:
+    def __init__(self, delivery_tag):
+        self.delivery_tag = delivery_tag
+
+
+class FakeConnection:
+    """Delivers one message per call and counts calls made during jobs."""
+
+    def __init__(self, channel, expected_results):
+        self.channel = channel
+        self.expected_results = expected_results
+        self.calls = 0
+
+    def process_data_events(self, time_limit):
+        self.calls += 1
+        if self.channel.deliveries:
+            tag, message = self.channel.deliveries.pop(0)
+            body = json.dumps(message).encode()
+            self.channel.on_message(self.channel, FakeMethod(tag), None, body)
+        elif len(self.channel.acked) + len(self.channel.nacked) >= (
+            self.expected_results
+        ):
+            self.channel.is_open = False
+        else:
+            time.sleep(min(time_limit, 0.01))
+
+
+def make_client(deliveries):
+    client = QueueClient()
+    client._channel = FakeChannel(deliveries)
+    client._connection = FakeConnection(client._channel, len(deliveries))
+    return client
+
+
+def test_consume_buffered_runs_jobs_off_the_connection_thread():
+    client = make_client([(1, {"user_id": "a"}), (2, {"user_id": "b"})])
+    job_threads = []
+    calls_during_job = []
+
+    def callback(message):
+        job_threads.append(threading.current_thread())
+        calls_before = client._connection.calls
+        time.sleep(0.1)
+        calls_during_job.append(client._connection.calls - calls_before)
+
+    client.consume_buffered("jobs", callback, FairJobQueue(), prefetch_count=2)
+
+    assert sorted(client._channel.acked) == [1, 2]
+    assert all(thread is not threading.main_thread() for thread in job_threads)
+    # Connection events (heartbeats) kept being processed while jobs ran
+    assert all(calls > 1 for calls in calls_during_job)
+
+
+def test_consume_buffered_dead_letters_failed_jobs():
+    client = make_client([(1, {"user_id": "a", "fail": True}), (2, {"user_id": "a"})])
+
+    def callback(message):
+        if message.get("fail"):
+            raise RuntimeError("boom")
+
+    client.consume_buffered("jobs", callback, FairJobQueue(), prefetch_count=2)
+
+    assert client._channel.acked == [2]
+    assert client._channel.nacked == [1]
+
+
+class PublishChannel:
+    def __init__(self, published):
+        self.published = published
+        self.is_closed = False
+
+    def exchange_declare(self, **kwargs):
+        pass
+
+    def queue_declare(self, **kwargs):
+        pass
+
+    def queue_bind(self, **kwargs):
+        pass
+
+    def basic_publish(self, exchange, routing_key, body, properties):
+        assert not self.is_closed
+        time.sleep(0.01)
+        assert not self.is_closed
+        self.published.append((self, json.loads(body)))
+
+    def close(self):
+        self.is_closed = True
+
+
+class PublishConnection:
+    def __init__(self, published):
+        self._channel = PublishChannel(published)
+        self.is_closed = False
+
+    def channel(self):
+        return self._channel
+
+    def close(self):
+        self.is_closed = True
+
+
+def test_concurrent_publishes_use_separate_connections(monkeypatch):
+    published = []
+    connections = []
+
+    class PublishClient(QueueClient):
+        def connect(self):
+            self._connection = PublishConnection(published)
+            self._channel = self._connection.channel()
+            connections.append(self._connection)
+
+    monkeypatch.setattr(service, "QueueClient", PublishClient)
+    queue_service = QueueService()
+    start = threading.Barrier(8)
+
+    def publish(index):
+        start.wait()
+        queue_service.publish_ingestion_job({"document_id": str(index)})
+
+    threads = [threading.Thread(target=publish, args=(i,)) for i in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert sorted(job["document_id"] for _, job in published) == [
+        str(i) for i in range(8)
+    ]
+    assert len({id(channel) for channel, _ in published}) == 8
+    assert all(connection.is_closed for connection in connections)
@@ -0,0 +1,55 @@
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from api.agentic import worker
+from api.agentic.schemas import IngestionJob
+from api.agentic.worker import IngestionWorker
+
+
+class FakeQuery:
+    def filter(self, *args):
+        return self
+
+    def first(self):
+        return None
+
+
+class FakeSession:
+    closed = False
+
+    def query(self, model):
+        return FakeQuery()
+
+    def close(self):
+        self.closed = True
+
+
+class FakeDocumentService:
+    def __init__(self):
+        self.failed = []
+
+    def get_document(self, document_id):
+        return SimpleNamespace(id=document_id)
+
+    def fail_document(self, document_id):
+        self.failed.append(document_id)
+
+
+def test_missing_user_marks_document_failed(monkeypatch):
+    session = FakeSession()
+    service = FakeDocumentService()
+    monkeypatch.setattr(worker, "SessionLocal", lambda: session)
+    monkeypatch.setattr(worker, "DocumentService", lambda db: service)
+    job = IngestionJob(
+        document_id="doc-1",
+        collection_id="col-1",
+        user_id="gone",
+    )
+
+    with pytest.raises(RuntimeError, match="User gone not found"):
+        asyncio.run(IngestionWorker.__new__(IngestionWorker).process_job(job))
+
+    assert service.failed == ["doc-1"]
+    assert session.closed